@@ -0,0 +1,76 @@
+import asyncio
+from typing import List, Optional
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+
+from pydantic_resolve import Resolver, Loader
+from pydantic_resolve.utils.batching import BatchWindow
+
+# ============================================================================
+# Test Data and Loaders
+# ============================================================================
+
+class UserLoader(DataLoader):
+    async def batch_load_fn(self, keys: List[int]):
+        await asyncio.sleep(0.001)  # 模拟数据库查询
+        return [{'id': k, 'name': f'User {k}'} for k in keys]
+
+USER_LOADER_PATH = f'{UserLoader.__module__}.{UserLoader.__qualname__}'
+
+class User(BaseModel):
+    id: int
+    name: str
+
+class Node(BaseModel):
+    """不规则的树：每个分支的深度和到达 UserLoader 的时机都不同"""
+    id: int
+    level: int
+
+    children: List['Node'] = []
+    async def resolve_children(self) -> List['Node']:
+        if self.level >= 5 or (self.level > 0 and self.id % 3 == 0):  # 深度不一
+            return []
+        await asyncio.sleep(0.001 * (self.id % 5))  # 不同分支耗时不同
+        return [Node(id=self.id * 3 + i + 1, level=self.level + 1) for i in range(3)]
+
+    owner: Optional[User] = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.id)
+
+Node.model_rebuild()
+
+def _roots():
+    return [Node(id=i, level=0) for i in range(10)]
+
+def _resolve(batch_window: Optional[BatchWindow]):
+    loader_params = {UserLoader: {'batch_window': batch_window}} if batch_window else None
+    resolver = Resolver(loader_params=loader_params)
+    asyncio.run(resolver.resolve(_roots()))
+    return resolver.stats.loaders[USER_LOADER_PATH]
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+def test_batch_window_tick(benchmark):
+    stats = benchmark(_resolve, None)
+    benchmark.extra_info['batches'] = stats.batches
+    benchmark.extra_info['avg_keys'] = stats.avg_keys
+
+def test_batch_window_delay(benchmark):
+    stats = benchmark(_resolve, BatchWindow(delay_us=5000))
+    benchmark.extra_info['batches'] = stats.batches
+    benchmark.extra_info['avg_keys'] = stats.avg_keys
+
+def test_batch_window_delay_with_max_keys(benchmark):
+    stats = benchmark(_resolve, BatchWindow(delay_us=5000, max_keys=100))
+    benchmark.extra_info['batches'] = stats.batches
+    benchmark.extra_info['avg_keys'] = stats.avg_keys
+
+def test_batch_window_reduces_batches():
+    tick = _resolve(None)
+    delayed = _resolve(BatchWindow(delay_us=5000))
+
+    print(f'\ntick:  {tick}\ndelay: {delayed}')
+    assert delayed.loads == tick.loads
+    assert delayed.batches < tick.batches
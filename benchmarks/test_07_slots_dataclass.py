@@ -0,0 +1,93 @@
+import asyncio
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+
+from pydantic_resolve import Resolver, Loader
+
+# ============================================================================
+# Test Data and Loaders
+# ============================================================================
+
+N_PARENTS = 1000
+N_CHILDREN = 100  # 100k child nodes
+
+
+class ItemLoader(DataLoader):
+    async def batch_load_fn(self, keys: List[int]):
+        return [[{'id': k * N_CHILDREN + i, 'name': f'item {i}', 'price': float(i)} for i in range(N_CHILDREN)]
+                for k in keys]
+
+
+class ItemModel(BaseModel):
+    id: int
+    name: str
+    price: float
+
+
+class ParentModel(BaseModel):
+    id: int
+
+    items: List[ItemModel] = []
+    def resolve_items(self, loader=Loader(ItemLoader)):
+        return loader.load(self.id)
+
+    total: float = 0.0
+    def post_total(self):
+        return sum(i.price for i in self.items)
+
+
+@dataclass(slots=True)
+class ItemSlots:
+    id: int
+    name: str
+    price: float
+
+
+@dataclass(slots=True)
+class ParentSlots:
+    id: int
+
+    items: List[ItemSlots] = field(default_factory=list)
+    def resolve_items(self, loader=Loader(ItemLoader)):
+        return loader.load(self.id)
+
+    total: float = 0.0
+    def post_total(self):
+        return sum(i.price for i in self.items)
+
+
+def _resolve(parent_kls):
+    return asyncio.run(Resolver().resolve([parent_kls(id=i) for i in range(N_PARENTS)]))
+
+
+def _bytes_per_node(parent_kls) -> float:
+    """memory held by the resolved tree, divided by number of nodes"""
+    _resolve(parent_kls)  # warm up metadata and type adapters
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tree = _resolve(parent_kls)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(tree) == N_PARENTS
+    return (after - before) / (N_PARENTS * (N_CHILDREN + 1))
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+@pytest.mark.parametrize('parent_kls', [ParentModel, ParentSlots], ids=['basemodel', 'slots_dataclass'])
+def test_memory_per_node(benchmark, parent_kls):
+    benchmark.extra_info['bytes_per_node'] = round(_bytes_per_node(parent_kls), 1)
+    benchmark.pedantic(_resolve, args=(parent_kls,), rounds=3)
+
+
+def test_slots_dataclass_uses_less_memory():
+    model, slots = _bytes_per_node(ParentModel), _bytes_per_node(ParentSlots)
+    print(f'\nbytes per node, BaseModel: {model:.1f}, slots dataclass: {slots:.1f}')
+    assert slots < model
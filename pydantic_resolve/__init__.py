@@ -3,7 +3,10 @@ from pydantic_resolve.utils.logger import setup_library_logger
 from pydantic_resolve.utils.collector import Collector, ICollector, SendTo
 from pydantic_resolve.utils.class_util import ensure_subset
 from pydantic_resolve.utils.dataloader import build_list, build_object, copy_dataloader_kls
-from pydantic_resolve.utils.conversion import mapper
+from pydantic_resolve.utils.conversion import mapper, dump_json
+from pydantic_resolve.utils.recursion import recursive
+from pydantic_resolve.utils.executor import cpu_bound, blocking
+from pydantic_resolve.utils.lazy import lazy
 from pydantic_resolve.exceptions import (
     ResolverTargetAttrNotFound,
     LoaderFieldNotProvidedError,
@@ -12,6 +15,7 @@ from pydantic_resolve.exceptions import (
     MissingCollector,
     LoaderContextNotProvidedError)
 from pydantic_resolve.resolver import Resolver
+from pydantic_resolve.session import ResolverSession
 from pydantic_resolve.utils.depend import Loader
 from pydantic_resolve.utils.subset import DefineSubset, SubsetConfig
 from pydantic_resolve.utils.openapi import (
@@ -37,6 +41,7 @@ setup_library_logger()
 
 __all__ = [
     'Resolver',
+    'ResolverSession',
     'Loader',
     'Collector',
     'ICollector',
@@ -55,6 +60,11 @@ __all__ = [
     'build_list',
     'build_object',
     'mapper',
+    'dump_json',
+    'recursive',
+    'cpu_bound',
+    'blocking',
+    'lazy',
     'serialization',
     'copy_dataloader_kls',
 
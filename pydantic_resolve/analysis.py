@@ -1,12 +1,11 @@
-import copy
 import inspect
-from typing import TypedDict
+from typing import Any, TypedDict
 from inspect import isfunction, isclass
 from collections import defaultdict
 from pydantic import BaseModel
 import pydantic_resolve.constant as const
 import pydantic_resolve.utils.class_util as class_util
-from pydantic_resolve.utils.types import get_class_field_annotations
+from pydantic_resolve.utils.types import get_class_field_annotations, get_core_types, get_type, get_model_fields, is_slots_dataclass
 from pydantic_resolve.utils.collector import ICollector, pre_generate_collector_config
 from pydantic_resolve.utils.depend import Depends
 from pydantic_resolve.utils.er_diagram import ErLoaderPreGenerator
@@ -185,6 +184,16 @@ class KlsMetaType(TypedDict):
     # This is set when descendant nodes require any pydantic-resolve related operations, it's ancestors should traverse to it.
     should_traverse: bool
 
+    # Whether the work of this class and of every class reachable through its object_fields is sync only:
+    # no resolve_ methods, post_ methods and post_default_handler are plain functions without dataloaders.
+    # Such subtrees can be walked by a plain recursive function, without event loop round trips.
+    sync_subtree: bool
+
+    # Resolve fields whose value is not traversed: no class allowed by the field
+    # annotation has work in its subtree, e.g. a big list of plain value objects.
+    # Decided once after scan, see Analytic._mark_resolve_traversal
+    resolve_fields_without_traversal: list[str]
+
 class LoaderQueryMeta(TypedDict):
     required_types: list
     fields: list[str]
@@ -224,7 +233,7 @@ class MappedMetaMemberType(KlsMetaType):
     #
     # Usage flow:
     #   1. Created during analysis phase by _calc_alias_map_from_collectors()
-    #   2. Deep-copied during resolution by generate_alias_map_with_cloned_collector()
+    #   2. Cloned (ICollector.clone) during resolution, lazily, see utils.collector.CollectorSlot
     #   3. Used to collect data from child nodes and pass to parent post_ methods
     alias_map_proto: dict[str, dict[tuple[str, str, str], object]]
 
@@ -267,16 +276,44 @@ def _get_all_fields_and_object_fields(kls: type) -> tuple:
         - object_field_pairs: dict mapping field names to types
 
     Raises:
-        TypeError: if kls is not a Pydantic BaseModel
+        TypeError: if kls is not a Pydantic BaseModel or slots dataclass
     """
-    if class_util.safe_issubclass(kls, BaseModel):
+    if is_acceptable_kls(kls):
         all_fields = set(class_util.get_pydantic_field_keys(kls))
         object_fields = list(class_util.get_pydantic_fields(kls))
     else:
-        raise TypeError('invalid type: should be pydantic object')
+        raise TypeError('invalid type: should be pydantic object or slots dataclass')
     return all_fields, object_fields, {k: v for k, v in object_fields}
 
 
+def _is_sync_only(info: KlsMetaType) -> bool:
+    """Check if the class's own work can be executed without awaiting.
+
+    Args:
+        info: Metadata for a Pydantic model class
+
+    Returns:
+        True if the class has no resolve_ methods, and all post_ methods
+        (including post_default_handler) are plain functions without dataloaders,
+        which do not run in executor (@cpu_bound)
+    """
+    if info['resolve']:
+        return False
+
+    kls = info['kls']
+    for field in info['post']:
+        method = getattr(kls, field)
+        if inspect.iscoroutinefunction(method) or info['post_params'][field]['dataloaders']:
+            return False
+        if getattr(method, const.CPU_BOUND_CONFIGURATION, None) is not None:
+            return False
+
+    if info['post_default_handler_params'] is not None:
+        if inspect.iscoroutinefunction(getattr(kls, const.POST_DEFAULT_HANDLER)):
+            return False
+    return True
+
+
 def _has_post_default_handler(kls: type) -> bool:
     """Check if a class has a post_default_handler method.
 
@@ -507,6 +544,8 @@ class Analytic:
         self.collect_set = set()
         self.metadata: MetaType = {}
         self.er_pre_generator = er_pre_generator
+        # kls_name -> {field: [kls_name of field types]}, used to mark sync subtrees
+        self.object_field_types: dict[str, dict[str, list[str]]] = {}
 
     def _validate_expose(self, expose_dict: dict, kls_name: str):
         if not isinstance(expose_dict, dict):
@@ -668,7 +707,9 @@ class Analytic:
             'collect_dict': field_ctx['collect_dict'],
             'kls': kls,
             'has_context': method_ctx['has_context'],
-            'should_traverse': False
+            'should_traverse': False,
+            'sync_subtree': False,
+            'resolve_fields_without_traversal': [],
         }
         self.metadata[kls_name] = metadata
         return metadata
@@ -679,6 +720,10 @@ class Analytic:
         object_fields_without_resolver = field_ctx['object_fields_without_resolver']
         fields_with_resolver = field_ctx['fields_with_resolver']
 
+        self.object_field_types[kls_name] = {
+            field: [class_util.get_kls_full_name(t) for t in shelled_types]
+            for field, shelled_types in object_fields}
+
         # Visit fields (pydantic class) without resolve method
         for field, shelled_types in (obj for obj in object_fields if obj[0] in object_fields_without_resolver):
             for shelled_type in shelled_types:
@@ -719,12 +764,57 @@ class Analytic:
         # Mark for traversal if needed
         self._mark_for_traversal_if_needed(metadata, kls_name, ancestors)
 
+    def _mark_sync_subtree(self) -> None:
+        """
+        mark classes whose own work and whole subtree are sync only.
+
+        start from classes which are sync only by themselves, then keep unmarking
+        classes which have a not-sync child, until stable (handles self-reference).
+        """
+        for info in self.metadata.values():
+            info['sync_subtree'] = _is_sync_only(info)
+
+        changed = True
+        while changed:
+            changed = False
+            for kls_name, info in self.metadata.items():
+                if not info['sync_subtree']:
+                    continue
+                field_types = self.object_field_types.get(kls_name, {})
+                for field in info['object_fields']:
+                    if any(not self.metadata[t]['sync_subtree'] for t in field_types.get(field, [])):
+                        info['sync_subtree'] = False
+                        changed = True
+                        break
+
+    def _mark_resolve_traversal(self) -> None:
+        """
+        decide once per resolve field whether its value is traversed.
+
+        skip it when none of the classes allowed by the field annotation has work
+        in its subtree, e.g. a big list of plain value objects. annotations which
+        allow anything (Any, object, TypeVar...) are traversed.
+        """
+        for kls_name, info in self.metadata.items():
+            kls = info['kls']
+            field_types = self.object_field_types.get(kls_name, {})
+            skipped = []
+            for params in info['resolve_params'].values():
+                field = params['trim_field']
+                core_types = get_core_types(get_type(get_model_fields(kls)[field]))
+                if any(t is Any or t is object or not isclass(t) for t in core_types):
+                    continue
+                if not any(self.metadata[name]['should_traverse'] for name in field_types.get(field, [])):
+                    skipped.append(field)
+            info['resolve_fields_without_traversal'] = skipped
+
     def scan(self, root_class: type) -> MetaType:
         """Public method to perform metadata scan and return the metadata map."""
         # reset state for each scan
         self.expose_set = set()
         self.collect_set = set()
         self.metadata = {}
+        self.object_field_types = {}
 
         core_types = class_util.get_core_types(root_class)
 
@@ -734,6 +824,8 @@ class Analytic:
         for ct in core_types:
             self._walker(ct, [])
 
+        self._mark_sync_subtree()
+        self._mark_resolve_traversal()
         return self.metadata
 
 
@@ -789,11 +881,11 @@ def _calc_alias_map_from_collectors(kls_meta: MappedMetaMemberType) -> dict:
 
 
 def is_acceptable_kls(kls: type) -> bool:
-    return class_util.safe_issubclass(kls, BaseModel)
+    return class_util.safe_issubclass(kls, BaseModel) or is_slots_dataclass(kls)
 
 
 def is_acceptable_instance(target: object):
-    return isinstance(target, BaseModel)
+    return isinstance(target, BaseModel) or is_slots_dataclass(target.__class__)
 
 
 def get_resolve_fields_and_object_fields_from_object(node: object, kls: type, mapped_metadata: MappedMetaType):
@@ -853,7 +945,7 @@ def get_collector_sign(kls_path: str, collector: CollectorType) -> tuple:
 def generate_alias_map_with_cloned_collector(kls: type, mapped_metadata: MappedMetaType):
     kls_meta = mapped_metadata.get(kls, {})
     return { alias: {
-        sign: copy.deepcopy(collector) for sign, collector in v.items()
+        sign: collector.clone() for sign, collector in v.items()
     } for alias, v in kls_meta['alias_map_proto'].items()}
 
 
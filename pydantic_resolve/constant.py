@@ -1,9 +1,40 @@
 RESOLVE_PREFIX = 'resolve_'
 POST_PREFIX = 'post_'
 PYDANTIC_FORWARD_REF_UPDATED = '__pydantic_resolve_forward_refs_updated__'
+# FieldInfo of @dataclass(slots=True) node fields, cached on the class
+DATACLASS_FIELDS = '__pydantic_resolve_dataclass_fields__'
 HAS_MAPPER_FUNCTION = '__pydantic_resolve_mapper_provided__'
+RECURSIVE_CONFIGURATION = '__pydantic_resolve_recursive__'
+CPU_BOUND_CONFIGURATION = '__pydantic_resolve_cpu_bound__'
+BLOCKING_CONFIGURATION = '__pydantic_resolve_blocking__'
+LAZY_CONFIGURATION = '__pydantic_resolve_lazy__'
+# parameter of post_ methods, a function loading lazy fields of the node
+LOAD_FIELD_PARAM = 'load_field'
 POST_DEFAULT_HANDLER = 'post_default_handler'
 
+# Resolver traversal engines
+ENGINE_RECURSIVE = 'recursive'
+ENGINE_LEVEL = 'level'
+
+# DataLoader class attribute / loader_params key of cross-request result cache
+LOADER_RESULT_CACHE = 'result_cache'
+LOADER_RESULT_CACHE_ATTACHED = '__pydantic_resolve_result_cache_attached__'
+
+# DataLoader class attribute / loader_params key of batch scheduling policy
+LOADER_BATCH_WINDOW = 'batch_window'
+LOADER_BATCH_WINDOW_APPLIED = '__pydantic_resolve_batch_window_applied__'
+
+# DataLoader class attribute / loader_params keys of batch size and concurrency limits
+LOADER_MAX_BATCH_SIZE = 'max_batch_size'
+LOADER_MAX_CONCURRENT_BATCHES = 'max_concurrent_batches'
+LOADER_CONCURRENCY_LIMITED = '__pydantic_resolve_concurrency_limited__'
+
+# optional DataLoader method answering a whole recursive subtree, see @recursive
+LOADER_SUBTREE_HOOK = 'batch_load_subtree'
+LOADER_SUBTREE_INSTALLED = '__pydantic_resolve_subtree_installed__'
+LOADER_LEVEL_GATE = '_pydantic_resolve_level_gate'
+LOADER_LEVEL_GATE_INSTALLED = '_pydantic_resolve_level_gate_installed'
+
 EXPOSE_TO_DESCENDANT = '__pydantic_resolve_expose__'
 COLLECTOR_CONFIGURATION = '__pydantic_resolve_collect__'
 
@@ -0,0 +1,121 @@
+"""
+Explicit traversal scope.
+
+Every node visited by the Resolver gets a Frame, linked to the frame of its
+parent node. Resolve/post methods read `parent`, `ancestor_context` and
+collectors from it, instead of from ContextVars which had to be set and reset
+around every node.
+
+    root frame (node=None)
+      └── Frame(node=blog, ancestors={'blog_title': ...})
+            └── Frame(node=post, ancestors=<shared with blog frame>)
+
+Frames are immutable, a frame whose class exposes nothing / declares no
+collector shares the ScopeMap of its parent, so entering a node is O(1).
+"""
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+
+class ScopeMap(Mapping):
+    """
+    Read-only persistent mapping, a layer of values stacked on the layer of
+    the parent scope. Values in the inner layer shadow the outer ones.
+    """
+    __slots__ = ('_values', '_up')
+
+    def __init__(self, values: dict | None = None, up: 'ScopeMap | None' = None):
+        self._values = values or {}
+        self._up = up
+
+    def child(self, values: dict) -> 'ScopeMap':
+        """return a new scope with `values` on top, self is left untouched"""
+        if not values:
+            return self
+        return ScopeMap(values, self)
+
+    def __getitem__(self, key) -> Any:
+        scope = self
+        while scope is not None:
+            values = scope._values
+            if key in values:
+                return values[key]
+            scope = scope._up
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        scope = self
+        while scope is not None:
+            if key in scope._values:
+                return True
+            scope = scope._up
+        return False
+
+    def __iter__(self) -> Iterator:
+        seen = set()
+        scope = self
+        while scope is not None:
+            for key in scope._values:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+            scope = scope._up
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f'ScopeMap({dict(self)!r})'
+
+
+EMPTY_SCOPE = ScopeMap()
+
+
+class Frame:
+    """
+    scope of one node during traversal
+
+    node:       the node itself
+    plan:       KlsPlan of node
+    up:         frame of parent node, `up.node` is what `parent` param receives
+    ancestors:  exposed ancestor values (ancestor_context), includes node's own exposes
+    collectors: {alias: {signature: collector}} visible to node's descendants
+    alias_map:  collectors declared by node itself, for its own post methods
+    """
+    __slots__ = ('node', 'plan', 'up', 'ancestors', 'collectors', 'alias_map')
+
+    def __init__(self, node, plan, up: 'Frame | None', ancestors: ScopeMap, collectors: ScopeMap, alias_map: dict | None):
+        self.node = node
+        self.plan = plan
+        self.up = up
+        self.ancestors = ancestors
+        self.collectors = collectors
+        self.alias_map = alias_map
+
+    @property
+    def parent(self):
+        return self.up.node if self.up is not None else None
+
+    def recursion_depth(self) -> int:
+        """number of ancestors of the same class, 0 for the outermost one"""
+        depth = 0
+        plan = self.plan
+        frame = self.up
+        while frame is not None:
+            if frame.plan is plan:
+                depth += 1
+            frame = frame.up
+        return depth
+
+    def path(self) -> list[str]:
+        """class names from root to node, used by debug profile"""
+        names = []
+        frame = self
+        while frame is not None and frame.node is not None:
+            names.append(frame.node.__class__.__name__)
+            frame = frame.up
+        names.reverse()
+        return names
+
+
+ROOT_FRAME = Frame(None, None, None, EMPTY_SCOPE, EMPTY_SCOPE, None)
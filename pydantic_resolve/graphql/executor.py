@@ -17,10 +17,12 @@ from enum import Enum
 from typing import Any, Callable, Optional
 
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 import pydantic_resolve.constant as const
 from pydantic_resolve.resolver import Resolver
 from pydantic_resolve.utils.class_util import safe_issubclass
+from pydantic_resolve.utils.conversion import dump_json
 from pydantic_resolve.utils.types import get_core_types
 from pydantic_resolve.graphql.exceptions import GraphQLError
 from pydantic_resolve.graphql.query_parser import QueryParser
@@ -29,6 +31,26 @@ from pydantic_resolve.graphql.response_builder import ResponseBuilder
 logger = logging.getLogger(__name__)
 
 
+def encode_response(response: dict[str, Any]) -> bytes:
+    """
+    Encode a GraphQL response to JSON bytes.
+
+    Values of ``response["data"]`` may already be JSON bytes (``encode_json=True``),
+    they are spliced in as is instead of being decoded and encoded again.
+    """
+    parts = []
+    for key, value in response.items():
+        if key == "data" and isinstance(value, dict):
+            encoded = b'{' + b','.join(
+                to_json(name) + b':' + (item if isinstance(item, bytes) else to_json(item))
+                for name, item in value.items()
+            ) + b'}'
+        else:
+            encoded = to_json(value)
+        parts.append(to_json(key) + b':' + encoded)
+    return b'{' + b','.join(parts) + b'}'
+
+
 class QueryExecutor:
     """
     Handles GraphQL query and mutation execution.
@@ -68,11 +90,15 @@ class QueryExecutor:
         query: str,
         query_map: dict[str, tuple[type, Callable]],
         context: Optional[dict[str, Any]] = None,
+        encode_json: bool = False,
     ) -> dict[str, Any]:
         """
         Execute custom query with optimized two-phase execution:
         - Phase 1 (Serial): Parse query, build response models (no I/O)
         - Phase 2 (Concurrent): Parallel execution of (query_method + transform + resolve)
+
+        With encode_json=True, values of "data" are JSON bytes serialized by pydantic-core,
+        see ``encode_response``.
         """
         logger.info("Starting custom query execution with concurrent optimization")
 
@@ -134,7 +160,8 @@ class QueryExecutor:
 
         if execution_tasks:
             # Execute all (query_method + transform + resolve) concurrently
-            execution_map = await self._execute_concurrent_queries(execution_tasks, context=context)
+            execution_map = await self._execute_concurrent_queries(
+                execution_tasks, context=context, encode_json=encode_json)
 
             # Collect results and errors
             for query_name, (result_data, error_dict) in execution_map.items():
@@ -159,11 +186,14 @@ class QueryExecutor:
         query: str,
         mutation_map: dict[str, tuple[type, Callable]],
         context: Optional[dict[str, Any]] = None,
+        encode_json: bool = False,
     ) -> dict[str, Any]:
         """
         Execute custom mutation with two-phase execution:
         - Phase 1 (Serial): Mutation method execution, model building, data transformation
         - Phase 2 (Serial): Execute Resolver to resolve related data (each mutation executed sequentially)
+
+        With encode_json=True, values of "data" are JSON bytes, same as execute_query.
         """
         logger.info("Starting custom mutation execution")
 
@@ -239,15 +269,12 @@ class QueryExecutor:
 
                     if isinstance(typed_data, list):
                         resolved = await resolver.resolve(typed_data)
-                        data[root_mutation_name] = [
-                            r.model_dump(mode='json', by_alias=False)
-                            for r in resolved
-                        ] if resolved else []
+                        data[root_mutation_name] = self._dump_result(
+                            resolved, response_model, encode_json) if resolved else []
                     else:
                         resolved = await resolver.resolve(typed_data)
-                        data[root_mutation_name] = (
-                            resolved.model_dump(mode='json', by_alias=False)
-                        ) if resolved else None
+                        data[root_mutation_name] = self._dump_result(
+                            resolved, response_model, encode_json) if resolved else None
                 else:
                     data[root_mutation_name] = None
 
@@ -272,6 +299,20 @@ class QueryExecutor:
 
         return response
 
+    def _dump_result(self, result: Any, response_model: type, encode_json: bool) -> Any:
+        """
+        Serialize a resolved model (or list of models) for the response.
+
+        encode_json=True dumps straight to JSON bytes with pydantic-core,
+        skipping the intermediate dict. Field(exclude=True) fields, such as
+        FK and pagination helpers, are left out in both ways.
+        """
+        if encode_json:
+            return dump_json(result, response_model, by_alias=False)
+        if isinstance(result, list):
+            return [r.model_dump(mode='json', by_alias=False) for r in result]
+        return result.model_dump(mode='json', by_alias=False)
+
     async def _execute_method(
         self,
         method: Callable,
@@ -470,12 +511,14 @@ class QueryExecutor:
         self,
         execution_tasks: list[tuple[str, type, Callable, Any, type]],
         context: Optional[dict[str, Any]] = None,
+        encode_json: bool = False,
     ) -> dict[str, tuple[Optional[Any], Optional[dict]]]:
         """
         Execute multiple queries concurrently (query_method + transform + resolve).
 
         Args:
             execution_tasks: List of (query_name, entity, query_method, field_selection, response_model) tuples
+            encode_json: Serialize results to JSON bytes instead of dicts
 
         Returns:
             Dict mapping query_name to (result_data, error_dict)
@@ -503,11 +546,13 @@ class QueryExecutor:
             if semaphore:
                 async with semaphore:
                     return await self._execute_single_query(
-                        query_name, entity, query_method, field_selection, response_model, context=context
+                        query_name, entity, query_method, field_selection, response_model,
+                        context=context, encode_json=encode_json
                     )
             else:
                 return await self._execute_single_query(
-                    query_name, entity, query_method, field_selection, response_model, context=context
+                    query_name, entity, query_method, field_selection, response_model,
+                    context=context, encode_json=encode_json
                 )
 
         # Execute all (query_method + transform + resolve) tasks concurrently
@@ -542,6 +587,7 @@ class QueryExecutor:
         field_selection: Any,
         response_model: type,
         context: Optional[dict[str, Any]] = None,
+        encode_json: bool = False,
     ) -> tuple[Optional[Any], Optional[dict]]:
         """
         Execute a single query: query_method -> transform -> resolve.
@@ -554,6 +600,7 @@ class QueryExecutor:
             query_method: @query decorated method
             field_selection: Parsed field selection with arguments
             response_model: Pre-built response model class
+            encode_json: Serialize result to JSON bytes instead of dicts
 
         Returns:
             Tuple of (result_data, error_dict)
@@ -612,16 +659,13 @@ class QueryExecutor:
                 if is_list:
                     result = await resolver.resolve(typed_data)
                     if result is not None:
-                        result_data = [
-                            r.model_dump(mode='json', by_alias=False)
-                            for r in result
-                        ]
+                        result_data = self._dump_result(result, response_model, encode_json)
                     else:
                         result_data = []
                 else:
                     result = await resolver.resolve(typed_data)
                     if result is not None:
-                        result_data = result.model_dump(mode='json', by_alias=False)
+                        result_data = self._dump_result(result, response_model, encode_json)
                     else:
                         result_data = None
             else:
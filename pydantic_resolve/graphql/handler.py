@@ -13,7 +13,7 @@ from pydantic_resolve.utils.er_diagram import ErDiagram, Relationship
 from pydantic_resolve.utils.resolver_configurator import config_resolver
 from pydantic_resolve.utils.types import _is_optional, _is_list
 from pydantic_resolve.graphql.exceptions import GraphQLError
-from pydantic_resolve.graphql.executor import QueryExecutor
+from pydantic_resolve.graphql.executor import QueryExecutor, encode_response
 from pydantic_resolve.graphql.introspection import IntrospectionHelper
 from pydantic_resolve.graphql.query_parser import QueryParser
 from pydantic_resolve.graphql.response_builder import ResponseBuilder
@@ -235,6 +235,35 @@ class GraphQLHandler:
         Returns:
             GraphQL response format: {"data": {...}, "errors": [...]}
         """
+        return await self._execute(query, context, encode_json=False)
+
+    async def execute_to_json(
+        self,
+        query: str,
+        context: Optional[dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Execute a GraphQL query or mutation, return the response as JSON bytes.
+
+        Resolved results are serialized by pydantic-core straight to bytes,
+        without the intermediate dicts of ``execute``. Return them as is, e.g.
+        ``Response(content=..., media_type="application/json")`` in FastAPI.
+
+        Args:
+            query: GraphQL query string
+            context: Same as ``execute``
+
+        Returns:
+            Encoded GraphQL response: b'{"data": {...}, "errors": [...]}'
+        """
+        return encode_response(await self._execute(query, context, encode_json=True))
+
+    async def _execute(
+        self,
+        query: str,
+        context: Optional[dict[str, Any]],
+        encode_json: bool,
+    ) -> dict[str, Any]:
         logger.debug(f"Executing GraphQL: {query[:100]}...")
         try:
             # Check for introspection query
@@ -247,10 +276,12 @@ class GraphQLHandler:
 
             if operation_type == 'mutation':
                 logger.debug("Processing mutation")
-                return await self.executor.execute_mutation(query, self.mutation_map, context=context)
+                return await self.executor.execute_mutation(
+                    query, self.mutation_map, context=context, encode_json=encode_json)
             else:
                 logger.debug("Processing query")
-                return await self.executor.execute_query(query, self.query_map, context=context)
+                return await self.executor.execute_query(
+                    query, self.query_map, context=context, encode_json=encode_json)
 
         except GraphQLError as e:
             logger.warning(f"GraphQL error: {e.message}")
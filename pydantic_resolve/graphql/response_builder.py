@@ -789,12 +789,10 @@ class ResponseBuilder:
         Args:
             model: The dynamically built response model to analyze
         """
-        from pydantic_resolve.resolver import _get_metadata_from_cache, _set_metadata_to_cache
-
-        resolver_class_id = id(self.resolver_class)
+        from pydantic_resolve.resolver import METADATA_CACHE, _set_metadata_to_cache
 
         # Skip if already cached (e.g., nested model already analyzed)
-        if _get_metadata_from_cache(resolver_class_id, model) is not None:
+        if METADATA_CACHE.contains(self.resolver_class, model):
             return
 
         # Get er_pre_generator from resolver_class
@@ -806,7 +804,7 @@ class ResponseBuilder:
         )
 
         # Cache the result
-        _set_metadata_to_cache(resolver_class_id, model, metadata)
+        _set_metadata_to_cache(self.resolver_class, model, metadata)
 
     def _attach_paged_resolve_methods(self, model: type[BaseModel], pending_fields: list) -> None:
         """Attach resolve methods for paginated fields.
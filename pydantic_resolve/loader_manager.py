@@ -1,19 +1,44 @@
+import asyncio
 from inspect import isclass
 from typing import Any, Generator
 
 import pydantic_resolve.utils.class_util as class_util
 import pydantic_resolve.utils.params as params_util
-from pydantic_resolve.analysis import LoaderQueryMeta, MappedMetaType
+import pydantic_resolve.utils.loader_cache as loader_cache_util
+import pydantic_resolve.utils.batching as batching_util
+import pydantic_resolve.constant as const
+from pydantic_resolve.analysis import LoaderQueryMeta, MappedMetaType, is_acceptable_kls
 from pydantic_resolve.exceptions import LoaderFieldNotProvidedError, LoaderContextNotProvidedError
 
 from aiodataloader import DataLoader
-from pydantic import BaseModel
 
 
 # Type definitions
 LoaderType = dict[str, Any]
 
 
+class LoaderStore:
+    """
+    loader instances and request type keys kept across several resolve calls (see ResolverSession).
+
+    instances: {path: {key: DataLoader}}, key is () or type_key in split mode
+    type_keys: {path: {type_key, ...}}, accumulated, so _query_meta covers every call
+    semaphores: {path: semaphore} of loaders with max_concurrent_batches
+    """
+    def __init__(self):
+        self.instances: dict[str, dict[tuple[type, ...], DataLoader]] = {}
+        self.type_keys: dict[str, set[tuple[type, ...]]] = {}
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def clear(self) -> None:
+        for inner in self.instances.values():
+            for instance in inner.values():
+                instance.clear_all()
+        self.instances = {}
+        self.type_keys = {}
+        self.semaphores = {}
+
+
 def _validate_loader_context_requirements(
     metadata: MappedMetaType,
     has_resolver_context: bool
@@ -60,7 +85,8 @@ def _create_loader_instance(
     loader: LoaderType,
     loader_params: dict,
     global_loader_param: dict,
-    context: dict | None = None
+    context: dict | None = None,
+    semaphores: dict[str, asyncio.Semaphore] | None = None
 ) -> DataLoader:
     """
     Create a loader instance.
@@ -68,7 +94,10 @@ def _create_loader_instance(
     1. is class?
         - validate params
         - set context if required
+        - apply batch limits, result cache and batch window
     2. is func
+
+    semaphores are shared by instances of the same path (split_loader_by_type)
     """
     loader_kls = loader['kls']
     path = loader['path']
@@ -97,21 +126,56 @@ def _create_loader_instance(
         if loader.get('requires_context', False) and context is not None:
             setattr(loader_instance, '_context', context)
 
+        # batch size / concurrency limits, from loader_params or class attribute.
+        # oversized batches are split by aiodataloader and dispatched in parallel.
+        max_batch_size = param_config.get(const.LOADER_MAX_BATCH_SIZE, loader_instance.max_batch_size)
+        if max_batch_size is not None:
+            loader_instance.max_batch_size = batching_util.validate_limit(
+                f'{path}.{const.LOADER_MAX_BATCH_SIZE}', max_batch_size)
+
+        max_concurrent_batches = param_config.get(
+            const.LOADER_MAX_CONCURRENT_BATCHES,
+            getattr(loader_instance, const.LOADER_MAX_CONCURRENT_BATCHES, None))
+        if max_concurrent_batches is not None:
+            batching_util.validate_limit(f'{path}.{const.LOADER_MAX_CONCURRENT_BATCHES}', max_concurrent_batches)
+            semaphores = semaphores if semaphores is not None else {}
+            if path not in semaphores:
+                semaphores[path] = asyncio.Semaphore(max_concurrent_batches)
+            batching_util.limit_concurrent_batches(loader_instance, semaphores[path])
+
+        # cross-request result cache, from loader_params or class attribute
+        result_cache = param_config.get(
+            const.LOADER_RESULT_CACHE,
+            getattr(loader_instance, const.LOADER_RESULT_CACHE, None))
+        if result_cache is not None:
+            setattr(loader_instance, const.LOADER_RESULT_CACHE, result_cache)
+            loader_cache_util.attach_result_cache(loader_instance, path, result_cache)
+
+        # batch scheduling policy, from loader_params or class attribute
+        batch_window = param_config.get(
+            const.LOADER_BATCH_WINDOW,
+            getattr(loader_instance, const.LOADER_BATCH_WINDOW, None))
+        if batch_window is not None:
+            setattr(loader_instance, const.LOADER_BATCH_WINDOW, batch_window)
+            batching_util.apply_batch_window(loader_instance, batch_window)
+
         return loader_instance
     else:
         return DataLoader(batch_load_fn=loader_kls)  # type:ignore
 
 
 def _get_all_fields(kls: type) -> list[str]:
-    """Get all field keys from a Pydantic model."""
-    if class_util.safe_issubclass(kls, BaseModel):
+    """Get all field keys from a Pydantic model or slots dataclass."""
+    if is_acceptable_kls(kls):
         return list(class_util.get_pydantic_field_keys(kls))
     else:
         raise AttributeError('invalid type: should be pydantic object')  # noqa
 
 
-def _generate_query_meta(types: list[list[type]]) -> LoaderQueryMeta:
-    """Generate query metadata from request types."""
+def _generate_query_meta(
+        types: list[list[type]],
+        query_fields: dict[type, list[str]] | None = None) -> LoaderQueryMeta:
+    """Generate query metadata from request types, query_fields narrows fields of some types."""
     _fields = set()
     meta: LoaderQueryMeta = {
         'fields': [],
@@ -120,20 +184,37 @@ def _generate_query_meta(types: list[list[type]]) -> LoaderQueryMeta:
 
     for tt in types:
         for t in tt:
-            fields = _get_all_fields(t)
+            if query_fields and t in query_fields:
+                fields = list(query_fields[t])
+            else:
+                fields = _get_all_fields(t)
             meta['request_types'].append(dict(name=t, fields=fields))
             _fields.update(fields)
     meta['fields'] = list(_fields)
     return meta
 
 
+def _merge_query_meta(previous: LoaderQueryMeta, meta: LoaderQueryMeta) -> LoaderQueryMeta:
+    """union of two query metas of a shared instance, fields of the same request type are merged"""
+    request_types: dict[type, list[str]] = {}
+    for rt in [*previous['request_types'], *meta['request_types']]:
+        fields = request_types.setdefault(rt['name'], [])
+        fields.extend(f for f in rt['fields'] if f not in fields)
+    return {
+        'fields': list(dict.fromkeys([*previous['fields'], *meta['fields']])),
+        'request_types': [dict(name=name, fields=fields) for name, fields in request_types.items()],
+    }
+
+
 def validate_and_create_loader_instance(
     loader_params: dict,
     global_loader_param: dict,
     loader_instances: dict,
     metadata: MappedMetaType,
     context: dict | None = None,
-    split_loader_by_type: bool = False
+    split_loader_by_type: bool = False,
+    store: LoaderStore | None = None,
+    query_fields: dict[type, list[str]] | None = None
 ) -> dict[str, DataLoader] | dict[str, dict[tuple[type, ...], DataLoader]]:
     """
     Validate and create loader instances.
@@ -195,6 +276,14 @@ def validate_and_create_loader_instance(
           }
 
         Return → flattened to {'mod.TaskLoader': <shared_inst>}
+
+    With `store`, instances created by previous calls are reused, and type_keys of
+    previous calls are kept, so _query_meta of a shared instance covers all of them.
+    _query_meta of a shared instance only widens, when it does, the cache of the
+    instance is cleared, values loaded with fewer fields are fetched again.
+
+    With `query_fields` ({type: fields}, see Resolver(include=, exclude=)), fields of
+    those request types are narrowed to the given ones.
     """
     # Validate context requirements first
     _validate_loader_context_requirements(metadata, context is not None)
@@ -212,11 +301,13 @@ def validate_and_create_loader_instance(
     # Internally always use nested structure {path: {key: DataLoader}}:
     #   split mode:  key = type_key  (one instance per request_type set)
     #   default mode: key = ()       (all entries share the same key → one instance per path)
-    cache: dict[str, dict[tuple[type, ...], DataLoader]] = {}
+    cache: dict[str, dict[tuple[type, ...], DataLoader]] = store.instances if store else {}
     # type_keys collects unique type_key sets per loader path.
     # type_key is a sorted tuple of request types (e.g. (TaskCard,) or (TaskA, TaskB)),
     # used both as cache key in split mode and as type source for _query_meta generation.
-    type_keys: dict[str, set[tuple[type, ...]]] = {}
+    type_keys: dict[str, set[tuple[type, ...]]] = store.type_keys if store else {}
+    # one semaphore per loader path, for max_concurrent_batches
+    semaphores: dict[str, asyncio.Semaphore] = store.semaphores if store else {}
 
     # Phase 1: create instances
     # Iterate all DataLoaderType entries from scanned metadata (resolve_* and post_* methods).
@@ -238,7 +329,8 @@ def validate_and_create_loader_instance(
         if loader_instances.get(loader_kls):
             cache[path][key] = loader_instances[loader_kls]
         else:
-            cache[path][key] = _create_loader_instance(loader, loader_params, global_loader_param, context)
+            cache[path][key] = _create_loader_instance(
+                loader, loader_params, global_loader_param, context, semaphores)
 
     # Phase 2: collect type_keys for _query_meta generation.
     # A set naturally deduplicates — Union alternatives with different order
@@ -266,7 +358,14 @@ def validate_and_create_loader_instance(
             if relevant:
                 # Sort to ensure deterministic _query_meta output order
                 sorted_keys = sorted(relevant, key=lambda tk: tuple(class_util.get_kls_full_name(t) for t in tk))
-                instance._query_meta = _generate_query_meta([list(tk) for tk in sorted_keys])
+                meta = _generate_query_meta([list(tk) for tk in sorted_keys], query_fields)
+                previous = getattr(instance, '_query_meta', None) if store else None
+                if previous:
+                    meta = _merge_query_meta(previous, meta)
+                    if len(meta['fields']) != len(previous['fields']):
+                        # cached values were loaded for fewer fields
+                        instance.clear_all()
+                instance._query_meta = meta
 
     # Flatten for non-split mode: extract the sole () entry from each path's inner dict
     # to produce the flat {path: DataLoader} return type.
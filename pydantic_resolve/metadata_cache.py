@@ -0,0 +1,159 @@
+"""
+Bounded cache of scanned metadata and compiled plans.
+
+    (resolver class, root class) -> (metadata, plans)
+
+- resolver classes are referenced weakly, entries of a collected resolver class
+  (e.g. created by config_resolver) are dropped, and ids can't collide.
+- entries are evicted in LRU order once `maxsize` root classes are cached,
+  dynamic response models created by graphql ResponseBuilder no longer grow it forever.
+- metadata / plan of a class is interned per resolver class: a class reachable
+  from many roots is stored once and shared by all their entries, as long as the
+  scans agree. object_fields, should_traverse, sync_subtree... of a class depend on
+  the root it is scanned from (e.g. classes in a cycle), a different scan gets its
+  own member.
+
+root classes are kept strongly, metadata references them anyway, the LRU bound
+is what releases them.
+"""
+import os
+import weakref
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from pydantic_resolve import plan as plan_util
+
+DEFAULT_MAXSIZE = 1024
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _Member:
+    """interned metadata and plan of one class, shared by entries of one resolver class"""
+    __slots__ = ('kls_meta', 'plan', 'refcount')
+
+    def __init__(self, kls_meta, plan):
+        self.kls_meta = kls_meta
+        self.plan = plan
+        self.refcount = 0
+
+
+class MetadataCache:
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError(f'maxsize should be a positive int, got {maxsize!r}')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[Any, plan_util.PlanType]] = OrderedDict()
+        self._members: dict[weakref.ref, dict[type, list[_Member]]] = {}
+        self._has_dead_ref = False
+
+    def _on_collected(self, _ref):
+        # called by gc, cleanup is deferred to the next access
+        self._has_dead_ref = True
+
+    def _prune_dead_refs(self):
+        self._has_dead_ref = False
+        for key in [k for k in self._entries if k[0]() is None]:
+            del self._entries[key]
+        for ref in [r for r in self._members if r() is None]:
+            del self._members[ref]
+
+    def _key(self, resolver_class: type, root_class) -> tuple:
+        return (weakref.ref(resolver_class), root_class)
+
+    def get(self, resolver_class: type, root_class) -> tuple[Any, plan_util.PlanType] | None:
+        """return (metadata, plans) and mark it as recently used, None if missing"""
+        if self._has_dead_ref:
+            self._prune_dead_refs()
+
+        key = self._key(resolver_class, root_class)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def contains(self, resolver_class: type, root_class) -> bool:
+        """check without touching LRU order and counters"""
+        return self._key(resolver_class, root_class) in self._entries
+
+    def set(self, resolver_class: type, root_class, metadata) -> tuple[Any, plan_util.PlanType]:
+        """
+        store metadata of root class, compile plans of classes not seen before,
+        return the (interned) metadata and plans.
+        """
+        if self._has_dead_ref:
+            self._prune_dead_refs()
+
+        key = (weakref.ref(resolver_class, self._on_collected), root_class)
+        if key in self._entries:
+            self._release(key, self._entries.pop(key))
+
+        members = self._members.setdefault(key[0], {})
+        shared_metadata = {}
+        plans: plan_util.PlanType = {}
+        for kls, kls_meta in metadata.items():
+            candidates = members.setdefault(kls, [])
+            member = next((m for m in candidates if m.kls_meta == kls_meta), None)
+            if member is None:
+                member = _Member(kls_meta, plan_util.compile_plans({kls: kls_meta})[kls])
+                candidates.append(member)
+            member.refcount += 1
+            shared_metadata[kls] = member.kls_meta
+            plans[kls] = member.plan
+
+        entry = (shared_metadata, plans)
+        self._entries[key] = entry
+
+        while len(self._entries) > self.maxsize:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._release(old_key, old_entry)
+            self.evictions += 1
+        return entry
+
+    def _release(self, key: tuple, entry: tuple) -> None:
+        members = self._members.get(key[0])
+        if members is None:
+            return
+        for kls, kls_meta in entry[0].items():
+            candidates = members.get(kls, [])
+            member = next((m for m in candidates if m.kls_meta is kls_meta), None)
+            if member is not None:
+                member.refcount -= 1
+                if member.refcount <= 0:
+                    candidates.remove(member)
+                    if not candidates:
+                        del members[kls]
+        if not members:
+            del self._members[key[0]]
+
+    def root_classes(self, resolver_class: type) -> list:
+        """cached root classes of resolver class, least recently used first"""
+        ref = weakref.ref(resolver_class)
+        return [root for r, root in self._entries if r == ref]
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._members.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_maxsize_from_env() -> int:
+    return int(os.getenv('PYDANTIC_RESOLVE_METADATA_CACHE_SIZE', DEFAULT_MAXSIZE))
@@ -0,0 +1,305 @@
+"""
+Compiled execution plans.
+
+`Analytic.scan` produces a string-keyed metadata dict (MappedMetaType) which is
+convenient to build and inspect, but expensive to consult for every node during
+traversal. This module compiles it once per (resolver class, root class) into
+slotted per-class plan objects, so the Resolver hot loop only has to
+"run plan on node".
+
+    metadata[kls] --compile_plans()--> plans[kls] = KlsPlan(
+        resolve_steps=(ResolveStep, ...),
+        object_fields=('items', ...),
+        post_steps=(PostStep, ...),
+        post_default=PostStep | None,
+        ...)
+"""
+from inspect import iscoroutinefunction, signature as get_signature
+import pydantic_resolve.constant as const
+from pydantic_resolve.utils.conversion import FieldConverter
+from pydantic_resolve.utils.recursion import RecursiveConfig
+from pydantic_resolve.utils.executor import CpuBoundConfig
+from pydantic_resolve.analysis import (
+    MappedMetaType,
+    MappedMetaMemberType,
+    get_collector_sign,
+    is_acceptable_kls,
+)
+
+
+class ParamBinder:
+    """
+    Pre-computed description of the parameters a resolve_/post_ method asks for.
+
+    loaders:    ((param, loader_path, type_key), ...)
+    collectors: ((param, alias, signature), ...)
+    load_field: post method asks for `load_field`, to resolve lazy fields of the node
+    """
+    __slots__ = ('context', 'ancestor_context', 'parent', 'loaders', 'collectors', 'load_field')
+
+    def __init__(
+            self,
+            context: bool,
+            ancestor_context: bool,
+            parent: bool,
+            loaders: tuple,
+            collectors: tuple,
+            load_field: bool = False):
+        self.context = context
+        self.ancestor_context = ancestor_context
+        self.parent = parent
+        self.loaders = loaders
+        self.collectors = collectors
+        self.load_field = load_field
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.context or self.ancestor_context or self.parent or self.loaders or self.collectors
+            or self.load_field)
+
+
+class ResolveStep:
+    """
+    resolve_<field> method of a class.
+
+    converter: parses return value into field type, None if @mapper is used or class is not pydantic.
+    recursion: RecursiveConfig if decorated by @recursive.
+    traverse:  False if classes allowed by field annotation have nothing to do, the value is not walked.
+    blocking:  True if marked by @blocking (method or class), runs in the blocking executor of Resolver,
+               None for other plain methods without dataloaders, they run there with Resolver(blocking=True),
+               False for async methods and methods with dataloaders.
+    """
+    __slots__ = (
+        'method_name', 'field', 'binder', 'has_mapper', 'has_annotation', 'converter', 'recursion', 'traverse',
+        'blocking')
+
+    def __init__(
+            self,
+            method_name: str,
+            field: str,
+            binder: ParamBinder,
+            has_mapper: bool,
+            has_annotation: bool,
+            converter: FieldConverter | None = None,
+            recursion: RecursiveConfig | None = None,
+            traverse: bool = True,
+            blocking: bool | None = False):
+        self.method_name = method_name
+        self.field = field
+        self.binder = binder
+        self.has_mapper = has_mapper
+        self.has_annotation = has_annotation
+        self.converter = converter
+        self.recursion = recursion
+        self.traverse = traverse
+        self.blocking = blocking
+
+
+class PostStep:
+    """
+    post_<field> method (or post_default_handler, whose field is None).
+
+    cpu_bound: CpuBoundConfig if decorated by @cpu_bound, calls run in the executor of Resolver.
+    """
+    __slots__ = ('method_name', 'field', 'binder', 'has_mapper', 'converter', 'cpu_bound')
+
+    def __init__(
+            self,
+            method_name: str,
+            field: str | None,
+            binder: ParamBinder,
+            has_mapper: bool,
+            converter: FieldConverter | None = None,
+            cpu_bound: CpuBoundConfig | None = None):
+        self.method_name = method_name
+        self.field = field
+        self.binder = binder
+        self.has_mapper = has_mapper
+        self.converter = converter
+        self.cpu_bound = cpu_bound
+
+
+class KlsPlan:
+    """
+    Everything the Resolver needs to process an instance of `kls`.
+
+    collect_items:     ((field or tuple of fields, (alias, ...)), ...)
+    expose_items:      ((field, alias), ...)
+    collector_protos:  ((alias, signature, prototype collector), ...)
+    sync_subtree:      the class and its whole subtree have sync work only, see analysis.
+    is_noop:           instance of this class has nothing to do, skip it entirely.
+    recursive:         has @recursive resolve methods, instances are walked level by level.
+    lazy_steps:        {field: ResolveStep} of @lazy resolve methods, not in resolve_steps.
+    lazy_collected:    ((ResolveStep, (alias, ...)), ...) lazy fields sent to collectors,
+                       resolved with the node when one of the aliases is in scope.
+    """
+    __slots__ = (
+        'kls',
+        'kls_path',
+        'resolve_steps',
+        'object_fields',
+        'post_steps',
+        'post_default',
+        'expose_items',
+        'collect_items',
+        'collector_protos',
+        'should_traverse',
+        'sync_subtree',
+        'is_noop',
+        'recursive',
+        'lazy_steps',
+        'lazy_collected',
+    )
+
+    def __init__(
+            self,
+            kls: type,
+            kls_path: str,
+            resolve_steps: tuple,
+            object_fields: tuple,
+            post_steps: tuple,
+            post_default: PostStep | None,
+            expose_items: tuple,
+            collect_items: tuple,
+            collector_protos: tuple,
+            should_traverse: bool,
+            sync_subtree: bool = False,
+            lazy_steps: tuple = ()):
+        self.kls = kls
+        self.kls_path = kls_path
+        self.resolve_steps = resolve_steps
+        self.object_fields = object_fields
+        self.post_steps = post_steps
+        self.post_default = post_default
+        self.expose_items = expose_items
+        self.collect_items = collect_items
+        self.collector_protos = collector_protos
+        self.should_traverse = should_traverse
+        self.sync_subtree = sync_subtree
+        self.is_noop = not (
+            resolve_steps or object_fields or post_steps or post_default
+            or expose_items or collect_items or collector_protos or lazy_steps)
+        self.recursive = any(step.recursion is not None for step in resolve_steps)
+        self.lazy_steps = {step.field: step for step in lazy_steps}
+        self.lazy_collected = tuple(
+            (self.lazy_steps[field], aliases)
+            for field, aliases in collect_items if field in self.lazy_steps)
+
+
+PlanType = dict[type, KlsPlan]
+
+
+def _compile_binder(params: dict, kls_path: str, default_handler: bool = False, method=None) -> ParamBinder:
+    loaders = tuple(
+        (loader['param'], loader['path'], loader['type_key'])
+        for loader in params.get('dataloaders', ()))
+
+    collectors = []
+    for collector in params.get('collectors', ()):
+        if default_handler:
+            signature = (kls_path, const.POST_DEFAULT_HANDLER, collector['param'])
+        else:
+            signature = get_collector_sign(kls_path, collector)
+        collectors.append((collector['param'], collector['alias'], signature))
+
+    return ParamBinder(
+        context=params['context'],
+        ancestor_context=params['ancestor_context'],
+        parent=params['parent'],
+        loaders=loaders,
+        collectors=tuple(collectors),
+        load_field=method is not None and const.LOAD_FIELD_PARAM in get_signature(method).parameters)
+
+
+def _compile_converter(kls: type, field: str, has_mapper: bool) -> FieldConverter | None:
+    if has_mapper or not is_acceptable_kls(kls):
+        return None
+    return FieldConverter(kls, field)
+
+
+def _compile_blocking(kls: type, method, params: dict) -> bool | None:
+    marked = getattr(method, const.BLOCKING_CONFIGURATION, False)
+    if iscoroutinefunction(method) or params.get('dataloaders'):
+        if marked:
+            raise TypeError(
+                f'{kls.__name__}.{method.__name__} has DataLoader parameters, it can not be blocking')
+        return False
+    if marked or getattr(kls, const.BLOCKING_CONFIGURATION, False):
+        return True
+    return None
+
+
+def _compile_kls_plan(kls_meta: MappedMetaMemberType) -> KlsPlan:
+    kls = kls_meta['kls']
+    kls_path = kls_meta['kls_path']
+
+    resolve_steps = []
+    lazy_steps = []
+    for method_name in kls_meta['resolve']:
+        params = kls_meta['resolve_params'][method_name]
+        method = getattr(kls, method_name)
+        has_mapper = getattr(method, const.HAS_MAPPER_FUNCTION, False)
+        steps = lazy_steps if getattr(method, const.LAZY_CONFIGURATION, False) else resolve_steps
+        steps.append(ResolveStep(
+            method_name=method_name,
+            field=params['trim_field'],
+            binder=_compile_binder(params, kls_path),
+            has_mapper=has_mapper,
+            has_annotation=bool(getattr(method, '__annotations__', None)),
+            converter=_compile_converter(kls, params['trim_field'], has_mapper),
+            recursion=getattr(method, const.RECURSIVE_CONFIGURATION, None),
+            traverse=params['trim_field'] not in kls_meta.get('resolve_fields_without_traversal', ()),
+            blocking=_compile_blocking(kls, method, params)))
+
+    post_steps = []
+    for method_name in kls_meta['post']:
+        params = kls_meta['post_params'][method_name]
+        method = getattr(kls, method_name)
+        has_mapper = getattr(method, const.HAS_MAPPER_FUNCTION, False)
+        post_steps.append(PostStep(
+            method_name=method_name,
+            field=params['trim_field'],
+            binder=_compile_binder(params, kls_path, method=method),
+            has_mapper=has_mapper,
+            converter=_compile_converter(kls, params['trim_field'], has_mapper),
+            cpu_bound=getattr(method, const.CPU_BOUND_CONFIGURATION, None)))
+
+    post_default = None
+    default_params = kls_meta['post_default_handler_params']
+    if default_params is not None:
+        post_default = PostStep(
+            method_name=const.POST_DEFAULT_HANDLER,
+            field=None,
+            binder=_compile_binder(
+                default_params, kls_path, default_handler=True,
+                method=getattr(kls, const.POST_DEFAULT_HANDLER)),
+            has_mapper=False)
+
+    collect_items = tuple(
+        (field, alias if isinstance(alias, (tuple, list)) else (alias,))
+        for field, alias in kls_meta['collect_dict'].items())
+
+    collector_protos = tuple(
+        (alias, sign, collector)
+        for alias, sign_collector in kls_meta['alias_map_proto'].items()
+        for sign, collector in sign_collector.items())
+
+    return KlsPlan(
+        kls=kls,
+        kls_path=kls_path,
+        resolve_steps=tuple(resolve_steps),
+        object_fields=tuple(kls_meta['object_fields']),
+        post_steps=tuple(post_steps),
+        post_default=post_default,
+        expose_items=tuple((kls_meta['expose_dict'] or {}).items()),
+        collect_items=collect_items,
+        collector_protos=collector_protos,
+        should_traverse=kls_meta['should_traverse'],
+        sync_subtree=kls_meta['sync_subtree'],
+        lazy_steps=tuple(lazy_steps))
+
+
+def compile_plans(mapped_metadata: MappedMetaType) -> PlanType:
+    """compile every class of the scanned metadata into a KlsPlan"""
+    return {kls: _compile_kls_plan(kls_meta) for kls, kls_meta in mapped_metadata.items()}
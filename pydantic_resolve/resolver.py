@@ -1,48 +1,79 @@
 import os
 import asyncio
-import contextvars
+from concurrent.futures import Executor
+from functools import partial
 from inspect import iscoroutine
-from typing import TypeVar, Callable, Any
+from time import perf_counter_ns
+from typing import TypeVar, Callable, Any, AsyncIterable, AsyncIterator, Awaitable, Iterable
 from aiodataloader import DataLoader
 from types import MappingProxyType
 
 from pydantic_resolve import analysis
-from pydantic_resolve.exceptions import MissingAnnotationError
+from pydantic_resolve import plan as plan_util
+from pydantic_resolve.frame import Frame, ScopeMap, ROOT_FRAME
+from pydantic_resolve.metadata_cache import MetadataCache, get_maxsize_from_env
+from pydantic_resolve.exceptions import MissingAnnotationError, ResolverTargetAttrNotFound
+from pydantic_resolve.utils.collector import CollectorSlot
 import pydantic_resolve.loader_manager
 import pydantic_resolve.utils.conversion as conversion_util
 import pydantic_resolve.utils.class_util as class_util
 import pydantic_resolve.constant as const
 import pydantic_resolve.utils.profile as profile_util
-
-# Two-level cache: id(resolver_class) -> {root_class -> metadata}
-# This isolates caches for different resolver classes (created via config_resolver)
-# since different resolver classes may have different er_pre_generator configurations
-METADATA_CACHE: dict[int, dict[type, Any]] = {}
+import pydantic_resolve.utils.tracing as tracing_util
+import pydantic_resolve.utils.stats as stats_util
+import pydantic_resolve.utils.recursion as recursion_util
+import pydantic_resolve.utils.executor as executor_util
+import pydantic_resolve.utils.selection as selection_util
+
+# (resolver class, root class) -> (metadata, plans), bounded LRU
+# resolver classes (created via config_resolver) may have different er_pre_generator configurations,
+# so their caches are isolated. size can be configured by PYDANTIC_RESOLVE_METADATA_CACHE_SIZE
+METADATA_CACHE = MetadataCache(maxsize=get_maxsize_from_env())
 T = TypeVar("T")
 
 
-def _get_metadata_from_cache(resolver_class_id: int, root_class: type):
-    """Get metadata from two-level cache."""
-    resolver_cache = METADATA_CACHE.get(resolver_class_id)
-    if resolver_cache is None:
-        return None
-    return resolver_cache.get(root_class)
+def _get_metadata_from_cache(resolver_class: type, root_class: type):
+    """Get (metadata, plans) from cache."""
+    return METADATA_CACHE.get(resolver_class, root_class)
+
+
+def _set_metadata_to_cache(resolver_class: type, root_class: type, metadata):
+    """Set metadata to cache, compile its execution plans, return (metadata, plans)."""
+    return METADATA_CACHE.set(resolver_class, root_class, metadata)
+
+
+async def _await_value(val):
+    while iscoroutine(val) or asyncio.isfuture(val):
+        val = await val
+    return val
 
 
-def _set_metadata_to_cache(resolver_class_id: int, root_class: type, metadata) -> None:
-    """Set metadata to two-level cache."""
-    if resolver_class_id not in METADATA_CACHE:
-        METADATA_CACHE[resolver_class_id] = {}
-    METADATA_CACHE[resolver_class_id][root_class] = metadata
+def _ensure_not_awaitable(val, kls_plan: plan_util.KlsPlan, step: plan_util.PostStep):
+    if iscoroutine(val) or asyncio.isfuture(val):
+        if iscoroutine(val):
+            val.close()
+        raise TypeError(
+            f'{kls_plan.kls_path}.{step.method_name} is a plain function but returns an awaitable, '
+            'declare it with `async def` instead')
 
 
-def _safe_reset_contextvar(contextvar: contextvars.ContextVar, token):
-    """Safely reset a contextvar, ignoring errors if token is from a different context."""
-    try:
-        contextvar.reset(token)
-    except (ValueError, LookupError):
-        # Token was created in a different context or already reset
-        pass
+async def _iter_chunks(items: Iterable[T] | AsyncIterable[T], chunk_size: int) -> AsyncIterator[list[T]]:
+    """pull items lazily from sync or async iterable, yield lists of chunk_size items"""
+    chunk: list[T] = []
+    if hasattr(items, '__aiter__'):
+        async for item in items:  # type: ignore
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:  # type: ignore
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
 
 
 class Resolver:
@@ -62,6 +93,14 @@ class Resolver:
             annotation: type[T] | None=None,
             split_loader_by_type=False,
             resolved_hooks: list[Callable] | None = None,
+            engine: str = const.ENGINE_RECURSIVE,
+            max_concurrency: int | None = None,
+            tracer: tracing_util.Tracer | None = None,
+            executor: Executor | None = None,
+            blocking: bool = False,
+            blocking_executor: Executor | None = None,
+            include: selection_util.IncEx | None = None,
+            exclude: selection_util.IncEx | None = None,
             ):
         
         self.debug = debug or os.getenv("PYDANTIC_RESOLVE_DEBUG", "false").lower() == "true"
@@ -69,27 +108,6 @@ class Resolver:
         self.performance = profile_util.Profile()
         self.loader_instance_cache = {}
 
-        # Optimization: Use single dict-based ContextVar for all ancestors
-        # Instead of multiple ContextVars (one per field), use one that holds a dict
-        self._ancestor_contextvar = contextvars.ContextVar(
-            '_ancestors',
-            default=MappingProxyType({}),
-        )
-
-        # Optimization: Use single dict-based ContextVar for collectors
-        self._collector_contextvar = contextvars.ContextVar(
-            '_collectors',
-            default=MappingProxyType({}),
-        )
-
-        # Pre-create parent ContextVar
-        self._parent_contextvar = contextvars.ContextVar('parent', default=None)
-
-        # Legacy compatibility - keep dict-based access for now
-        self.ancestor_vars = {}
-        self.collector_contextvars = {}
-        self.parent_contextvars = {}
-
         # for dataloader which has class attributes, you can assign the value at here
         self.loader_params = loader_params or {}
 
@@ -125,7 +143,7 @@ class Resolver:
         self.ensure_type = ensure_type
         self.context = MappingProxyType(context) if context else None
         self.metadata = {}
-        self.object_level_collect_alias_map_store: dict[int, dict] = {}
+        self.plans: plan_util.PlanType = {}
 
         # if user provide annotation, it will skip the deduction from input value
         self.annotation = annotation
@@ -134,6 +152,54 @@ class Resolver:
 
         self.resolved_hooks = resolved_hooks or []
 
+        # set by ResolverSession, loader instances are shared with other resolvers of the session
+        self._loader_store: pydantic_resolve.loader_manager.LoaderStore | None = None
+
+        # recursive: depth first, one coroutine per node (default)
+        # level:     breadth first, resolve methods of a whole level run in one batch,
+        #            post methods and collectors run bottom-up in a second pass
+        if engine not in (const.ENGINE_RECURSIVE, const.ENGINE_LEVEL):
+            raise ValueError(f'engine should be one of "{const.ENGINE_RECURSIVE}", "{const.ENGINE_LEVEL}", got "{engine}"')
+        self.engine = engine
+
+        # bound the fan-out of lists: elements are admitted in windows of max_concurrency,
+        # a whole window starts in the same tick, so dataloader batches are still filled.
+        # the window applies to each list on its own, it is not a limit of the total subtrees
+        # in flight: nested lists of N running elements may run N * max_concurrency children.
+        # peak_in_flight records the max number of node subtrees running at the same time
+        # during the last resolve.
+        if max_concurrency is not None and (not isinstance(max_concurrency, int) or max_concurrency < 1):
+            raise ValueError(f'max_concurrency should be a positive int, got {max_concurrency!r}')
+        self.max_concurrency = max_concurrency
+        self.peak_in_flight = 0
+        self._in_flight = 0
+
+        # sampled per resolve, spans of the last traced resolve are kept in self.spans
+        self.tracer = tracer
+        self._trace: tracing_util.Trace | None = None
+        self.spans: list[dict] = []
+
+        # loader batch counters and node counts of the last resolve
+        self.stats = stats_util.ResolverStats()
+
+        # runs @cpu_bound post methods, None means the default executor of event loop
+        self.executor = executor
+        self._cpu_queues: dict[plan_util.PostStep, executor_util.CpuBoundQueue] = {}
+
+        # plain resolve methods marked by @blocking (or all of them with blocking=True) run in
+        # blocking_executor, None means the default executor of event loop
+        self.blocking = blocking
+        self.blocking_executor = blocking_executor
+
+        # nested field specs (like model_dump), unselected fields are not resolved,
+        # validated against the root class at resolve time
+        self.include = include
+        self.exclude = exclude
+
+        # frames of nodes which have @lazy fields, and lazy fields being resolved, by node id
+        self._lazy_frames: dict[int, Frame] = {}
+        self._lazy_tasks: dict[tuple[int, str], tuple[object, asyncio.Future]] = {}
+
     def _validate_loader_instance(self, loader_instances: dict[Any, Any]):
         for cls, loader in loader_instances.items():
             if not issubclass(cls, DataLoader):
@@ -160,214 +226,259 @@ class Resolver:
             )
         return instance
     
-    def _prepare_collectors(self, node: object, kls: type):
-        alias_map = analysis.generate_alias_map_with_cloned_collector(kls, self.metadata)
-        if alias_map:
-            # store for later post methods
-            self.object_level_collect_alias_map_store[id(node)] = alias_map
-
-            # Optimization: Use single dict-based ContextVar
-            current_collectors = self._collector_contextvar.get()
-            new_collectors = dict(current_collectors)
-
-            for alias_name, sign_collector_kv in alias_map.items():
-                if alias_name not in new_collectors:
-                    new_collectors[alias_name] = {}
-
-                current_pair = new_collectors[alias_name]
-                if set(sign_collector_kv.keys()) - set(current_pair.keys()):
-                    new_collectors[alias_name] = {**current_pair, **sign_collector_kv}
-
-            token = self._collector_contextvar.set(new_collectors)
-            return lambda: _safe_reset_contextvar(self._collector_contextvar, token)
-
-        return lambda: None
-
-    def _prepare_parent(self, node: object):
-        # Optimization: Use pre-created ContextVar
-        token = self._parent_contextvar.set(node)
-        return lambda: _safe_reset_contextvar(self._parent_contextvar, token)
-
-    def _prepare_expose_fields(self, node: object):
-        expose_dict: dict | None = getattr(node, const.EXPOSE_TO_DESCENDANT, None)
-        if expose_dict:
-            # Optimization: Use single dict-based ContextVar
-            current_ancestors = self._ancestor_contextvar.get()
-            new_ancestors = dict(current_ancestors)
-
-            for field, alias in expose_dict.items():
-                try:
-                    val = getattr(node, field)
-                except AttributeError:
-                    raise AttributeError(f'{field} does not exist')
-                new_ancestors[alias] = val
-
-            token = self._ancestor_contextvar.set(new_ancestors)
-            return lambda: _safe_reset_contextvar(self._ancestor_contextvar, token)
-
-        return lambda: None
-
-    def _prepare_ancestor_context(self):
-        # Optimization: Single .get() call instead of multiple
-        return self._ancestor_contextvar.get()
-
-    def _execute_resolve_method(
-            self,
-            kls: type,
-            field: str,
-            method: Callable):
-
-        params = {}
-        resolve_param = analysis.get_resolve_method_param(kls, field, self.metadata)
+    def _get_plan(self, node: object) -> plan_util.KlsPlan | None:
+        kls_plan = self.plans.get(node.__class__)
+        if kls_plan is None and analysis.is_acceptable_instance(node):
+            raise KeyError(
+                f'metadata of {class_util.get_kls_full_name(node.__class__)} not found, '
+                'for Union types please provide Resolver(annotation=...)')
+        return kls_plan
+
+    def _clone_collectors(self, kls_plan: plan_util.KlsPlan) -> dict[str, dict]:
+        """collector slots of one node, instances are cloned from prototypes on first use"""
+        alias_map: dict[str, dict] = {}
+        for alias, sign, collector in kls_plan.collector_protos:
+            alias_map.setdefault(alias, {})[sign] = CollectorSlot(collector)
+        return alias_map
+
+    def _merge_collectors(self, current_collectors: ScopeMap, alias_map: dict[str, dict]) -> ScopeMap:
+        layer = {}
+        for alias_name, sign_collector_kv in alias_map.items():
+            current_pair = current_collectors.get(alias_name, {})
+            if set(sign_collector_kv.keys()) - set(current_pair.keys()):
+                layer[alias_name] = {**current_pair, **sign_collector_kv}
+        return current_collectors.child(layer)
+
+    def _merge_expose_fields(self, node: object, kls_plan: plan_util.KlsPlan, current_ancestors: ScopeMap) -> ScopeMap:
+        layer = {}
+        for field, alias in kls_plan.expose_items:
+            try:
+                val = getattr(node, field)
+            except AttributeError:
+                raise AttributeError(f'{field} does not exist')
+            layer[alias] = val
+        return current_ancestors.child(layer)
+
+    def _enter_frame(self, node: object, kls_plan: plan_util.KlsPlan, up: Frame) -> Frame:
+        """
+        build the frame of node, ancestors / collectors of `up` are shared
+        unless node exposes fields or declares collectors.
+        """
+        ancestors = up.ancestors
+        collectors = up.collectors
+        alias_map = None
 
-        if resolve_param['context']:
-            params['context'] = self.context
-        if resolve_param['ancestor_context']:
-            params['ancestor_context'] = self._prepare_ancestor_context()
-        if resolve_param['parent']:
-            params['parent'] = self._parent_contextvar.get()
-        
-        for loader in resolve_param['dataloaders']:
-            loader_instance = self._get_loader_instance(loader['path'], loader['type_key'])
-            params[loader['param']] = loader_instance
+        nodes = self.stats.nodes
+        nodes[kls_plan.kls_path] = nodes.get(kls_plan.kls_path, 0) + 1
 
-        return method(**params)
+        if kls_plan.collector_protos:
+            alias_map = self._clone_collectors(kls_plan)
+            collectors = self._merge_collectors(collectors, alias_map)
+        if kls_plan.expose_items:
+            ancestors = self._merge_expose_fields(node, kls_plan, ancestors)
 
-    def _execute_post_method(
-            self,
-            node: object,
-            kls: type,
-            kls_path: str,
-            field: str,
-            method: Callable):
+        frame = Frame(node, kls_plan, up, ancestors, collectors, alias_map)
+        if kls_plan.lazy_steps:
+            self._lazy_frames[id(node)] = frame
+        return frame
 
+    def _bind_params(self, binder: plan_util.ParamBinder, frame: Frame) -> dict:
         params = {}
-        post_param = analysis.get_post_method_params(kls, field, self.metadata)
 
-        if post_param['context']:
+        if binder.context:
             params['context'] = self.context
-        if post_param['ancestor_context']:
-            params['ancestor_context'] = self._prepare_ancestor_context()
-        if post_param['parent']:
-            params['parent'] = self._parent_contextvar.get()
-        
-        for loader in post_param['dataloaders']:
-            loader_instance = self._get_loader_instance(loader['path'], loader['type_key'])
-            params[loader['param']] = loader_instance
-
-        alias_map = self.object_level_collect_alias_map_store.get(id(node), {})
-        if alias_map:
-            for collector in post_param['collectors']:
-                signature = analysis.get_collector_sign(kls_path, collector)
-                alias, param = collector['alias'], collector['param']
-                params[param] = alias_map[alias][signature]
-        
-        return method(**params)
-
-    def _execute_post_default_handler(
-            self,
-            node: object,
-            kls: type,
-            kls_path: str,
-            method: Callable):
-
-        params = {}
-        post_default_param = analysis.get_post_default_handler_params(kls, self.metadata)
+        if binder.ancestor_context:
+            params['ancestor_context'] = frame.ancestors
+        if binder.parent:
+            params['parent'] = frame.parent
 
-        if post_default_param is None:
-            return
+        for param, path, type_key in binder.loaders:
+            params[param] = self._get_loader_instance(path, type_key)
 
-        if post_default_param['context']:
-            params['context'] = self.context
-        if post_default_param['ancestor_context']:
-            params['ancestor_context'] = self._prepare_ancestor_context()
-        if post_default_param['parent']:
-            params['parent'] = self._parent_contextvar.get()
+        if binder.load_field:
+            params[const.LOAD_FIELD_PARAM] = partial(self._load_lazy, frame)
 
-        alias_map = self.object_level_collect_alias_map_store.get(id(node), {})
-        if alias_map:
-            for collector in post_default_param['collectors']:
-                alias, param = collector['alias'], collector['param']
-                signature = (kls_path, const.POST_DEFAULT_HANDLER, param)
-                params[param] = alias_map[alias][signature]
+        alias_map = frame.alias_map
+        if binder.collectors and alias_map:
+            for param, alias, signature in binder.collectors:
+                params[param] = alias_map[alias][signature].get()
 
-        return method(**params)
-
-    def _add_values_into_collectors(self, node: object, kls: type):
-        for field, alias in analysis.get_collector_candidates(kls, self.metadata):
-            alias_list = alias if isinstance(alias, (tuple, list)) else (alias,)
+        return params
 
+    def _add_values_into_collectors(self, node: object, kls_plan: plan_util.KlsPlan, collectors):
+        for field, alias_list in kls_plan.collect_items:
             for alias in alias_list:
-                # Use the single dict-based ContextVar
-                collectors = self._collector_contextvar.get()
                 if alias in collectors:
-                    for _, instance in collectors[alias].items():
+                    for slot in collectors[alias].values():
                         if isinstance(field, tuple):  # only tuple are allowed to be key
                             val = [getattr(node, f) for f in field]
                         else:
                             val = getattr(node, field)
-                        instance.add(val)
+                        slot.add(val)
+
+    def _convert_value(self, step: plan_util.ResolveStep | plan_util.PostStep, val):
+        if step.converter is None:  # @mapper is defined (util.mapper), or node is not pydantic
+            return val
+        return step.converter.convert(val, self.enable_from_attribute_in_type_adapter)
+
+    def _convert_calls(self, calls: list[list]) -> None:
+        """
+        convert values of [frame, step, val] calls in place,
+        values of the same (class, field) are validated in one batch.
+        """
+        groups: dict[object, list[list]] = {}
+        for call in calls:
+            if call[1].converter is not None:
+                groups.setdefault(call[1], []).append(call)
+
+        for step, group in groups.items():
+            values = step.converter.convert_many(
+                [call[2] for call in group],
+                self.enable_from_attribute_in_type_adapter)
+            for call, val in zip(group, values):
+                call[2] = val
+
+    def _call_method(
+            self,
+            frame: Frame,
+            step: plan_util.ResolveStep | plan_util.PostStep,
+            kind: str,
+            blocking: bool | None = False):
+        """
+        call resolve_/post_ method of frame.node, record a span if current resolve is traced.
+        blocking calls run in blocking executor, a future is returned.
+        """
+        method = getattr(frame.node, step.method_name)
+        if blocking:
+            method = partial(executor_util.run_blocking, self.blocking_executor, method)
+        trace = self._trace
+        if trace is None:
+            return method(**self._bind_params(step.binder, frame))
+
+        start = perf_counter_ns()
+        val = method(**self._bind_params(step.binder, frame))
+        if iscoroutine(val) or asyncio.isfuture(val):
+            return self._await_and_trace(val, frame.plan, step, kind, start)
+        self._add_span(frame.plan, step, kind, start)
+        return val
+
+    def _submit_cpu_bound(self, frame: Frame, step: plan_util.PostStep) -> asyncio.Future:
+        """queue a call of @cpu_bound post method, calls of the same tick run in executor together"""
+        queue = self._cpu_queues.get(step)
+        if queue is None:
+            name = f'{frame.plan.kls_path}.{step.method_name}'
+            queue = self._cpu_queues[step] = executor_util.CpuBoundQueue(
+                self.executor, step.cpu_bound.batch_size, name,  # type: ignore
+                self.stats.executor_method(name), self._trace)
+        return queue.submit(frame.node, step.method_name, self._bind_params(step.binder, frame))
+
+    async def _await_and_trace(self, val, kls_plan: plan_util.KlsPlan, step, kind: str, start: int):
+        val = await _await_value(val)
+        self._add_span(kls_plan, step, kind, start)
+        return val
+
+    def _add_span(self, kls_plan: plan_util.KlsPlan, step, kind: str, start: int) -> None:
+        trace = self._trace
+        if trace is not None:
+            trace.add(f'{kls_plan.kls.__name__}.{step.method_name}', kind, start, perf_counter_ns(), {
+                'pydantic_resolve.class': kls_plan.kls_path,
+                'pydantic_resolve.method': step.method_name,
+            })
 
     async def _execute_resolve_method_field(
             self,
-            node: object,
-            kls: type,
-            field: str,
-            trim_field: str,
-            method: Callable):
+            frame: Frame,
+            step: plan_util.ResolveStep):
         if self.ensure_type:
-            if not method.__annotations__:
-                raise MissingAnnotationError(f'{field}: return annotation is required')
+            if not step.has_annotation:
+                raise MissingAnnotationError(f'{step.method_name}: return annotation is required')
 
-        val = self._execute_resolve_method(kls, field, method)
+        node = frame.node
+        val = self._call_method(
+            frame, step, tracing_util.KIND_RESOLVE, step.blocking or (self.blocking and step.blocking is None))
 
         while iscoroutine(val) or asyncio.isfuture(val):
             val = await val
 
-        if not getattr(method, const.HAS_MAPPER_FUNCTION, False):  # defined in util.mapper
-            val = conversion_util.try_parse_data_to_target_field_type(
-                node,
-                trim_field,
-                val,
-                self.enable_from_attribute_in_type_adapter)
+        val = self._convert_value(step, val)
 
         # Execute resolved hooks (e.g., nested pagination injection)
         for hook in self.resolved_hooks:
-            hook(node, trim_field, val)
+            hook(node, step.field, val)
+
+        if step.traverse:
+            val = await self._traverse(val, frame)
+        setattr(node, step.field, val)
+
+    def _load_lazy(self, frame: Frame, field: str) -> asyncio.Future:
+        """resolve @lazy field of frame.node once, concurrent requests share the task"""
+        key = (id(frame.node), field)
+        entry = self._lazy_tasks.get(key)
+        if entry is not None and entry[0] is frame.node:  # id of a released node may be reused
+            return entry[1]
+
+        step = frame.plan.lazy_steps.get(field)
+        if step is None:
+            raise ResolverTargetAttrNotFound(f'{frame.plan.kls.__name__}.{field} is not a lazy field')
+        task = asyncio.ensure_future(self._resolve_lazy(frame, step))
+        self._lazy_tasks[key] = (frame.node, task)
+        return task
+
+    def _release_lazy_scope(self) -> None:
+        """drop frames and tasks kept for load_field, e.g. once a chunk is consumed"""
+        self._lazy_frames = {}
+        self._lazy_tasks = {}
+
+    async def _resolve_lazy(self, frame: Frame, step: plan_util.ResolveStep):
+        await self._execute_resolve_method_field(frame, step)
+        return getattr(frame.node, step.field)
+
+    def _collected_lazy_fields(self, frame: Frame) -> list[asyncio.Future]:
+        """lazy fields sent to collectors in scope are resolved with the node"""
+        collectors = frame.collectors
+        return [
+            self._load_lazy(frame, step.field)
+            for step, aliases in frame.plan.lazy_collected
+            if any(alias in collectors for alias in aliases)]
+
+    async def load_field(self, node: object, field: str):
+        """
+        resolve a @lazy field of node on demand, after resolve, return its value.
 
-        val = await self._traverse(val, node)
-        setattr(node, trim_field, val)
+        the node keeps the scope (parent, ancestor_context) of the last resolve
+        (of its chunk, for resolve_chunks), otherwise it is resolved as a root.
+        loader instances of that resolve are reused, so requests of the same tick
+        share a batch.
+        """
+        if node.__class__ not in self.plans:
+            self._prepare(node)
+
+        frame = self._lazy_frames.get(id(node))
+        if frame is None or frame.node is not node:
+            frame = self._enter_frame(node, self._get_plan(node), ROOT_FRAME)  # type: ignore
+        return await self._load_lazy(frame, field)
 
     async def _execute_post_method_field(
          self,
-         node: object,
-         kls: type,
-         kls_path: str,
-         field: str,
-         trim_field: str,
-         method: Callable
+         frame: Frame,
+         step: plan_util.PostStep
     ):
-        val = self._execute_post_method(node, kls, kls_path, field, method)
+        node = frame.node
+        if step.cpu_bound is not None:
+            val = self._submit_cpu_bound(frame, step)
+        else:
+            val = self._call_method(frame, step, tracing_util.KIND_POST)
 
         while iscoroutine(val) or asyncio.isfuture(val):
             val = await val
-            
-        if not getattr(method, const.HAS_MAPPER_FUNCTION, False):  # defined in util.mapper
-            val = conversion_util.try_parse_data_to_target_field_type(
-                node,
-                trim_field,
-                val,
-                self.enable_from_attribute_in_type_adapter)
 
-        setattr(node, trim_field, val)
+        setattr(node, step.field, self._convert_value(step, val))
     
-    async def _traverse(self, node: T, parent: object) -> T:
+    async def _traverse(self, node: T, up: Frame) -> T:
         """
         life cycle:
-        - prepare 
-            - collectors, 
-            - ancestor expose fields 
-            - parent
+        - prepare
+            - frame of node: parent, ancestor expose fields, collectors
         - execute 
             - resolve method fields/ object fields
             - post method fields
@@ -375,103 +486,411 @@ class Resolver:
         - collect
             - values into ancestor collectors
         - return node
+
+        `up` is the frame of parent node, scope is passed down explicitly,
+        nothing needs to be reset after the node is done.
         """
         if isinstance(node, (list, tuple)):
-            await asyncio.gather(*[self._traverse(t, parent) for t in node])
+            # elements with nothing to do are skipped and elements with sync subtree are
+            # walked in place, without creating coroutines (decided once per class by plan),
+            # elements of recursive classes are walked together level by level
+            window = self.max_concurrency
+            tasks = []
+            recursive_group = []
+            for t in node:
+                kls_plan = self.plans.get(t.__class__)
+                if kls_plan is None:
+                    if not isinstance(t, (list, tuple)):
+                        self._get_plan(t)  # raises for models without metadata
+                        continue
+                elif kls_plan.is_noop:
+                    continue
+                elif kls_plan.sync_subtree:
+                    rest = self._traverse_sync(t, up)
+                    if rest is not None:
+                        tasks.append(rest)
+                    continue
+                elif kls_plan.recursive:
+                    recursive_group.append(t)
+                    continue
+
+                tasks.append(self._traverse(t, up))
+                if window and len(tasks) >= window:
+                    await asyncio.gather(*tasks)
+                    tasks = []
+            if recursive_group:
+                tasks.append(self._traverse_by_level(recursive_group, up))
+            if tasks:
+                await asyncio.gather(*tasks)
             return node
 
-        if not analysis.is_acceptable_instance(node):
+        kls_plan = self._get_plan(node)
+        if kls_plan is None or kls_plan.is_noop:
             return node
 
-        kls = node.__class__
-        kls_path = class_util.get_kls_full_name(kls)
+        if kls_plan.sync_subtree:
+            rest = self._traverse_sync(node, up)
+            if rest is not None:
+                await rest
+            return node
 
-        reset1 = self._prepare_collectors(node, kls)
-        reset2 = self._prepare_expose_fields(node)
-        reset3 = self._prepare_parent(parent)
+        if kls_plan.recursive:
+            # one loader batch per depth for the whole subtree
+            return await self._traverse_by_level(node, up)
+
+        frame = self._enter_frame(node, kls_plan, up)
+
+        self._in_flight += 1
+        if self._in_flight > self.peak_in_flight:
+            self.peak_in_flight = self._in_flight
 
-        token = None
         tid = None
-        new_ancestors = None
+        path = None
 
         if self.debug:
-            ancestors = self.ancestor_list.get() or []
-            new_ancestors = ancestors + [node.__class__.__name__]
-            token = self.ancestor_list.set(new_ancestors)
-            tid = self.performance.get_timer(new_ancestors).start()
+            path = frame.path()
+            tid = self.performance.get_timer(path).start()
 
         try:
-            resolve_tasks = []
-            post_tasks = []
-
             # resolve process
-            resolve_fields, object_fields = analysis.get_resolve_fields_and_object_fields_from_object(node, kls, self.metadata)
-            for field, resolve_trim_field, method in resolve_fields:
-                resolve_tasks.append(self._execute_resolve_method_field(
-                    node=node, 
-                    kls=kls, 
-                    field=field, 
-                    trim_field=resolve_trim_field, 
-                    method=method))
-
-            for field, attr_object in object_fields:
-                resolve_tasks.append(self._traverse(attr_object, node))
+            resolve_tasks = [
+                self._execute_resolve_method_field(frame, step)
+                for step in kls_plan.resolve_steps]
+
+            for field in kls_plan.object_fields:
+                resolve_tasks.append(self._traverse(getattr(node, field), frame))
+
+            if kls_plan.lazy_collected:
+                resolve_tasks.extend(self._collected_lazy_fields(frame))
 
             await asyncio.gather(*resolve_tasks)
 
             # post process
-            for post_field, post_trim_field, method in analysis.get_post_methods(node, kls, self.metadata):
-                post_tasks.append(self._execute_post_method_field(
-                    node=node, 
-                    kls=kls, 
-                    kls_path=kls_path, 
-                    field=post_field, 
-                    trim_field=post_trim_field,
-                    method=method))
-
-            await asyncio.gather(*post_tasks)
-
-            default_post_method = getattr(node, const.POST_DEFAULT_HANDLER, None)
-            if default_post_method:
-                val = self._execute_post_default_handler(node, kls, kls_path, default_post_method)
+            if kls_plan.post_steps:
+                await asyncio.gather(*[
+                    self._execute_post_method_field(frame, step)
+                    for step in kls_plan.post_steps])
+
+            default_step = kls_plan.post_default
+            if default_step:
+                val = self._call_method(frame, default_step, tracing_util.KIND_POST)
                 while iscoroutine(val) or asyncio.isfuture(val):
                     val = await val
 
-            self._add_values_into_collectors(node, kls)
+            if kls_plan.collect_items:
+                self._add_values_into_collectors(node, kls_plan, frame.collectors)
         finally:
-            if self.debug and tid is not None and new_ancestors is not None:
-                self.performance.get_timer(new_ancestors).end(tid)  # type: ignore
-            # reset all contextvars
-            reset1()
-            reset2()
-            reset3()
-            if self.debug and token is not None:
-                _safe_reset_contextvar(self.ancestor_list, token)
+            self._in_flight -= 1
+            if self.debug and tid is not None and path is not None:
+                self.performance.get_timer(path).end(tid)  # type: ignore
 
         return node
 
-    async def resolve(self, node: T) -> T:
-        if isinstance(node, list) and node == []:
-            return node
+    def _traverse_sync(self, node: object, up: Frame, strict: bool = False) -> Awaitable | None:
+        """
+        plain recursive walk for subtrees whose plan is marked as sync_subtree,
+        no coroutine is created and nothing is awaited.
+
+        a plain `def` post method may still return an awaitable (e.g. wrapped by a decorator),
+        with strict (resolve_sync) it raises TypeError, otherwise the rest of the node
+        continues in a coroutine, which is returned and has to be awaited by the caller.
+        """
+        if isinstance(node, (list, tuple)):
+            pending = [rest for t in node if (rest := self._traverse_sync(t, up, strict)) is not None]
+            return asyncio.gather(*pending) if pending else None
+
+        kls_plan = self._get_plan(node)
+        if kls_plan is None or kls_plan.is_noop:
+            return None
+
+        frame = self._enter_frame(node, kls_plan, up)
+
+        pending = [
+            rest for field in kls_plan.object_fields
+            if (rest := self._traverse_sync(getattr(node, field), frame, strict)) is not None]
+        if pending:
+            return self._finish_sync_node(frame, kls_plan, 0, None, pending)
+
+        for i, step in enumerate(kls_plan.post_steps):
+            val = self._call_method(frame, step, tracing_util.KIND_POST)
+            if iscoroutine(val) or asyncio.isfuture(val):
+                if strict:
+                    _ensure_not_awaitable(val, kls_plan, step)
+                return self._finish_sync_node(frame, kls_plan, i, val)
+            setattr(node, step.field, self._convert_value(step, val))
+
+        default_step = kls_plan.post_default
+        if default_step:
+            val = self._call_method(frame, default_step, tracing_util.KIND_POST)
+            if iscoroutine(val) or asyncio.isfuture(val):
+                if strict:
+                    _ensure_not_awaitable(val, kls_plan, default_step)
+                return self._finish_sync_node(frame, kls_plan, len(kls_plan.post_steps), val)
+
+        if kls_plan.collect_items:
+            self._add_values_into_collectors(node, kls_plan, frame.collectors)
+        return None
+
+    async def _finish_sync_node(
+            self,
+            frame: Frame,
+            kls_plan: plan_util.KlsPlan,
+            start: int,
+            val: Any,
+            pending: list[Awaitable] | None = None) -> None:
+        """
+        rest of _traverse_sync for one node once an awaitable shows up:
+        wait for children, then post steps from `start` (val is the pending result of it),
+        post default handler and collect.
+        """
+        if pending:
+            await asyncio.gather(*pending)
+
+        node = frame.node
+        steps = kls_plan.post_steps
+        for i in range(start, len(steps)):
+            step = steps[i]
+            if i != start or pending:
+                val = self._call_method(frame, step, tracing_util.KIND_POST)
+            setattr(node, step.field, self._convert_value(step, await _await_value(val)))
+
+        default_step = kls_plan.post_default
+        if default_step:
+            if start != len(steps) or pending:
+                val = self._call_method(frame, default_step, tracing_util.KIND_POST)
+            await _await_value(val)
+
+        if kls_plan.collect_items:
+            self._add_values_into_collectors(node, kls_plan, frame.collectors)
+
+    def _collect_level_entries(self, node: object, up: Frame, out: list[Frame]) -> None:
+        """flatten node (or nested list of nodes) into frames of next level"""
+        if isinstance(node, (list, tuple)):
+            for n in node:
+                self._collect_level_entries(n, up, out)
+            return
+
+        kls_plan = self._get_plan(node)
+        if kls_plan is None or kls_plan.is_noop:
+            return
+
+        out.append(self._enter_frame(node, kls_plan, up))
+
+    async def _resolve_level(self, entries: list[Frame]) -> list[Frame]:
+        """
+        execute resolve methods of all nodes in one level, return frames of next level.
+
+        nodes are grouped by class, so that loader.load calls of the same kind
+        are issued in the same tick and fill one DataLoader batch.
+        """
+        groups: dict[type, list[Frame]] = {}
+        for entry in entries:
+            if entry.plan.resolve_steps:
+                groups.setdefault(entry.plan.kls, []).append(entry)
+
+        todo = []
+        for group in groups.values():
+            for entry in group:
+                for step in entry.plan.resolve_steps:
+                    recursion = step.recursion
+                    if recursion is not None and recursion.max_depth is not None \
+                            and entry.recursion_depth() >= recursion.max_depth:
+                        continue
+
+                    if self.ensure_type and not step.has_annotation:
+                        raise MissingAnnotationError(f'{step.method_name}: return annotation is required')
+                    todo.append((entry, step))
+
+        # loaders of recursive calls are held until every call has loaded or finished,
+        # calls are registered before any of them runs
+        recursive_calls: dict[int, recursion_util.RecursiveCall] = {}
+        calls = []
+        pending = []
+        coros = []  # created by the calls, closed if the level fails before awaiting them
+        try:
+            for i, (_, step) in enumerate(todo):
+                if step.recursion is not None and step.binder.loaders:
+                    recursive_calls[i] = recursion_util.RecursiveCall([
+                        recursion_util.open_gate(self._get_loader_instance(loader_path, type_key))
+                        for _, loader_path, type_key in step.binder.loaders])
+
+            for i, (entry, step) in enumerate(todo):
+                rcall = recursive_calls.get(i) if recursive_calls else None
+                if rcall is None:
+                    val = self._call_method(
+                        entry, step, tracing_util.KIND_RESOLVE,
+                        step.blocking or (self.blocking and step.blocking is None))
+                else:
+                    val = rcall.run(self._call_method, entry, step, tracing_util.KIND_RESOLVE)
+                    if iscoroutine(val):
+                        coros.append(val)
+                        val = rcall.wait(val)
+                if iscoroutine(val):
+                    coros.append(val)
+                if iscoroutine(val) or asyncio.isfuture(val):
+                    pending.append(len(calls))
+                calls.append([entry, step, val])
+        except BaseException:
+            # a method raised before the level is awaited: release the gates held for
+            # calls which did not run (or will never be awaited), else the loaders
+            # (shared by a ResolverSession) keep their queues forever
+            for rcall in recursive_calls.values():
+                rcall.finish()
+            for coro in coros:
+                coro.close()
+            raise
+
+        # lazy fields sent to collectors are resolved (and walked) with their nodes
+        lazy_tasks = []
+        for entry in entries:
+            if entry.plan.lazy_collected:
+                lazy_tasks.extend(self._collected_lazy_fields(entry))
+
+        if pending:
+            values = await asyncio.gather(*[_await_value(calls[i][2]) for i in pending])
+            for i, val in zip(pending, values):
+                calls[i][2] = val
+        if lazy_tasks:
+            await asyncio.gather(*lazy_tasks)
+
+        self._convert_calls(calls)
+
+        for entry, step, val in calls:
+            # Execute resolved hooks (e.g., nested pagination injection)
+            for hook in self.resolved_hooks:
+                hook(entry.node, step.field, val)
+
+            setattr(entry.node, step.field, val)
+
+        # children are discovered in the original order of nodes
+        next_entries: list[Frame] = []
+        for entry in entries:
+            if entry.plan.sync_subtree:  # walked by _traverse_sync in post phase
+                continue
+            node = entry.node
+            for step in entry.plan.resolve_steps:
+                if step.traverse:
+                    self._collect_level_entries(getattr(node, step.field), entry, next_entries)
+            for field in entry.plan.object_fields:
+                self._collect_level_entries(getattr(node, field), entry, next_entries)
+        return next_entries
+
+    async def _post_level(self, entries: list[Frame]) -> None:
+        """execute post methods, post default handler and collect values, for all nodes in one level"""
+        rests = []
+        for entry in entries:
+            if entry.plan.sync_subtree:
+                for field in entry.plan.object_fields:
+                    rest = self._traverse_sync(getattr(entry.node, field), entry)
+                    if rest is not None:
+                        rests.append(rest)
+        if rests:
+            await asyncio.gather(*rests)
+
+        calls = []
+        pending = []
+        for entry in entries:
+            for step in entry.plan.post_steps:
+                if step.cpu_bound is not None:
+                    val = self._submit_cpu_bound(entry, step)
+                else:
+                    val = self._call_method(entry, step, tracing_util.KIND_POST)
+                if iscoroutine(val) or asyncio.isfuture(val):
+                    pending.append(len(calls))
+                calls.append([entry, step, val])
+
+        if pending:
+            values = await asyncio.gather(*[_await_value(calls[i][2]) for i in pending])
+            for i, val in zip(pending, values):
+                calls[i][2] = val
+
+        self._convert_calls(calls)
+        for entry, step, val in calls:
+            setattr(entry.node, step.field, val)
+
+        pending_defaults = []
+        for entry in entries:
+            default_step = entry.plan.post_default
+            if default_step:
+                val = self._call_method(entry, default_step, tracing_util.KIND_POST)
+                if iscoroutine(val) or asyncio.isfuture(val):
+                    pending_defaults.append(_await_value(val))
+
+        if pending_defaults:
+            await asyncio.gather(*pending_defaults)
+
+        for entry in entries:
+            if entry.plan.collect_items:
+                self._add_values_into_collectors(entry.node, entry.plan, entry.collectors)
+
+    async def _traverse_by_level(self, node: T, up: Frame = ROOT_FRAME) -> T:
+        """
+        breadth first traversal, of the whole tree (engine='level') or of
+        a subtree of recursive classes (engine='recursive').
+
+        - top-down: resolve methods of a whole level run together, then descend
+        - bottom-up: post methods, post default handler and collectors, level by level
+        """
+        if self.max_concurrency and isinstance(node, (list, tuple)):
+            # elements are admitted in windows, each window is walked level by level
+            for i in range(0, len(node), self.max_concurrency):
+                await self._traverse_window_by_level(node[i:i + self.max_concurrency], up)
+        else:
+            await self._traverse_window_by_level(node, up)
+        return node
+
+    async def _traverse_window_by_level(self, node: object, up: Frame) -> None:
+        levels: list[list[Frame]] = []
+        entries: list[Frame] = []
+        self._collect_level_entries(node, up, entries)
+
+        in_flight = 0
+        while entries:
+            levels.append(entries)
+            in_flight += len(entries)
+            self.peak_in_flight = max(self.peak_in_flight, in_flight)
+            entries = await self._resolve_level(entries)
+
+        # deepest level first, frames (and collectors) of a level are released once it is done
+        while levels:
+            await self._post_level(levels.pop())
+
+    @classmethod
+    def _load_metadata(cls, root_class: type) -> tuple[Any, plan_util.PlanType]:
+        """get metadata and plans of root class from cache, scan it when missing"""
+        # Check cache with resolver class for isolation between different resolver configurations
+        cached = _get_metadata_from_cache(cls, root_class)
+        if cached is not None:
+            return cached
+
+        metadata = analysis.convert_metadata_key_as_kls(
+            analysis.Analytic(
+                er_pre_generator=getattr(cls, const.ER_DIAGRAM_PRE_GENERATOR)
+            ).scan(root_class)
+        )
+        return _set_metadata_to_cache(cls, root_class, metadata)
+
+    @classmethod
+    def warmup(cls, root_classes: list[type]) -> None:
+        """scan and cache metadata of root classes ahead of the first resolve, e.g. at startup"""
+        for root_class in root_classes:
+            if not METADATA_CACHE.contains(cls, root_class):
+                cls._load_metadata(root_class)
 
+    def _prepare(self, node: object) -> type:
+        """load metadata and plans of root class, create loader instances, return root class"""
         # by default pydantic-resolve will deduce the root class from input node
         # but in some scenario like Union types, it is unable to deduce the root class
         # so user can provide the root class by annotation parameter
         root_class = self.annotation if self.annotation else class_util.get_class_of_object(node)
-        resolver_class_id = id(self.__class__)
+        self.metadata, self.plans = self._load_metadata(root_class)
 
-        # Check cache with resolver_class_id for isolation between different resolver configurations
-        cached_metadata = _get_metadata_from_cache(resolver_class_id, root_class)
-        if cached_metadata:
-            self.metadata = cached_metadata
-        else:
-            metadata = analysis.convert_metadata_key_as_kls(
-                analysis.Analytic(
-                    er_pre_generator=getattr(self, const.ER_DIAGRAM_PRE_GENERATOR)
-                ).scan(root_class)
-            )
-            _set_metadata_to_cache(resolver_class_id, root_class, metadata)
-            self.metadata = metadata
+        query_fields = None
+        if self.include is not None or self.exclude is not None:
+            selection = selection_util.select_fields(root_class, self.plans, self.include, self.exclude)
+            self.plans = selection_util.narrow_plans(self.plans, selection)
+            self.metadata = selection_util.narrow_metadata(self.metadata, selection)
+            query_fields = selection_util.query_fields(selection)
 
         self.loader_instance_cache = pydantic_resolve.loader_manager.validate_and_create_loader_instance(
             self.loader_params,
@@ -479,17 +898,338 @@ class Resolver:
             self.loader_instances,
             self.metadata,
             self.context,
-            split_loader_by_type=self.split_loader_by_type)
+            split_loader_by_type=self.split_loader_by_type,
+            store=self._loader_store,
+            query_fields=query_fields)
         
         has_context = analysis.has_context(self.metadata)
         if has_context and self.context is None:
             raise AttributeError('context is missing')
 
-        self.ancestor_list = contextvars.ContextVar('ancestor_list', default=None)
-            
-        await self._traverse(node, None)
+        self._install_subtree_hooks()
+
+        self.stats = stats_util.ResolverStats()
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._cpu_queues = {}
+        self._release_lazy_scope()
+        for path, instance in self._iter_loader_instances():
+            stats_util.instrument_loader(instance)
+            getattr(instance, stats_util.LOADER_STATS_ATTR)[self.stats] = self.stats.loader(path)
+
+        if self.tracer is not None:
+            self._trace = self.tracer.begin()
+            if self._trace is not None:
+                for path, instance in self._iter_loader_instances():
+                    tracing_util.instrument_loader(instance, path)
+                    getattr(instance, tracing_util.LOADER_TRACE_ATTR).add(self._trace)
+
+        return root_class
+
+    def _install_subtree_hooks(self) -> None:
+        """loaders of @recursive methods may answer the whole subtree with batch_load_subtree"""
+        for kls_plan in self.plans.values():
+            if not kls_plan.recursive:
+                continue
+            for step in kls_plan.resolve_steps:
+                if step.recursion is None:
+                    continue
+                for _, loader_path, type_key in step.binder.loaders:
+                    instance = self._get_loader_instance(loader_path, type_key)
+                    recursion_util.install_subtree_hook(instance, step.recursion.max_depth)
+
+    async def _run(self, node: T) -> T:
+        # loaders shared in a ResolverSession count loads into the resolve of current task
+        stats_token = stats_util.current_stats.set(self.stats)
+        trace_token = tracing_util.current_trace.set(self._trace)
+        try:
+            if self.engine == const.ENGINE_LEVEL:
+                await self._traverse_by_level(node)
+            else:
+                await self._traverse(node, ROOT_FRAME)
+        finally:
+            tracing_util.current_trace.reset(trace_token)
+            stats_util.current_stats.reset(stats_token)
+        return node
+
+    def _iter_loader_instances(self):
+        for path, entry in self.loader_instance_cache.items():
+            instances = entry.values() if self.split_loader_by_type else (entry,)
+            for instance in instances:
+                yield path, instance
+
+    def _finish(self):
+        """report debug profile, detach stats, export trace"""
+        # instances of a ResolverSession may still be used by other resolvers
+        for _, instance in self._iter_loader_instances():
+            getattr(instance, stats_util.LOADER_STATS_ATTR).pop(self.stats, None)
 
         if self.debug:
             self.performance.report()
+            profile_util.profile_logger.debug(f'peak in-flight nodes: {self.peak_in_flight}')
+            profile_util.profile_logger.debug('\n' + repr(self.stats))
+
+        trace = self._trace
+        if trace is not None:
+            self._trace = None
+            for _, instance in self._iter_loader_instances():
+                getattr(instance, tracing_util.LOADER_TRACE_ATTR).discard(trace)
+            self.spans = self.tracer.finish(trace)  # type: ignore
+
+    async def resolve(self, node: T) -> T:
+        if isinstance(node, list) and node == []:
+            return node
+
+        self._prepare(node)
+        try:
+            await self._run(node)
+        finally:
+            self._finish()
+
+        return node
+
+    async def resolve_to_json(self, node: object, **dump_kwargs) -> bytes:
+        """
+        resolve node, then serialize it straight to json bytes with pydantic-core (see `dump_json`),
+        skipping the `model_dump(mode='json')` dict. dump_kwargs are passed to TypeAdapter.dump_json.
+        """
+        node = await self.resolve(node)
+        return conversion_util.dump_json(node, self.annotation, **dump_kwargs)
+
+    async def refresh(self, node: T, dirty: Iterable[object | tuple[object, str]]) -> T:
+        """
+        incrementally re-resolve a tree which has been resolved before.
+
+        dirty items are nodes of the tree (all their resolve_ methods re-run) or
+        (node, field) pairs (only resolve_<field> re-runs). new values are resolved
+        as usual, then post methods, post default handler and collectors re-run on
+        the dirty nodes and their ancestors, up to the root. other subtrees are
+        left untouched, they only send their collected values again when an
+        ancestor on the path declares collectors.
+
+        subtrees below dirty nodes which are not re-resolved, and descendants reading
+        `parent` / `ancestor_context` of a changed node, are not refreshed.
+        """
+        if isinstance(node, list) and node == []:
+            return node
+
+        self._prepare(node)
+        try:
+            targets: dict[int, set[str] | None] = {}
+            for item in dirty:
+                if isinstance(item, tuple):
+                    target, field = item
+                    kls_plan = self._get_plan(target)
+                    if kls_plan is None or all(step.field != field for step in kls_plan.resolve_steps):
+                        raise ResolverTargetAttrNotFound(
+                            f'{target.__class__.__name__} has no resolve method for "{field}"')
+                    fields = targets.setdefault(id(target), set())
+                    if fields is not None:
+                        fields.add(field)
+                else:
+                    targets[id(item)] = None
+
+            on_path: set[int] = set()
+            self._mark_dirty_paths(node, targets, on_path)
+            missing = targets.keys() - on_path
+            if missing:
+                raise ValueError(f'{len(missing)} dirty node(s) not found in the tree')
+
+            await self._refresh(node, ROOT_FRAME, targets, on_path)
+        finally:
+            self._finish()
+        return node
+
+    def _iter_child_values(self, node: object, kls_plan: plan_util.KlsPlan):
+        for step in kls_plan.resolve_steps:
+            if step.traverse:
+                yield step.field, getattr(node, step.field)
+        for field in kls_plan.object_fields:
+            yield field, getattr(node, field)
+
+    def _mark_dirty_paths(self, node: object, targets: dict, out: set[int]) -> bool:
+        """add ids of dirty nodes and their ancestors into out, return True if node is one of them"""
+        if isinstance(node, (list, tuple)):
+            found = False
+            for t in node:
+                if self._mark_dirty_paths(t, targets, out):
+                    found = True
+            return found
+
+        kls_plan = self.plans.get(node.__class__)
+        if kls_plan is None:
+            return False
+
+        found = id(node) in targets
+        for _, val in self._iter_child_values(node, kls_plan):
+            if self._mark_dirty_paths(val, targets, out):
+                found = True
+        if found:
+            out.add(id(node))
+        return found
+
+    def _collect_again(self, node: object, collectors: ScopeMap) -> None:
+        """send collected values of an untouched subtree into collectors of the path"""
+        if isinstance(node, (list, tuple)):
+            for t in node:
+                self._collect_again(t, collectors)
+            return
 
-        return node
\ No newline at end of file
+        kls_plan = self.plans.get(node.__class__)
+        if kls_plan is None or kls_plan.is_noop:
+            return
+
+        for _, val in self._iter_child_values(node, kls_plan):
+            self._collect_again(val, collectors)
+        if kls_plan.collect_items:
+            self._add_values_into_collectors(node, kls_plan, collectors)
+
+    async def _refresh(self, node: T, up: Frame, targets: dict, on_path: set[int]) -> T:
+        if isinstance(node, (list, tuple)):
+            tasks = []
+            for t in node:
+                if id(t) in on_path:
+                    tasks.append(self._refresh(t, up, targets, on_path))
+                elif up.collectors:
+                    self._collect_again(t, up.collectors)
+            await asyncio.gather(*tasks)
+            return node
+
+        if id(node) not in on_path:
+            if up.collectors:
+                self._collect_again(node, up.collectors)
+            return node
+
+        kls_plan: plan_util.KlsPlan = self._get_plan(node)  # type: ignore
+        frame = self._enter_frame(node, kls_plan, up)
+
+        rerun = set()
+        if id(node) in targets:
+            fields = targets[id(node)]
+            for step in kls_plan.resolve_steps:
+                if fields is not None and step.field not in fields:
+                    continue
+                recursion = step.recursion
+                if recursion is not None and recursion.max_depth is not None \
+                        and frame.recursion_depth() >= recursion.max_depth:
+                    continue
+                rerun.add(step.field)
+
+        tasks = [
+            self._execute_resolve_method_field(frame, step)
+            for step in kls_plan.resolve_steps if step.field in rerun]
+        for field, val in self._iter_child_values(node, kls_plan):
+            if field not in rerun:
+                tasks.append(self._refresh(val, frame, targets, on_path))
+        await asyncio.gather(*tasks)
+
+        if kls_plan.post_steps:
+            await asyncio.gather(*[
+                self._execute_post_method_field(frame, step)
+                for step in kls_plan.post_steps])
+
+        default_step = kls_plan.post_default
+        if default_step:
+            await _await_value(self._call_method(frame, default_step, tracing_util.KIND_POST))
+
+        if kls_plan.collect_items:
+            self._add_values_into_collectors(node, kls_plan, frame.collectors)
+        return node
+
+    async def resolve_iter(self, items: list[T], ordered: bool = False) -> AsyncIterator[T]:
+        """
+        resolve root items concurrently and yield each one as soon as its subtree,
+        post methods and collectors are done. dataloader instances are shared by all items.
+
+        ordered=True yields items in input order, otherwise in completion order.
+        with max_concurrency, items are started in windows of max_concurrency.
+        """
+        if not items:
+            return
+
+        items = list(items)
+        self._prepare(items)
+
+        try:
+            window = self.max_concurrency or len(items)
+            for i in range(0, len(items), window):
+                tasks = [asyncio.ensure_future(self._run(item)) for item in items[i:i + window]]
+                try:
+                    if ordered:
+                        for task in tasks:
+                            yield await task
+                    else:
+                        for future in asyncio.as_completed(tasks):
+                            yield await future
+                finally:
+                    # consumer may stop early, see contextlib.aclosing
+                    pending = [task for task in tasks if not task.done()]
+                    for task in pending:
+                        task.cancel()
+                    if pending:
+                        await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            self._finish()
+
+    def _clear_loader_cache(self):
+        for _, instance in self._iter_loader_instances():
+            instance.clear_all()
+
+    async def resolve_chunks(
+            self,
+            items: Iterable[T] | AsyncIterable[T],
+            chunk_size: int,
+            clear_cache: bool = False) -> AsyncIterator[list[T]]:
+        """
+        pull root items lazily from a sync or async iterable, resolve and yield them chunk by chunk.
+
+        metadata and loader instances are prepared with the first chunk and reused,
+        clear_cache=True clears dataloader caches after each chunk is consumed,
+        so memory stays flat for huge inputs.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(f'chunk_size should be a positive int, got {chunk_size!r}')
+
+        prepared = False
+        try:
+            async for chunk in _iter_chunks(items, chunk_size):
+                if not prepared:
+                    self._prepare(chunk)
+                    prepared = True
+
+                await self._run(chunk)
+                yield chunk
+
+                self._release_lazy_scope()
+                if clear_cache:
+                    self._clear_loader_cache()
+        finally:
+            # consumer may stop early or the source may raise
+            if prepared:
+                self._finish()
+
+    def resolve_sync(self, node: T) -> T:
+        """
+        resolve a tree which only has sync work, without event loop.
+
+        every class in the tree should have no resolve_ methods, and only plain (not async)
+        post_ methods / post_default_handler without dataloaders.
+        """
+        if isinstance(node, list) and node == []:
+            return node
+
+        root_class = self._prepare(node)
+
+        try:
+            # plans are built by _prepare, a rejected tree is finished as well (trace, stats)
+            for kls in class_util.get_core_types(root_class):
+                kls_plan = self.plans.get(kls)
+                if kls_plan is not None and not kls_plan.sync_subtree:
+                    raise TypeError(
+                        f'{kls_plan.kls_path} has async work (resolve_ methods, async post_ methods or dataloaders), '
+                        'use `await Resolver().resolve()` instead')
+
+            self._traverse_sync(node, ROOT_FRAME, strict=True)
+            return node
+        finally:
+            self._finish()
@@ -0,0 +1,60 @@
+from typing import Any, TypeVar
+
+from pydantic_resolve.loader_manager import LoaderStore
+from pydantic_resolve.resolver import Resolver
+
+T = TypeVar("T")
+
+
+class ResolverSession:
+    """
+    request scoped owner of DataLoader instances.
+
+    every resolve inside the session reuses the same loader instances and caches,
+    calls running concurrently (asyncio.gather) share dataloader batches.
+
+        async with ResolverSession(context={'user_id': 1}) as session:
+            page, sidebar = await asyncio.gather(
+                session.resolve(page),
+                session.resolve(sidebar))
+
+    `resolver_kwargs` are passed to every Resolver created by the session, loader
+    related options (loader_params, global_loader_param, loader_instances,
+    split_loader_by_type) take effect when an instance is created for the first time.
+    caches are cleared when the session exits.
+    """
+    def __init__(self, resolver_class: type[Resolver] = Resolver, **resolver_kwargs: Any):
+        self.resolver_class = resolver_class
+        self.resolver_kwargs = resolver_kwargs
+        self.loader_store = LoaderStore()
+
+    def resolver(self, **kwargs: Any) -> Resolver:
+        """create a Resolver bound to the session, kwargs override the session ones"""
+        resolver = self.resolver_class(**{**self.resolver_kwargs, **kwargs})
+        resolver._loader_store = self.loader_store
+        return resolver
+
+    async def resolve(self, node: T, **kwargs: Any) -> T:
+        return await self.resolver(**kwargs).resolve(node)
+
+    @property
+    def loader_instance_cache(self) -> dict:
+        """loader instances created so far, same layout as Resolver.loader_instance_cache"""
+        if self.resolver_kwargs.get('split_loader_by_type'):
+            return self.loader_store.instances
+        return {path: inner[()] for path, inner in self.loader_store.instances.items()}
+
+    def close(self) -> None:
+        self.loader_store.clear()
+
+    def __enter__(self) -> 'ResolverSession':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'ResolverSession':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
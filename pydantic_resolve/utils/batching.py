@@ -0,0 +1,108 @@
+"""
+Batch scheduling of DataLoader instances.
+
+aiodataloader dispatches the queued keys on the next event loop tick. Branches of
+an irregular tree reach the same loader at slightly different times, so it fires
+many small batches. A batch window holds the queue open a little longer:
+
+    class UserLoader(DataLoader):
+        batch_window = BatchWindow(delay_us=500, max_keys=1000)
+
+    # or
+    Resolver(loader_params={UserLoader: {'batch_window': BatchWindow(delay_us=500)}})
+
+- BatchWindow()                 dispatch on next tick (aiodataloader default)
+- BatchWindow(delay_us=N)       dispatch N microseconds after the first key is queued
+- BatchWindow(max_keys=K)       dispatch as soon as K keys are queued, else on next tick / after delay
+
+a longer delay means fewer, larger batches and more latency for the first key.
+
+batch size and concurrency limits, also by class attribute or loader_params:
+
+- max_batch_size          oversized batches are split into chunks, dispatched in parallel
+- max_concurrent_batches  at most N batch_load_fn calls of a loader path run at the same time
+"""
+import asyncio
+
+from aiodataloader import Loader as QueueItem, dispatch_queue
+
+import pydantic_resolve.constant as const
+
+
+class BatchWindow:
+    __slots__ = ('delay_us', 'max_keys')
+
+    def __init__(self, delay_us: int = 0, max_keys: int | None = None):
+        if not isinstance(delay_us, int) or delay_us < 0:
+            raise ValueError(f'delay_us should be a non-negative int, got {delay_us!r}')
+        if max_keys is not None and (not isinstance(max_keys, int) or max_keys < 1):
+            raise ValueError(f'max_keys should be a positive int, got {max_keys!r}')
+        self.delay_us = delay_us
+        self.max_keys = max_keys
+
+    @property
+    def is_tick(self) -> bool:
+        return self.delay_us == 0 and self.max_keys is None
+
+    def __repr__(self) -> str:
+        return f'BatchWindow(delay_us={self.delay_us}, max_keys={self.max_keys})'
+
+
+def apply_batch_window(loader, window: BatchWindow) -> None:
+    """replace do_resolve_reject of a DataLoader instance with one scheduled by window"""
+    if window.is_tick or getattr(loader, const.LOADER_BATCH_WINDOW_APPLIED, False):
+        return
+
+    delay = window.delay_us / 1_000_000
+    max_keys = window.max_keys
+    timer = [None]  # pending dispatch of current queue
+
+    def dispatch():
+        timer[0] = None
+        if loader._queue:
+            dispatch_queue(loader)
+
+    def next_tick():
+        # aiodataloader dispatches in a task scheduled by call_soon, keep the same timing
+        timer[0] = loader.loop.call_soon(dispatch)
+
+    def do_resolve_reject(key, future):
+        queue = loader._queue
+        queue.append(QueueItem(key=key, future=future))
+
+        if not loader.batch:
+            dispatch_queue(loader)
+        elif max_keys is not None and len(queue) >= max_keys:
+            if timer[0] is not None:
+                timer[0].cancel()
+                timer[0] = None
+            dispatch_queue(loader)
+        elif len(queue) == 1:
+            if delay:
+                timer[0] = loader.loop.call_later(delay, dispatch)
+            else:
+                timer[0] = loader.loop.call_soon(next_tick)
+
+    loader.do_resolve_reject = do_resolve_reject
+    setattr(loader, const.LOADER_BATCH_WINDOW_APPLIED, True)
+
+
+def validate_limit(name: str, value) -> int:
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise ValueError(f'{name} should be a positive int, got {value!r}')
+    return value
+
+
+def limit_concurrent_batches(loader, semaphore: asyncio.Semaphore) -> None:
+    """wrap batch_load_fn of a DataLoader instance, calls wait for a permit of semaphore"""
+    if getattr(loader, const.LOADER_CONCURRENCY_LIMITED, False):
+        return
+
+    batch_load_fn = loader.batch_load_fn
+
+    async def limited_batch_load_fn(keys):
+        async with semaphore:
+            return await batch_load_fn(keys)
+
+    loader.batch_load_fn = limited_batch_load_fn
+    setattr(loader, const.LOADER_CONCURRENCY_LIMITED, True)
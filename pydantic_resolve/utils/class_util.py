@@ -4,7 +4,7 @@ from typing import get_origin, get_args, Union
 import pydantic_resolve.constant as const
 import pydantic_resolve.utils.class_util as class_util
 from pydantic_resolve.analysis import is_acceptable_kls
-from pydantic_resolve.utils.types import get_type, get_core_types, _is_optional, _is_list, get_class_field_annotations
+from pydantic_resolve.utils.types import get_type, get_core_types, _is_optional, _is_list, get_class_field_annotations, get_model_fields, is_slots_dataclass
 from pydantic import BaseModel
 
 
@@ -53,11 +53,11 @@ def ensure_subset(base):
 
 
 def get_pydantic_field_items(kls):
-    return kls.model_fields.items()
+    return get_model_fields(kls).items()
 
 
 def get_pydantic_field_keys(kls) -> str:
-    return kls.model_fields.keys()
+    return get_model_fields(kls).keys()
 
 
 def get_pydantic_fields(kls):
@@ -99,6 +99,11 @@ def update_forward_refs(kls):
 
         if safe_issubclass(shelled_type, BaseModel):
             update_pydantic_forward_refs(shelled_type)
+        elif is_slots_dataclass(shelled_type):
+            # dataclass annotations are resolved when fields are read, only walk into them
+            setattr(shelled_type, const.PYDANTIC_FORWARD_REF_UPDATED, True)
+            for field in get_model_fields(shelled_type).values():
+                update_forward_refs(field.annotation)
 
 
 def get_kls_full_name(kls):
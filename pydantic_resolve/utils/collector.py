@@ -1,7 +1,9 @@
 import abc
+import copy
 from dataclasses import dataclass
 from typing import Any, Iterator
 import pydantic_resolve.constant as const
+from pydantic_resolve.utils.types import get_model_fields
 
 @dataclass
 class SendToInfo:
@@ -41,7 +43,7 @@ def pre_generate_collector_config(kls):
     setattr(kls, const.COLLECTOR_CONFIGURATION, collect_dict)
 
 def _get_pydantic_field_items_with_send_to(kls) -> Iterator[tuple[str, SendToInfo, type]]:
-    items = kls.model_fields.items()
+    items = get_model_fields(kls).items()
 
     for name, v in items:
         metadata = v.metadata
@@ -62,6 +64,14 @@ class ICollector(metaclass=abc.ABCMeta):
     def values(self) -> Any:
         """get result"""
 
+    def clone(self) -> 'ICollector':
+        """
+        create an empty collector with the same configuration.
+        called for each node which declares the collector, override it
+        if deepcopy of the prototype is expensive.
+        """
+        return copy.deepcopy(self)
+
 
 class Collector(ICollector):
     def __init__(self, alias: str, flat: bool=False):
@@ -79,4 +89,29 @@ class Collector(ICollector):
             self.val.append(val)
 
     def values(self) -> list[Any]:
-        return self.val
\ No newline at end of file
+        return self.val
+
+    def clone(self) -> 'Collector':
+        if type(self) is not Collector:  # subclass may hold extra configuration
+            return super().clone()
+        return Collector(self.alias, self.flat)
+
+
+class CollectorSlot:
+    """
+    collector of one node, the instance is cloned from prototype
+    only when a descendant sends the first value, or when post method asks for it.
+    """
+    __slots__ = ('proto', 'instance')
+
+    def __init__(self, proto: ICollector):
+        self.proto = proto
+        self.instance: ICollector | None = None
+
+    def get(self) -> ICollector:
+        if self.instance is None:
+            self.instance = self.proto.clone()
+        return self.instance
+
+    def add(self, val) -> None:
+        self.get().add(val)
\ No newline at end of file
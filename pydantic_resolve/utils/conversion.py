@@ -3,10 +3,11 @@ import functools
 import logging
 import types
 from inspect import iscoroutine
-from typing import Any, Callable
+from typing import Any, Callable, Union, get_args, get_origin
 from pydantic import BaseModel, ValidationError, TypeAdapter
 import pydantic_resolve.constant as const
 from pydantic_resolve.utils.class_util import safe_issubclass
+from pydantic_resolve.utils.types import get_model_fields, is_slots_dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +42,8 @@ def try_parse_data_to_target_field_type(
     _enable_from_attribute = True if enable_from_attribute else None 
 
     # 1. get type of target field
-    if isinstance(target, BaseModel):
-        _fields = target.__class__.model_fields
+    if isinstance(target, BaseModel) or is_slots_dataclass(target.__class__):
+        _fields = get_model_fields(target.__class__)
         field_type = _fields[field_name].annotation
 
         # handle optional logic
@@ -64,6 +65,136 @@ def try_parse_data_to_target_field_type(
         return data  #noqa
 
 
+def dump_json(value, annotation=None, **kwargs) -> bytes:
+    """
+    serialize a resolved tree straight to json bytes with pydantic-core,
+    without the intermediate dict of `model_dump(mode='json')`.
+
+    annotation is the class of the node (or of list items), deduced from value if not provided,
+    a list of mixed classes is dumped as a list of their union.
+    fields declared with Field(exclude=True) are left out, same as model_dump.
+    kwargs are passed to TypeAdapter.dump_json, e.g. by_alias, exclude_none.
+    """
+    if annotation is None:
+        if isinstance(value, list):
+            # dict.fromkeys keeps the order of classes, Union of one class is the class itself
+            classes = tuple(dict.fromkeys(item.__class__ for item in value))
+            annotation = list[Union[classes]] if classes else list[Any]  # type: ignore
+        else:
+            annotation = value.__class__
+    elif isinstance(value, list):
+        annotation = list[annotation]
+    return TypeAdapterManager.get(annotation).dump_json(value, **kwargs)
+
+
+# values of these types are returned as is by TypeAdapter when the field type is exactly the same
+_SCALAR_TYPES = (int, float, str, bool, bytes)
+
+
+def _get_trusted_type(tp) -> type | None:
+    """
+    return tp if an instance whose type is exactly tp can skip validation:
+    builtin scalars, and pydantic models / slots dataclasses which do not revalidate instances.
+    """
+    if tp in _SCALAR_TYPES:
+        return tp
+    if safe_issubclass(tp, BaseModel) and tp.model_config.get('revalidate_instances', 'never') == 'never':
+        return tp
+    if is_slots_dataclass(tp) and getattr(tp, '__pydantic_config__', {}).get('revalidate_instances', 'never') == 'never':
+        return tp
+    return None
+
+
+def _get_trusted_types(tp) -> tuple[tuple[type, ...], tuple[type, ...]]:
+    """
+    analyze field annotation, return (trusted types, trusted list item types)
+
+    - T              -> ((T,), ())
+    - T | None       -> ((T,), ())
+    - list[T]        -> ((), (T,))
+    - list[T] | None -> ((), (T,))
+    """
+    origin = get_origin(tp)
+    if origin is Union or origin is types.UnionType:
+        members = [a for a in get_args(tp) if a is not type(None)]
+        if len(members) != 1:
+            return (), ()
+        tp = members[0]
+        origin = get_origin(tp)
+
+    if origin is list:
+        args = get_args(tp)
+        item_type = _get_trusted_type(args[0]) if len(args) == 1 else None
+        return (), ((item_type,) if item_type else ())
+
+    trusted = _get_trusted_type(tp)
+    return ((trusted,) if trusted else ()), ()
+
+
+class FieldConverter:
+    """
+    precomputed version of try_parse_data_to_target_field_type for one (class, field),
+    created once when execution plans are compiled.
+
+    values whose type is exactly the field type (or list of them) skip TypeAdapter validation.
+    """
+    __slots__ = ('field_name', 'field_type', 'optional', 'trusted_types', 'trusted_item_types')
+
+    def __init__(self, kls: type, field_name: str):
+        field = get_model_fields(kls)[field_name]
+        self.field_name = field_name
+        self.field_type = field.annotation
+        self.optional = not field.is_required()
+        self.trusted_types, self.trusted_item_types = _get_trusted_types(self.field_type)
+
+    def _is_trusted(self, data) -> bool:
+        if type(data) in self.trusted_types:
+            return True
+        if self.trusted_item_types and type(data) is list:
+            item_types = self.trusted_item_types
+            return all(type(d) in item_types for d in data)
+        return False
+
+    def _validate(self, adapter: TypeAdapter, data, enable_from_attribute: bool):
+        # from_attribute by default is None
+        # if set False it will fail when dealing with namedtuple
+        try:
+            return adapter.validate_python(data, from_attributes=True if enable_from_attribute else None)
+        except ValidationError as e:
+            logger.warning(f'Type mismatch for field "{self.field_name}", expected: {self.field_type}')
+            raise e
+
+    def convert(self, data, enable_from_attribute=False):
+        if data is None and self.optional:
+            return data
+        if self._is_trusted(data):
+            # list is copied, same as what TypeAdapter returns
+            return list(data) if type(data) is list else data
+        return self._validate(TypeAdapterManager.get(self.field_type), data, enable_from_attribute)
+
+    def convert_many(self, datas: list, enable_from_attribute=False) -> list:
+        """convert values of the same field of many nodes, untrusted values are validated in one call"""
+        results = list(datas)
+        pending = []
+        for i, data in enumerate(datas):
+            if data is None and self.optional:
+                continue
+            if self._is_trusted(data):
+                results[i] = list(data) if type(data) is list else data
+            else:
+                pending.append(i)
+
+        if len(pending) == 1:
+            i = pending[0]
+            results[i] = self.convert(datas[i], enable_from_attribute)
+        elif pending:
+            adapter = TypeAdapterManager.get(list[self.field_type])  # type: ignore
+            values = self._validate(adapter, [datas[i] for i in pending], enable_from_attribute)
+            for i, val in zip(pending, values):
+                results[i] = val
+        return results
+
+
 def _get_mapping_rule(target, source) -> Callable | None:
     # do nothing
     if isinstance(source, target):
@@ -0,0 +1,174 @@
+"""
+Methods offloaded from the event loop.
+
+@cpu_bound: CPU-heavy post_ methods, run in a thread or process pool by batches.
+
+    class Article(BaseModel):
+        body: str
+
+        html: str = ''
+        @cpu_bound(batch_size=32)
+        def post_html(self):
+            return render_markdown(self.body)
+
+    await Resolver(executor=ProcessPoolExecutor()).resolve(articles)
+
+- calls of a cpu_bound method issued in the same tick (the nodes of one level with
+  engine='level', siblings finishing together with the recursive engine) are queued,
+  then submitted in chunks of batch_size, one executor job per chunk.
+- without `Resolver(executor=...)` the default executor of the event loop (threads) is used.
+- the method should be a plain function which only computes its return value, with a
+  process pool it runs on a pickled copy of the node, so the node and its parameters
+  (parent, ancestor_context, collected values...) should be picklable.
+- queue time (submitted -> job started by a worker) and run time of each chunk are
+  recorded in `resolver.stats.executor`, and as `executor` spans of a traced resolve.
+
+@blocking: sync resolve_ methods doing blocking I/O (sync DB sessions, file reads), run one
+call per job in a thread pool, so they no longer stall the loop and run in parallel.
+
+    @blocking  # or on a single method, or Resolver(blocking=True) for all of them
+    class Report(BaseModel):
+        id: int
+
+        rows: list[Row] = []
+        def resolve_rows(self):
+            return legacy_session.query(...).all()
+
+    await Resolver(blocking_executor=ThreadPoolExecutor(8)).resolve(reports)
+
+- without `Resolver(blocking_executor=...)` the default executor of the event loop is used,
+  it is bounded (see ThreadPoolExecutor max_workers).
+- async methods and methods with DataLoader parameters (load() only queues a key)
+  always run on the event loop.
+- the call runs in a copy of the current contextvars context.
+- return values flow through conversion, resolved hooks and traversal as usual.
+"""
+import asyncio
+import contextvars
+import time
+from functools import partial
+from inspect import iscoroutinefunction
+from time import perf_counter_ns
+from types import MappingProxyType
+
+import pydantic_resolve.constant as const
+from pydantic_resolve.utils.stats import ExecutorStats
+from pydantic_resolve.utils.tracing import KIND_EXECUTOR
+
+
+class CpuBoundConfig:
+    __slots__ = ('batch_size',)
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+
+    def __repr__(self) -> str:
+        return f'CpuBoundConfig(batch_size={self.batch_size})'
+
+
+def cpu_bound(batch_size: int = 32):
+    """mark a post_ method to run in the executor of Resolver, batch_size calls per job"""
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError(f'batch_size should be a positive int, got {batch_size!r}')
+
+    def inner(fn):
+        name = fn.__name__
+        if not name.startswith(const.POST_PREFIX) or name == const.POST_DEFAULT_HANDLER:
+            raise TypeError(f'{fn.__qualname__} is not a post_ method, only post_ methods can be cpu_bound')
+        if iscoroutinefunction(fn):
+            raise TypeError(f'{fn.__qualname__} is async, only plain functions can be cpu_bound')
+        setattr(fn, const.CPU_BOUND_CONFIGURATION, CpuBoundConfig(batch_size))
+        return fn
+    return inner
+
+
+def blocking(target):
+    """
+    mark a plain resolve_ method, or every plain resolve_ method of a class,
+    to run in the blocking executor of Resolver.
+    """
+    if isinstance(target, type):
+        setattr(target, const.BLOCKING_CONFIGURATION, True)
+        return target
+
+    if not target.__name__.startswith(const.RESOLVE_PREFIX):
+        raise TypeError(f'{target.__qualname__} is not a resolve_ method, only resolve_ methods can be blocking')
+    if iscoroutinefunction(target):
+        raise TypeError(f'{target.__qualname__} is async, only plain functions can be blocking')
+    setattr(target, const.BLOCKING_CONFIGURATION, True)
+    return target
+
+
+def run_blocking(executor, fn, **kwargs) -> asyncio.Future:
+    """call fn(**kwargs) in executor, within a copy of current context"""
+    ctx = contextvars.copy_context()
+    return asyncio.get_running_loop().run_in_executor(executor, partial(ctx.run, fn, **kwargs))
+
+
+def _run_chunk(calls: list[tuple[object, str, dict]]) -> tuple[int, int, list]:
+    """executed by a worker, returns (start, end, [(ok, value or exception), ...])"""
+    start = time.time_ns()
+    results = []
+    for node, method_name, kwargs in calls:
+        try:
+            results.append((True, getattr(node, method_name)(**kwargs)))
+        except Exception as e:
+            results.append((False, e))
+    return start, time.time_ns(), results
+
+
+class CpuBoundQueue:
+    """pending calls of one cpu_bound method in one resolve, dispatched once per tick"""
+
+    def __init__(self, executor, batch_size: int, name: str, stats: ExecutorStats, trace=None):
+        self.executor = executor
+        self.batch_size = batch_size
+        self.name = name
+        self.stats = stats
+        self.trace = trace
+        self.queue: list[tuple[tuple, asyncio.Future]] = []
+
+    def submit(self, node: object, method_name: str, kwargs: dict) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if not self.queue:
+            loop.call_soon(self._dispatch, loop)
+
+        # MappingProxyType (context) can not be pickled
+        kwargs = {k: dict(v) if isinstance(v, MappingProxyType) else v for k, v in kwargs.items()}
+        future = loop.create_future()
+        self.queue.append(((node, method_name, kwargs), future))
+        return future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        queue, self.queue = self.queue, []
+        for i in range(0, len(queue), self.batch_size):
+            loop.create_task(self._run(loop, queue[i:i + self.batch_size]))
+
+    async def _run(self, loop: asyncio.AbstractEventLoop, chunk: list) -> None:
+        submitted = time.time_ns()
+        span_start = perf_counter_ns()
+        try:
+            start, end, results = await loop.run_in_executor(
+                self.executor, _run_chunk, [call for call, _ in chunk])
+        except Exception as e:  # e.g. pickling error, broken pool
+            for _, future in chunk:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        queue_ns = max(start - submitted, 0)
+        self.stats.add_batch(len(chunk), queue_ns, end - start)
+        if self.trace is not None:
+            self.trace.add(self.name, KIND_EXECUTOR, span_start, perf_counter_ns(), {
+                'pydantic_resolve.method': self.name,
+                'pydantic_resolve.batch_size': len(chunk),
+                'pydantic_resolve.queue_ns': queue_ns,
+            })
+
+        for (_, future), (ok, value) in zip(chunk, results):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
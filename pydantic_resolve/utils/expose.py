@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Iterator
 import pydantic_resolve.constant as const
+from pydantic_resolve.utils.types import get_model_fields
 
 @dataclass
 class ExposeInfo:
@@ -32,7 +33,7 @@ def pre_generate_expose_config(kls):
     setattr(kls, const.EXPOSE_TO_DESCENDANT, expose_dict)
 
 def _get_pydantic_field_items_with_expose_as(kls) -> Iterator[tuple[str, ExposeInfo, type]]:
-    items = kls.model_fields.items()
+    items = get_model_fields(kls).items()
 
     for name, v in items:
         metadata = v.metadata
@@ -0,0 +1,33 @@
+"""
+Lazy (on demand) resolve fields.
+
+    class Post(BaseModel):
+        id: int
+
+        comments: list[Comment] = []
+        @lazy
+        def resolve_comments(self, loader=Loader(CommentLoader)):
+            return loader.load(self.id)
+
+        hot: bool = False
+        async def post_hot(self, load_field):
+            if self.id in featured:
+                return len(await load_field('comments')) > 10
+            return False
+
+- lazy fields are skipped by traversal, and resolved only when asked by:
+    - a post_ method, with the `load_field` parameter: `await load_field('comments')`
+    - a collector, a field sent to collectors (SendTo) is resolved with the node
+    - `await resolver.load_field(node, 'comments')` after resolve
+- the value is converted and traversed like other resolve fields, requests of the same
+  tick share the DataLoader batch, concurrent requests of one node share one task.
+"""
+import pydantic_resolve.constant as const
+
+
+def lazy(fn):
+    """mark a resolve_ method as lazy"""
+    if not fn.__name__.startswith(const.RESOLVE_PREFIX):
+        raise TypeError(f'{fn.__qualname__} is not a resolve_ method, only resolve_ methods can be lazy')
+    setattr(fn, const.LAZY_CONFIGURATION, True)
+    return fn
@@ -0,0 +1,145 @@
+"""
+Cross-request cache of DataLoader batch results.
+
+aiodataloader caches per loader instance, and loader instances live as long as
+one Resolver. A result cache is shared across resolves, it is attached to
+selected loader classes:
+
+    class CurrencyLoader(DataLoader):
+        result_cache = MemoryLoaderCache(maxsize=10_000, ttl=300)
+
+    # or
+    Resolver(loader_params={CurrencyLoader: {'result_cache': cache}})
+
+keys are (loader path, key, _query_meta fields), for each batch only the missed
+keys are passed to the original batch_load_fn, in one call.
+
+values are shared between requests as they are, loaders with a result cache
+should return plain data (dict, tuple...) which will be validated into new
+objects, not objects which are mutated later.
+"""
+import abc
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import pydantic_resolve.constant as const
+
+MISSING: Any = object()
+
+
+class LoaderCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+
+
+class ILoaderCache(metaclass=abc.ABCMeta):
+    """
+    backend protocol, implement get_many / set_many (e.g. with redis MGET / pipelined SETEX),
+    hit / miss counters are maintained by the caller.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @abc.abstractmethod
+    async def get_many(self, keys: list[tuple]) -> list[Any]:
+        """return values in the order of keys, MISSING for keys not found"""
+
+    @abc.abstractmethod
+    async def set_many(self, items: dict[tuple, Any]) -> None:
+        """store values"""
+
+    def __len__(self) -> int:
+        return 0
+
+    def cache_info(self) -> LoaderCacheInfo:
+        return LoaderCacheInfo(self.hits, self.misses, self.evictions, len(self))
+
+
+class MemoryLoaderCache(ILoaderCache):
+    """in-process LRU cache, with optional ttl (seconds)"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        if maxsize < 1:
+            raise ValueError(f'maxsize should be a positive int, got {maxsize!r}')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[tuple, tuple[float | None, Any]] = OrderedDict()
+
+    async def get_many(self, keys: list[tuple]) -> list[Any]:
+        now = time.monotonic()
+        values = []
+        for key in keys:
+            item = self._data.get(key)
+            if item is None:
+                values.append(MISSING)
+                continue
+            expire_at, value = item
+            if expire_at is not None and expire_at <= now:
+                del self._data[key]
+                values.append(MISSING)
+                continue
+            self._data.move_to_end(key)
+            values.append(value)
+        return values
+
+    async def set_many(self, items: dict[tuple, Any]) -> None:
+        expire_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        for key, value in items.items():
+            self._data[key] = (expire_at, value)
+            self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _get_query_fields(loader) -> tuple:
+    query_meta = getattr(loader, '_query_meta', None)
+    if not query_meta:
+        return ()
+    return tuple(sorted(query_meta.get('fields', ())))
+
+
+def attach_result_cache(loader, path: str, cache: ILoaderCache) -> None:
+    """wrap batch_load_fn of loader instance, serve cached keys and load the missed ones in one call"""
+    if getattr(loader, const.LOADER_RESULT_CACHE_ATTACHED, False):
+        return
+
+    batch_load_fn = loader.batch_load_fn
+
+    async def cached_batch_load_fn(keys):
+        fields = _get_query_fields(loader)  # _query_meta is assigned after instance is created
+        cache_keys = [(path, key, fields) for key in keys]
+        values = await cache.get_many(cache_keys)
+
+        missed = [i for i, value in enumerate(values) if value is MISSING]
+        cache.hits += len(keys) - len(missed)
+        cache.misses += len(missed)
+
+        if missed:
+            loaded = list(await batch_load_fn([keys[i] for i in missed]))
+            if len(loaded) != len(missed):
+                return loaded  # let DataLoader report the length mismatch
+            new_items = {}
+            for i, value in zip(missed, loaded):
+                values[i] = value
+                if not isinstance(value, Exception):
+                    new_items[cache_keys[i]] = value
+            if new_items:
+                await cache.set_many(new_items)
+        return values
+
+    loader.batch_load_fn = cached_batch_load_fn
+    setattr(loader, const.LOADER_RESULT_CACHE_ATTACHED, True)
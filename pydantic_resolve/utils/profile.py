@@ -1,7 +1,6 @@
 import logging
-import time
 import math
-from uuid import uuid1
+from time import perf_counter_ns
 
 profile_logger = logging.getLogger(__name__)
 
@@ -34,17 +33,13 @@ class Timer():
         self.name = name
         self._max = 0
         self._min = math.inf
-        self.timeset = {} 
         self.records = []
     
-    def start(self):
-        id = uuid1()
-        self.timeset[id] = time.time()
-        return id
+    def start(self) -> int:
+        return perf_counter_ns()
     
-    def end(self, id: str):
-        start = self.timeset[id]
-        t = self.to_ms(time.time() - start)
+    def end(self, start: int):
+        t = self.to_ms(perf_counter_ns() - start)
 
         self.records.append(t)
         self._max = max(self._max, t)
@@ -66,7 +61,7 @@ class Timer():
         return self._min
     
     def to_ms(self, t):
-        return t * 1000
+        return t / 1_000_000
     
     def __repr__(self) -> str:
         return f'avg: {self.average:.1f}ms, max: {self.max:.1f}ms, min: {self.min:.1f}ms'
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+Self-referential relationships (comment threads, category trees).
+
+    class Comment(BaseModel):
+        id: int
+        replies: list['Comment'] = []
+
+        @recursive(max_depth=3)
+        def resolve_replies(self, loader=Loader(RepliesLoader)):
+            return loader.load(self.id)
+
+- depth is the number of ancestors of the same class, resolve_replies is not
+  called for nodes at depth >= max_depth, the field keeps its default value.
+- nodes of a recursive class are walked level by level, resolve methods of one
+  depth run together, and the queue of their loaders is held until each call has
+  loaded from it or finished (see LevelGate), so the loader gets one batch per depth.
+- a loader may implement `batch_load_subtree(keys, max_depth)` to answer all
+  levels at once (e.g. one recursive CTE), see `install_subtree_hook`.
+"""
+from asyncio import isfuture
+from contextvars import ContextVar
+from inspect import iscoroutine
+
+from aiodataloader import Loader as QueueItem, dispatch_queue
+
+import pydantic_resolve.constant as const
+
+# recursive call running in current task, set by the resolver around the method call
+_current_call: ContextVar['RecursiveCall | None'] = ContextVar('pydantic_resolve_recursive_call', default=None)
+
+
+class RecursiveConfig:
+    __slots__ = ('max_depth',)
+
+    def __init__(self, max_depth: int | None):
+        self.max_depth = max_depth
+
+    def __repr__(self) -> str:
+        return f'RecursiveConfig(max_depth={self.max_depth})'
+
+
+def recursive(max_depth: int | None = None):
+    """mark a resolve method as a recursive relationship, max_depth None means unlimited"""
+    if max_depth is not None and (not isinstance(max_depth, int) or max_depth < 0):
+        raise ValueError(f'max_depth should be a non-negative int, got {max_depth!r}')
+
+    def inner(fn):
+        setattr(fn, const.RECURSIVE_CONFIGURATION, RecursiveConfig(max_depth))
+        return fn
+    return inner
+
+
+def install_subtree_hook(loader, max_depth: int | None) -> None:
+    """
+    answer batches of loader with `loader.batch_load_subtree(keys, max_depth)`.
+
+    the hook returns {key: value} for the requested keys and their descendants within
+    max_depth levels, include leaves (e.g. `[]`) so that they are not loaded again.
+    values of descendants are primed into the DataLoader cache, so the deeper levels
+    are served without batches. requested keys missing from the result fall back
+    to batch_load_fn.
+    """
+    hook = getattr(loader, const.LOADER_SUBTREE_HOOK, None)
+    if hook is None or getattr(loader, const.LOADER_SUBTREE_INSTALLED, False):
+        return
+
+    batch_load_fn = loader.batch_load_fn
+
+    async def subtree_batch_load_fn(keys):
+        values = dict(await hook(keys, max_depth))
+
+        requested = set(keys)
+        for key, value in values.items():
+            if key not in requested:
+                loader.prime(key, value)
+
+        missed = [key for key in keys if key not in values]
+        if missed:
+            values.update(zip(missed, await batch_load_fn(missed)))
+        return [values[key] for key in keys]
+
+    loader.batch_load_fn = subtree_batch_load_fn
+    setattr(loader, const.LOADER_SUBTREE_INSTALLED, True)
+
+
+class LevelGate:
+    """
+    holds the queue of a loader while recursive calls of a level are running,
+    dispatches it once every call has loaded from the loader or finished.
+
+    calls of levels running at the same time share the gate of the loader.
+    """
+    __slots__ = ('loader', 'pending')
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.pending = 0
+
+    def settle(self) -> None:
+        self.pending -= 1
+        if self.pending > 0:
+            return
+        loader = self.loader
+        if getattr(loader, const.LOADER_LEVEL_GATE, None) is self:
+            setattr(loader, const.LOADER_LEVEL_GATE, None)
+        if loader._queue:
+            dispatch_queue(loader)
+
+
+class RecursiveCall:
+    """one call of a @recursive resolve method, settles each gate once"""
+    __slots__ = ('gates',)
+
+    def __init__(self, gates: list[LevelGate]):
+        self.gates = gates
+        for gate in gates:
+            gate.pending += 1
+
+    def loaded(self, gate: LevelGate) -> None:
+        if gate in self.gates:
+            self.gates.remove(gate)
+            gate.settle()
+
+    def finish(self) -> None:
+        gates, self.gates = self.gates, []
+        for gate in gates:
+            gate.settle()
+
+    def run(self, fn, *args, **kwargs):
+        """call fn with self as current call, finish unless it returns a coroutine"""
+        token = _current_call.set(self)
+        try:
+            val = fn(*args, **kwargs)
+        except BaseException:
+            self.finish()
+            raise
+        finally:
+            _current_call.reset(token)
+        if not iscoroutine(val):
+            self.finish()
+        return val
+
+    async def wait(self, val):
+        """await coroutine returned by run, in its own task"""
+        _current_call.set(self)
+        try:
+            while iscoroutine(val) or isfuture(val):
+                val = await val
+            return val
+        finally:
+            self.finish()
+
+
+def open_gate(loader) -> LevelGate:
+    """return the active gate of loader, or hold its queue with a new one"""
+    gate = getattr(loader, const.LOADER_LEVEL_GATE, None)
+    if gate is not None:
+        return gate
+
+    _install_gate(loader)
+    gate = LevelGate(loader)
+    setattr(loader, const.LOADER_LEVEL_GATE, gate)
+    return gate
+
+
+def _install_gate(loader) -> None:
+    if getattr(loader, const.LOADER_LEVEL_GATE_INSTALLED, False):
+        return
+
+    load = loader.load
+    do_resolve_reject = loader.do_resolve_reject
+
+    def gated_load(key):
+        future = load(key)
+        gate = getattr(loader, const.LOADER_LEVEL_GATE)
+        if gate is not None:
+            call = _current_call.get()
+            if call is not None:
+                call.loaded(gate)  # after the key is queued, it may release the gate
+        return future
+
+    def gated_do_resolve_reject(key, future):
+        if getattr(loader, const.LOADER_LEVEL_GATE) is None:
+            return do_resolve_reject(key, future)
+        loader._queue.append(QueueItem(key=key, future=future))
+
+    loader.load = gated_load
+    loader.do_resolve_reject = gated_do_resolve_reject
+    setattr(loader, const.LOADER_LEVEL_GATE, None)
+    setattr(loader, const.LOADER_LEVEL_GATE_INSTALLED, True)
@@ -0,0 +1,158 @@
+"""
+Field selection of Resolver(include=..., exclude=...).
+
+specs are nested like the ones of pydantic `model_dump`, a set of field names, or a dict
+whose values are True (the whole field) or the spec of the field's own class:
+
+    Resolver(include={'id': True, 'tasks': {'title', 'owner'}})
+    Resolver(exclude={'tasks': {'owner'}})
+
+- a spec of a list field applies to every element.
+- unselected fields keep their values: their resolve_ / post_ methods are not called,
+  their subtree is not traversed, loaders used only by them are not created.
+- specs are paths, plans are per class, a class reached by several paths resolves
+  the union of their selections.
+- post_default_handler, expose and collect declarations are kept.
+"""
+from typing import Any
+
+from pydantic_resolve import plan as plan_util
+from pydantic_resolve.analysis import MappedMetaType
+from pydantic_resolve.exceptions import ResolverTargetAttrNotFound
+from pydantic_resolve.utils.types import get_core_types, get_model_fields, get_type
+
+IncEx = set[str] | dict[str, Any]
+
+# value of `selection[kls]` when every field of kls is selected
+ALL = None
+
+
+def _normalize(spec: IncEx | None, where: str) -> dict[str, Any] | None:
+    if spec is None:
+        return None
+    if isinstance(spec, (set, frozenset, list, tuple)):
+        return {field: True for field in spec}
+    if isinstance(spec, dict):
+        return spec
+    raise TypeError(f'{where} should be a set or a dict of field names, got {spec!r}')
+
+
+def _child_classes(kls: type, field: str, plans: plan_util.PlanType) -> list[type]:
+    return [t for t in get_core_types(get_type(get_model_fields(kls)[field])) if t in plans]
+
+
+def select_fields(
+        root_class: type,
+        plans: plan_util.PlanType,
+        include: IncEx | None,
+        exclude: IncEx | None) -> dict[type, set[str] | None]:
+    """
+    validate specs against the fields of classes from root_class,
+    return selected fields per reached class (ALL if every field is selected).
+    """
+    selection: dict[type, set[str] | None] = {}
+
+    def walk_all(kls: type) -> None:
+        if kls in selection and selection[kls] is ALL:
+            return
+        selection[kls] = ALL
+        for field in get_model_fields(kls):
+            for child in _child_classes(kls, field, plans):
+                walk_all(child)
+
+    def walk(kls: type, inc: IncEx | None, exc: IncEx | None, where: str) -> None:
+        inc_map = _normalize(inc, where)
+        exc_map = _normalize(exc, where)
+        if inc_map is None and exc_map is None:
+            walk_all(kls)
+            return
+
+        fields = get_model_fields(kls)
+        for spec_map in (inc_map, exc_map):
+            for field in spec_map or ():
+                if field not in fields:
+                    raise ResolverTargetAttrNotFound(f'{where}: {kls.__name__}.{field} not found')
+
+        chosen = set(fields) if inc_map is None else {f for f, sub in inc_map.items() if sub}
+        if exc_map:
+            chosen -= {f for f, sub in exc_map.items() if sub is True}
+
+        current = selection.get(kls, set())
+        if current is not ALL:
+            current.update(chosen)  # type: ignore
+            selection[kls] = ALL if current == set(fields) else current
+
+        for field in chosen:
+            sub_inc = None if inc_map is None or inc_map[field] is True else inc_map[field]
+            sub_exc = exc_map.get(field) if exc_map else None
+            children = _child_classes(kls, field, plans)
+            if (sub_inc is not None or sub_exc is not None) and not children:
+                raise ResolverTargetAttrNotFound(f'{where}: {kls.__name__}.{field} has no nested fields to select')
+            for child in children:
+                walk(child, sub_inc, sub_exc, f'{where}.{field}')
+
+    for kls in get_core_types(root_class):
+        if kls in plans:
+            walk(kls, include, exclude, kls.__name__)
+    return selection
+
+
+def narrow_plans(plans: plan_util.PlanType, selection: dict[type, set[str] | None]) -> plan_util.PlanType:
+    """plans without resolve_ / post_ steps and object fields of unselected fields"""
+    narrowed = dict(plans)
+    for kls, fields in selection.items():
+        if fields is ALL:
+            continue
+        kls_plan = plans[kls]
+        narrowed[kls] = plan_util.KlsPlan(
+            kls=kls_plan.kls,
+            kls_path=kls_plan.kls_path,
+            resolve_steps=tuple(s for s in kls_plan.resolve_steps if s.field in fields),
+            object_fields=tuple(f for f in kls_plan.object_fields if f in fields),
+            post_steps=tuple(s for s in kls_plan.post_steps if s.field in fields),
+            post_default=kls_plan.post_default,
+            expose_items=kls_plan.expose_items,
+            collect_items=kls_plan.collect_items,
+            collector_protos=kls_plan.collector_protos,
+            should_traverse=kls_plan.should_traverse,
+            sync_subtree=kls_plan.sync_subtree,
+            lazy_steps=tuple(step for field, step in kls_plan.lazy_steps.items() if field in fields))
+    return narrowed
+
+
+def narrow_metadata(metadata: MappedMetaType, selection: dict[type, set[str] | None]) -> MappedMetaType:
+    """metadata without resolve_ / post_ methods of unselected fields, loaders are created from it"""
+    narrowed = dict(metadata)
+    for kls, fields in selection.items():
+        if fields is ALL:
+            continue
+        kls_meta = metadata[kls]
+        resolve_params = {
+            method: params for method, params in kls_meta['resolve_params'].items()
+            if params['trim_field'] in fields}
+        post_params = {
+            method: params for method, params in kls_meta['post_params'].items()
+            if params['trim_field'] in fields}
+        narrowed[kls] = {
+            **kls_meta,
+            'resolve': list(resolve_params),
+            'resolve_params': resolve_params,
+            'post': list(post_params),
+            'post_params': post_params,
+        }  # type: ignore
+    return narrowed
+
+
+def query_fields(selection: dict[type, set[str] | None]) -> dict[type, list[str]]:
+    """
+    fields loaders should query per request type: selected fields and required fields
+    (without default), which are needed to build the instances.
+    """
+    result = {}
+    for kls, fields in selection.items():
+        if fields is ALL:
+            continue
+        result[kls] = [
+            name for name, info in get_model_fields(kls).items()
+            if name in fields or info.is_required()]
+    return result
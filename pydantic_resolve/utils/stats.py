@@ -0,0 +1,207 @@
+"""
+Counters of one resolve, always on.
+
+    resolver = Resolver()
+    await resolver.resolve(data)
+    resolver.stats.loaders['module.UserLoader'].batches
+    resolver.stats.nodes['module.Story']
+
+- loader counters are kept per loader path (instances of split_loader_by_type share them),
+  each DataLoader instance is wrapped once, load() costs an attribute check and an increment,
+  a batch costs two perf_counter_ns calls.
+- cache_hits are loads served by the DataLoader cache (duplicated or primed keys),
+  i.e. loads minus keys dispatched to batch_load_fn.
+- nodes are counted when they are traversed, classes without resolve / post work
+  (in their own fields or below) are skipped by the resolver and not counted.
+- executor counters are kept per `@cpu_bound` method path, see utils/executor.
+- instances shared by concurrent resolvers (ResolverSession) count loads into the resolver
+  running in current task, a batch counts for every resolver which loaded since the previous one.
+"""
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any
+
+# attribute set on DataLoader instances, {ResolverStats: LoaderStats} of resolves using it
+LOADER_STATS_ATTR = '_pydantic_resolve_stats'
+LOADER_STATS_INSTALLED = '_pydantic_resolve_stats_installed'
+
+# stats of the resolve running in current task, set by the resolver around the traversal
+current_stats: ContextVar['ResolverStats | None'] = ContextVar('pydantic_resolve_stats', default=None)
+
+
+class LoaderStats:
+    __slots__ = ('loads', 'batches', 'keys', 'min_keys', 'max_keys', 'total_ns', 'max_ns')
+
+    def __init__(self):
+        self.loads = 0
+        self.batches = 0
+        self.keys = 0
+        self.min_keys = 0
+        self.max_keys = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add_batch(self, size: int, elapsed: int) -> None:
+        if self.batches == 0 or size < self.min_keys:
+            self.min_keys = size
+        if size > self.max_keys:
+            self.max_keys = size
+        self.batches += 1
+        self.keys += size
+        self.total_ns += elapsed
+        if elapsed > self.max_ns:
+            self.max_ns = elapsed
+
+    @property
+    def cache_hits(self) -> int:
+        return max(self.loads - self.keys, 0)
+
+    @property
+    def avg_keys(self) -> float:
+        return self.keys / self.batches if self.batches else 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1_000_000
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_ns / 1_000_000
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'batches': self.batches,
+            'loads': self.loads,
+            'cache_hits': self.cache_hits,
+            'keys': {'min': self.min_keys, 'avg': self.avg_keys, 'max': self.max_keys},
+            'latency_ms': {'total': self.total_ms, 'max': self.max_ms},
+        }
+
+    def __repr__(self) -> str:
+        return (f'batches: {self.batches}, keys min/avg/max: {self.min_keys}/{self.avg_keys:.1f}/{self.max_keys}, '
+                f'cache hits: {self.cache_hits}, latency total: {self.total_ms:.1f}ms, max: {self.max_ms:.1f}ms')
+
+
+class ExecutorStats:
+    """calls, jobs and queue / run time of a cpu_bound method"""
+    __slots__ = ('calls', 'batches', 'queue_ns', 'max_queue_ns', 'run_ns')
+
+    def __init__(self):
+        self.calls = 0
+        self.batches = 0
+        self.queue_ns = 0
+        self.max_queue_ns = 0
+        self.run_ns = 0
+
+    def add_batch(self, size: int, queue_ns: int, run_ns: int) -> None:
+        self.calls += size
+        self.batches += 1
+        self.queue_ns += queue_ns
+        if queue_ns > self.max_queue_ns:
+            self.max_queue_ns = queue_ns
+        self.run_ns += run_ns
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'batches': self.batches,
+            'queue_ms': {'total': self.queue_ns / 1_000_000, 'max': self.max_queue_ns / 1_000_000},
+            'run_ms': self.run_ns / 1_000_000,
+        }
+
+    def __repr__(self) -> str:
+        return (f'calls: {self.calls}, batches: {self.batches}, '
+                f'queue total: {self.queue_ns / 1_000_000:.1f}ms, max: {self.max_queue_ns / 1_000_000:.1f}ms, '
+                f'run total: {self.run_ns / 1_000_000:.1f}ms')
+
+
+class ResolverStats:
+    """loader counters by loader path, node counts by class path, cpu_bound methods by method path"""
+
+    def __init__(self):
+        self.loaders: dict[str, LoaderStats] = {}
+        self.nodes: dict[str, int] = {}
+        self.executor: dict[str, ExecutorStats] = {}
+
+    def loader(self, path: str) -> LoaderStats:
+        stats = self.loaders.get(path)
+        if stats is None:
+            stats = self.loaders[path] = LoaderStats()
+        return stats
+
+    def executor_method(self, path: str) -> ExecutorStats:
+        stats = self.executor.get(path)
+        if stats is None:
+            stats = self.executor[path] = ExecutorStats()
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'loaders': {path: stats.as_dict() for path, stats in self.loaders.items()},
+            'nodes': dict(self.nodes),
+            'executor': {path: stats.as_dict() for path, stats in self.executor.items()},
+        }
+
+    def __repr__(self) -> str:
+        lines = [f'{path}: {stats}' for path, stats in sorted(self.loaders.items())]
+        lines.extend(f'{path}: {count} nodes' for path, count in sorted(self.nodes.items()))
+        lines.extend(f'{path}: {stats}' for path, stats in sorted(self.executor.items()))
+        return '\n'.join(lines)
+
+
+def _owner(sinks: dict, current):
+    """sink of the resolve running in current task, or None when it is not attached"""
+    if len(sinks) == 1 and current is None:
+        return next(iter(sinks))
+    return current if current in sinks else None
+
+
+def instrument_loader(loader) -> None:
+    """
+    wrap load / batch_load_fn of a DataLoader instance once, they count into the LoaderStats
+    attached to `loader._pydantic_resolve_stats` by the resolvers using it, and do nothing
+    else when none is attached.
+    """
+    if getattr(loader, LOADER_STATS_INSTALLED, False):
+        return
+
+    load = loader.load
+    batch_load_fn = loader.batch_load_fn
+    loaded: set[ResolverStats] = set()  # resolves which loaded since the previous batch
+
+    def counted_load(key):
+        sinks = loader._pydantic_resolve_stats
+        if sinks:
+            owner = _owner(sinks, current_stats.get())
+            if owner is not None:
+                sinks[owner].loads += 1
+                loaded.add(owner)
+        return load(key)
+
+    async def timed_batch_load_fn(keys):
+        sinks = loader._pydantic_resolve_stats
+        if not sinks:
+            return await batch_load_fn(keys)
+
+        owners = [owner for owner in loaded if owner in sinks]
+        loaded.clear()
+        if not owners:
+            # rest of a batch split by max_batch_size
+            owner = _owner(sinks, current_stats.get())
+            owners = [owner] if owner is not None else list(sinks)
+
+        start = perf_counter_ns()
+        try:
+            return await batch_load_fn(keys)
+        finally:
+            elapsed = perf_counter_ns() - start
+            for owner in owners:
+                stats = sinks.get(owner)
+                if stats is not None:
+                    stats.add_batch(len(keys), elapsed)
+
+    loader.load = counted_load
+    loader.batch_load_fn = timed_batch_load_fn
+    setattr(loader, LOADER_STATS_ATTR, {})
+    setattr(loader, LOADER_STATS_INSTALLED, True)
+
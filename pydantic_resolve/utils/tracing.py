@@ -0,0 +1,175 @@
+"""
+Low overhead tracing of a resolve.
+
+    tracer = Tracer(sample_rate=0.01, exporter=lambda spans: send(spans))
+    await Resolver(tracer=tracer).resolve(data)
+
+- sampling is decided once per resolve, an unsampled resolve costs one `is None` check per field.
+- a sampled resolve records (name, kind, start, end, attributes) into preallocated slots,
+  timestamps come from perf_counter_ns.
+- each resolve_ / post_ method is a span, DataLoader batches are spans too, with
+  the time keys waited in queue before dispatch, so are executor jobs of @cpu_bound methods.
+- at the end spans are exported as OpenTelemetry style dicts, children of a root `resolve` span.
+- a batch of a loader shared by concurrent resolvers (ResolverSession) is recorded into the
+  trace of every resolve which loaded from it since the previous batch.
+"""
+import random
+import time
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any, Callable
+
+KIND_RESOLVE = 'resolve'
+KIND_POST = 'post'
+KIND_LOADER = 'loader'
+KIND_EXECUTOR = 'executor'
+
+# attribute set on DataLoader instances, set of traces of the resolves using it
+LOADER_TRACE_ATTR = '_pydantic_resolve_trace'
+LOADER_TRACE_INSTALLED = '_pydantic_resolve_trace_installed'
+
+# trace of the resolve running in current task, set by the resolver around the traversal
+current_trace: ContextVar['Trace | None'] = ContextVar('pydantic_resolve_trace', default=None)
+
+SpanExporter = Callable[[list[dict[str, Any]]], None]
+
+
+class Trace:
+    """records of one sampled resolve"""
+    __slots__ = ('name', 'capacity', 'records', 'size', 'dropped', 'start', 'end', '_epoch_offset')
+
+    def __init__(self, name: str, capacity: int):
+        self.name = name
+        self.capacity = capacity
+        self.records: list[tuple | None] = [None] * capacity
+        self.size = 0
+        self.dropped = 0
+        self._epoch_offset = time.time_ns() - perf_counter_ns()
+        self.start = perf_counter_ns()
+        self.end = 0
+
+    def add(self, name: str, kind: str, start: int, end: int, attributes: dict | None = None) -> None:
+        size = self.size
+        if size >= self.capacity:
+            self.dropped += 1
+            return
+        self.records[size] = (name, kind, start, end, attributes)
+        self.size = size + 1
+
+    def finish(self) -> None:
+        self.end = perf_counter_ns()
+
+    def to_spans(self) -> list[dict[str, Any]]:
+        """OpenTelemetry compatible span dicts, first one is the root span"""
+        trace_id = f'0x{random.getrandbits(128):032x}'
+        root_id = f'0x{random.getrandbits(64):016x}'
+        offset = self._epoch_offset
+
+        spans = [{
+            'name': self.name,
+            'context': {'trace_id': trace_id, 'span_id': root_id},
+            'kind': 'SpanKind.INTERNAL',
+            'parent_id': None,
+            'start_time': self.start + offset,
+            'end_time': self.end + offset,
+            'attributes': {
+                'pydantic_resolve.spans': self.size,
+                'pydantic_resolve.dropped_spans': self.dropped,
+            },
+        }]
+        for i in range(self.size):
+            name, kind, start, end, attributes = self.records[i]  # type: ignore
+            spans.append({
+                'name': name,
+                'context': {'trace_id': trace_id, 'span_id': f'0x{random.getrandbits(64):016x}'},
+                'kind': 'SpanKind.INTERNAL',
+                'parent_id': root_id,
+                'start_time': start + offset,
+                'end_time': end + offset,
+                'attributes': {'pydantic_resolve.kind': kind, **(attributes or {})},
+            })
+        return spans
+
+
+class Tracer:
+    """
+    sample_rate: 0 ~ 1, probability a resolve is traced
+    exporter:    called with span dicts of each sampled resolve
+    capacity:    max spans of one resolve, extra spans are counted as dropped
+    """
+    def __init__(self, sample_rate: float = 1.0, exporter: SpanExporter | None = None, capacity: int = 10_000):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f'sample_rate should be between 0 and 1, got {sample_rate!r}')
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        self.capacity = capacity
+
+    def begin(self, name: str = 'resolve') -> Trace | None:
+        """return a Trace if sampled, else None"""
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return None
+        return Trace(name, self.capacity)
+
+    def finish(self, trace: Trace) -> list[dict[str, Any]]:
+        trace.finish()
+        spans = trace.to_spans()
+        if self.exporter is not None:
+            self.exporter(spans)
+        return spans
+
+
+def instrument_loader(loader, path: str) -> None:
+    """
+    wrap load / batch_load_fn of a DataLoader instance once, they record into the traces
+    attached to `loader._pydantic_resolve_trace`, and do nothing else when it is empty.
+    """
+    if getattr(loader, LOADER_TRACE_INSTALLED, False):
+        return
+
+    load = loader.load
+    batch_load_fn = loader.batch_load_fn
+    first_queued = [0]  # when the first key of pending batch was queued
+    loaded: set[Trace] = set()  # traces of the resolves which loaded since the previous batch
+
+    def traced_load(key):
+        traces = loader._pydantic_resolve_trace
+        if traces:
+            if first_queued[0] == 0:
+                first_queued[0] = perf_counter_ns()
+            trace = current_trace.get()
+            if trace in traces:
+                loaded.add(trace)
+            elif trace is None and len(traces) == 1:
+                loaded.update(traces)
+        return load(key)
+
+    async def traced_batch_load_fn(keys):
+        traces = loader._pydantic_resolve_trace
+        if not traces:
+            return await batch_load_fn(keys)
+
+        owners = [trace for trace in loaded if trace in traces]
+        loaded.clear()
+        if not owners:
+            # rest of a batch split by max_batch_size
+            trace = current_trace.get()
+            owners = [trace] if trace in traces else list(traces)
+
+        start = perf_counter_ns()
+        queued = first_queued[0] or start
+        first_queued[0] = 0
+        try:
+            return await batch_load_fn(keys)
+        finally:
+            end = perf_counter_ns()
+            for trace in owners:
+                trace.add(f'{path}.batch_load_fn', KIND_LOADER, start, end, {
+                    'pydantic_resolve.loader': path,
+                    'pydantic_resolve.batch_size': len(keys),
+                    'pydantic_resolve.queue_ns': start - queued,
+                })
+
+    loader.load = traced_load
+    loader.batch_load_fn = traced_batch_load_fn
+    setattr(loader, LOADER_TRACE_ATTR, set())
+    setattr(loader, LOADER_TRACE_INSTALLED, True)
@@ -1,4 +1,9 @@
-from typing import Type, Union, Annotated
+import dataclasses
+from typing import Type, Union, Annotated, get_type_hints
+from pydantic import Field
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+import pydantic_resolve.constant as const
 try:  # Python 3.10+ provides PEP 604 unions using types.UnionType
     from types import UnionType as _UnionType
 except ImportError:  # pragma: no cover - prior to 3.10
@@ -109,3 +114,39 @@ def get_type(v):
     return v.annotation
 
 
+def is_slots_dataclass(kls) -> bool:
+    """@dataclass(slots=True) classes are accepted as nodes, same as pydantic models"""
+    return isinstance(kls, type) and dataclasses.is_dataclass(kls) and '__slots__' in kls.__dict__
+
+
+def _get_dataclass_fields(kls: type) -> dict[str, FieldInfo]:
+    """
+    FieldInfo of dataclass fields, built on first use (after forward refs can be resolved).
+    cached on the class itself (not inherited by subclasses), so it goes away with the class.
+    """
+    fields = kls.__dict__.get(const.DATACLASS_FIELDS)
+    if fields is None:
+        hints = get_type_hints(kls, include_extras=True)
+        fields = {}
+        for f in dataclasses.fields(kls):
+            if f.default is not dataclasses.MISSING:
+                default = f.default
+            elif f.default_factory is not dataclasses.MISSING:
+                default = Field(default_factory=f.default_factory)
+            else:
+                default = PydanticUndefined
+            fields[f.name] = FieldInfo.from_annotated_attribute(hints[f.name], default)
+        setattr(kls, const.DATACLASS_FIELDS, fields)
+    return fields
+
+
+def get_model_fields(kls: type) -> dict[str, FieldInfo]:
+    """
+    `model_fields` of a pydantic model, or the equivalent FieldInfo of a slots dataclass,
+    so annotation, metadata (ExposeAs, SendTo) and is_required() are read the same way.
+    """
+    if is_slots_dataclass(kls):
+        return _get_dataclass_fields(kls)
+    return kls.model_fields
+
+
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import Optional
+from pydantic import BaseModel
+from pydantic_resolve import Loader, mapper
+from pydantic_resolve.analysis import Analytic
+
+
+async def batch_load_fn(keys):
+    return keys
+
+
+class SyncLeaf(BaseModel):
+    value: int
+
+    double: int = 0
+    def post_double(self):
+        return self.value * 2
+
+
+class AsyncLeaf(BaseModel):
+    value: int
+
+    double: int = 0
+    async def post_double(self):
+        return self.value * 2
+
+
+class MapperLeaf(BaseModel):
+    value: int
+
+    double: int = 0
+    @mapper(lambda x: x * 2)
+    def post_double(self):
+        return self.value
+
+
+class LoaderLeaf(BaseModel):
+    value: int
+
+    double: int = 0
+    def post_double(self, loader=Loader(batch_load_fn)):
+        return loader.load(self.value)
+
+
+class ResolveLeaf(BaseModel):
+    value: int = 0
+    def resolve_value(self):
+        return 1
+
+
+class SyncTree(BaseModel):
+    children: list[SyncTree] = []
+    leaves: list[SyncLeaf] = []
+
+    total: int = 0
+    def post_total(self):
+        return sum(leaf.double for leaf in self.leaves)
+
+    def post_default_handler(self):
+        pass
+
+
+class MixedTree(BaseModel):
+    children: list[MixedTree] = []
+    leaf: Optional[AsyncLeaf] = None
+
+
+class Root(BaseModel):
+    sync_tree: SyncTree
+    mixed_tree: MixedTree
+    mapper_leaf: MapperLeaf
+    loader_leaf: LoaderLeaf
+    resolve_leaf: ResolveLeaf
+
+
+def test_sync_subtree():
+    result = Analytic().scan(Root)
+    prefix = Root.__module__
+
+    assert result[f'{prefix}.SyncLeaf']['sync_subtree'] is True
+    assert result[f'{prefix}.SyncTree']['sync_subtree'] is True
+
+    assert result[f'{prefix}.AsyncLeaf']['sync_subtree'] is False
+    assert result[f'{prefix}.MixedTree']['sync_subtree'] is False
+    assert result[f'{prefix}.MapperLeaf']['sync_subtree'] is False
+    assert result[f'{prefix}.LoaderLeaf']['sync_subtree'] is False
+    assert result[f'{prefix}.ResolveLeaf']['sync_subtree'] is False
+    assert result[f'{prefix}.Root']['sync_subtree'] is False
@@ -0,0 +1,98 @@
+from __future__ import annotations
+from pydantic import BaseModel
+from pydantic_resolve import Collector, Loader, mapper
+from pydantic_resolve.analysis import Analytic, convert_metadata_key_as_kls
+from pydantic_resolve.plan import compile_plans
+import pydantic_resolve.constant as const
+
+
+async def user_batch_load_fn(keys):
+    return keys
+
+
+class Root(BaseModel):
+    __pydantic_resolve_expose__ = {'name': 'root_name'}
+    name: str = ''
+
+    items: list[Item] = []
+    def resolve_items(self, context, loader=Loader(user_batch_load_fn)):
+        return []
+
+    names: list[str] = []
+    def post_names(self, ancestor_context, collector=Collector('item_name')):
+        return collector.values()
+
+    def post_default_handler(self, parent, collector=Collector('item_name')):
+        pass
+
+
+class Item(BaseModel):
+    __pydantic_resolve_collect__ = {('name', 'id'): 'item_name'}
+    id: int
+    name: str
+
+    desc: str = ''
+    @mapper(lambda x: x)
+    def resolve_desc(self) -> str:
+        return 'desc'
+
+
+class Plain(BaseModel):
+    id: int
+
+
+def _plans(kls):
+    return compile_plans(convert_metadata_key_as_kls(Analytic().scan(kls)))
+
+
+def test_compile_plan_of_root():
+    plans = _plans(Root)
+    plan = plans[Root]
+    prefix = Root.__module__
+
+    assert plan.kls is Root
+    assert plan.kls_path == f'{prefix}.Root'
+    assert plan.is_noop is False
+    assert plan.expose_items == (('name', 'root_name'),)
+    assert plan.collect_items == ()
+
+    [resolve_step] = plan.resolve_steps
+    assert resolve_step.method_name == 'resolve_items'
+    assert resolve_step.field == 'items'
+    assert resolve_step.binder.context is True
+    assert resolve_step.binder.parent is False
+    assert resolve_step.binder.loaders == ((
+        'loader', f'{prefix}.user_batch_load_fn', (Item,)),)
+
+    [post_step] = plan.post_steps
+    assert post_step.field == 'names'
+    assert post_step.binder.ancestor_context is True
+    assert post_step.binder.collectors == ((
+        'collector', 'item_name', (f'{prefix}.Root', 'post_names', 'collector')),)
+
+    default = plan.post_default
+    assert default.field is None
+    assert default.binder.parent is True
+    assert default.binder.collectors == ((
+        'collector', 'item_name', (f'{prefix}.Root', const.POST_DEFAULT_HANDLER, 'collector')),)
+
+    assert {sign for _, sign, _ in plan.collector_protos} == {
+        (f'{prefix}.Root', 'post_names', 'collector'),
+        (f'{prefix}.Root', const.POST_DEFAULT_HANDLER, 'collector'),
+    }
+
+
+def test_compile_plan_of_child():
+    plan = _plans(Root)[Item]
+
+    assert plan.collect_items == ((('name', 'id'), ('item_name',)),)
+    [resolve_step] = plan.resolve_steps
+    assert resolve_step.has_mapper is True
+    assert resolve_step.has_annotation is True
+    assert resolve_step.binder.is_empty
+
+
+def test_compile_plan_noop():
+    plan = _plans(Plain)[Plain]
+    assert plan.is_noop is True
+    assert plan.should_traverse is False
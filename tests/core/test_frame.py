@@ -0,0 +1,48 @@
+import pytest
+from pydantic_resolve.frame import ScopeMap, EMPTY_SCOPE, Frame, ROOT_FRAME
+
+
+def test_scope_map_layers():
+    outer = EMPTY_SCOPE.child({'a': 1, 'b': 2})
+    inner = outer.child({'b': 3})
+
+    assert inner['a'] == 1
+    assert inner['b'] == 3
+    assert outer['b'] == 2
+    assert dict(inner) == {'a': 1, 'b': 3}
+    assert len(inner) == 2
+    assert 'a' in inner and 'c' not in inner
+    assert inner.get('c') is None
+    assert inner == {'a': 1, 'b': 3}
+
+    with pytest.raises(KeyError):
+        inner['c']
+
+
+def test_scope_map_shares_empty_layer():
+    outer = ScopeMap({'a': 1})
+    assert outer.child({}) is outer
+
+
+def test_frame_parent_and_path():
+    class A: pass
+    class B: pass
+
+    a, b = A(), B()
+    fa = Frame(a, None, ROOT_FRAME, EMPTY_SCOPE, EMPTY_SCOPE, None)
+    fb = Frame(b, None, fa, EMPTY_SCOPE, EMPTY_SCOPE, None)
+
+    assert fa.parent is None
+    assert fb.parent is a
+    assert fb.path() == ['A', 'B']
+
+
+def test_frame_recursion_depth():
+    plan_a, plan_b = object(), object()
+    f0 = Frame(object(), plan_a, ROOT_FRAME, EMPTY_SCOPE, EMPTY_SCOPE, None)
+    f1 = Frame(object(), plan_b, f0, EMPTY_SCOPE, EMPTY_SCOPE, None)
+    f2 = Frame(object(), plan_a, f1, EMPTY_SCOPE, EMPTY_SCOPE, None)
+
+    assert f0.recursion_depth() == 0
+    assert f1.recursion_depth() == 0
+    assert f2.recursion_depth() == 1
@@ -0,0 +1,105 @@
+import gc
+import pytest
+from pydantic import BaseModel
+from pydantic_resolve import Resolver, config_resolver
+from pydantic_resolve.analysis import Analytic, convert_metadata_key_as_kls
+from pydantic_resolve.metadata_cache import MetadataCache
+from pydantic_resolve.resolver import METADATA_CACHE
+
+
+class Leaf(BaseModel):
+    name: str = ''
+    def resolve_name(self):
+        return 'leaf'
+
+
+class RootA(BaseModel):
+    leaf: Leaf
+
+
+class RootB(BaseModel):
+    leaves: list[Leaf] = []
+
+
+def scan(kls):
+    return convert_metadata_key_as_kls(Analytic().scan(kls))
+
+
+def test_lru_eviction_and_counters():
+    cache = MetadataCache(maxsize=1)
+    cache.set(Resolver, RootA, scan(RootA))
+    assert cache.get(Resolver, RootA) is not None
+    assert cache.get(Resolver, RootB) is None
+
+    cache.set(Resolver, RootB, scan(RootB))
+    assert not cache.contains(Resolver, RootA)
+    assert cache.contains(Resolver, RootB)
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.maxsize, info.currsize) == (1, 1, 1, 1, 1)
+
+
+def test_members_are_shared_between_roots():
+    cache = MetadataCache()
+    metadata_a, plans_a = cache.set(Resolver, RootA, scan(RootA))
+    metadata_b, plans_b = cache.set(Resolver, RootB, scan(RootB))
+
+    assert metadata_a[Leaf] is metadata_b[Leaf]
+    assert plans_a[Leaf] is plans_b[Leaf]
+
+
+class CycleC(BaseModel):
+    x: int = 0
+    def resolve_x(self):
+        return 42
+
+
+class CycleA(BaseModel):
+    b: 'CycleB | None' = None
+    c: CycleC | None = None
+
+
+class CycleB(BaseModel):
+    a: CycleA | None = None
+
+
+CycleA.model_rebuild()
+
+
+def test_members_differ_by_root():
+    """CycleB scanned from CycleA does not traverse back to CycleA, scanned from itself it does"""
+    cache = MetadataCache()
+    metadata_a, plans_a = cache.set(Resolver, CycleA, scan(CycleA))
+    metadata_b, plans_b = cache.set(Resolver, CycleB, scan(CycleB))
+
+    assert metadata_a[CycleB] is not metadata_b[CycleB]
+    assert plans_b[CycleB].object_fields == ('a',)
+    assert metadata_a[CycleC] is metadata_b[CycleC]
+
+
+@pytest.mark.asyncio
+async def test_resolve_cycle_from_another_root():
+    CustomResolver = config_resolver('CustomResolver')
+    await CustomResolver().resolve(CycleA())
+    b = await CustomResolver().resolve(CycleB(a=CycleA(c=CycleC())))
+    assert b.a.c.x == 42
+
+
+def test_entries_of_collected_resolver_class_are_dropped():
+    cache = MetadataCache()
+    CustomResolver = config_resolver('CustomResolver')
+    cache.set(CustomResolver, RootA, scan(RootA))
+    assert len(cache) == 1
+
+    del CustomResolver
+    gc.collect()
+    assert cache.get(Resolver, RootA) is None
+    assert len(cache) == 0
+
+
+def test_warmup():
+    CustomResolver = config_resolver('CustomResolver')
+    CustomResolver.warmup([RootA, RootB])
+    assert METADATA_CACHE.contains(CustomResolver, RootA)
+    assert METADATA_CACHE.contains(CustomResolver, RootB)
+    assert not METADATA_CACHE.contains(Resolver, RootB)
@@ -8,6 +8,8 @@ Covers:
 - Per-parent pagination correctness
 """
 
+import json
+
 import pytest
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import ForeignKey, Integer, String, select
@@ -441,6 +443,26 @@ class TestPaginationQueryExecution:
         assert pag["total_count"] == 3
         assert "has_more" not in pag
 
+    @pytest.mark.asyncio
+    async def test_execute_to_json(self, diagram):
+        """execute_to_json returns the same response as execute, pre-encoded, without hidden fields."""
+        handler = GraphQLHandler(
+            diagram,
+            enable_from_attribute_in_type_adapter=True,
+            enable_pagination=True,
+        )
+        query = "{ authorEntityAuthors { id articles(limit: 2) { items { title } pagination { has_more } } } }"
+
+        encoded = await handler.execute_to_json(query)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == await handler.execute(query)
+        assert b"pydantic_resolve_pag" not in encoded  # hidden pagination fields
+
+        error = json.loads(await handler.execute_to_json("{ unknownQuery { id } }"))
+        assert error["data"] is None
+        assert error["errors"][0]["extensions"]["code"] == "UNKNOWN_QUERY"
+
 
 # =====================================
 # Test: Introspection with Pagination
@@ -19,12 +19,11 @@ async def test_cache_of_metadata():
     }
     assert result.model_dump() == expected
 
-    # Check two-level cache structure:
-    # METADATA_CACHE[id(resolver_class)][root_class] = metadata
-    resolver_class_id = id(Resolver)
-    assert resolver_class_id in METADATA_CACHE.keys()
-    assert Container in METADATA_CACHE[resolver_class_id].keys()
+    # METADATA_CACHE: (resolver_class, root_class) -> (metadata, plans)
+    assert METADATA_CACHE.contains(Resolver, Container)
 
+    hits = METADATA_CACHE.cache_info().hits
     c2 = Container()
     result2 = await Resolver().resolve(c2)
     assert result2.model_dump() == expected
+    assert METADATA_CACHE.cache_info().hits == hits + 1
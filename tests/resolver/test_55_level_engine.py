@@ -0,0 +1,97 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, Collector, ExposeAs, SendTo
+from typing import Annotated
+
+
+class CommentLoader(DataLoader):
+    batches: list
+
+    async def batch_load_fn(self, keys):
+        self.batches.append(sorted(keys))
+        return [[dict(id=k * 10 + i, text=f'c-{k}-{i}') for i in range(2)] for k in keys]
+
+
+class Comment(BaseModel):
+    id: int
+    text: Annotated[str, SendTo('texts')]
+
+    full: str = ''
+    def post_full(self, ancestor_context, parent):
+        return f"{ancestor_context['blog_title']}/{parent.title}/{self.text}"
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+
+    comments: list[Comment] = []
+    def resolve_comments(self, loader=Loader(CommentLoader)):
+        return loader.load(self.id)
+
+    texts: list[str] = []
+    def post_texts(self, collector=Collector('texts')):
+        return collector.values()
+
+
+class Blog(BaseModel):
+    id: int
+    title: Annotated[str, ExposeAs('blog_title')]
+
+    posts: list[Post] = []
+    async def resolve_posts(self):
+        await asyncio.sleep(0.002 * self.id)  # uneven timing between branches
+        return [dict(id=self.id * 10 + p, title=f'post-{p}') for p in range(3)]
+
+    all_texts: list[str] = []
+    def post_all_texts(self, collector=Collector('texts')):
+        return collector.values()
+
+    summary: str = ''
+    def post_default_handler(self):
+        self.summary = f'{len(self.posts)} posts, {len(self.all_texts)} comments'
+
+
+def build_blogs():
+    return [
+        Blog(id=b, title=f'blog-{b}') for b in range(2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_level_engine_result_is_identical():
+    recursive = await Resolver(
+        engine='recursive',
+        loader_params={CommentLoader: {'batches': []}}).resolve(build_blogs())
+    level = await Resolver(
+        engine='level',
+        loader_params={CommentLoader: {'batches': []}}).resolve(build_blogs())
+
+    assert [b.model_dump() for b in level] == [b.model_dump() for b in recursive]
+    assert level[0].posts[0].comments[0].full == 'blog-0/post-0/c-0-0'
+    assert level[1].all_texts == ['c-10-0', 'c-10-1', 'c-11-0', 'c-11-1', 'c-12-0', 'c-12-1']
+    assert level[1].summary == '3 posts, 6 comments'
+
+
+@pytest.mark.asyncio
+async def test_level_engine_batches_whole_level():
+    batches = []
+    await Resolver(engine='recursive', loader_params={CommentLoader: {'batches': batches}}).resolve(build_blogs())
+    assert batches == [[0, 1, 2], [10, 11, 12]]
+
+    batches = []
+    await Resolver(engine='level', loader_params={CommentLoader: {'batches': batches}}).resolve(build_blogs())
+    assert batches == [[0, 1, 2, 10, 11, 12]]
+
+
+@pytest.mark.asyncio
+async def test_level_engine_with_empty_input():
+    assert await Resolver(engine='level').resolve([]) == []
+
+
+def test_invalid_engine():
+    with pytest.raises(ValueError):
+        Resolver(engine='unknown')
@@ -0,0 +1,145 @@
+from __future__ import annotations
+import functools
+from typing import Annotated
+import pytest
+from pydantic import BaseModel
+from pydantic_resolve import Resolver, Collector, ExposeAs, SendTo
+from pydantic_resolve.utils.tracing import Tracer
+
+
+class Item(BaseModel):
+    name: Annotated[str, SendTo('item_names')]
+    value: int
+
+    label: str = ''
+    def post_label(self, ancestor_context, parent):
+        return f"{ancestor_context['group_name']}:{parent.name}:{self.name}"
+
+
+class Group(BaseModel):
+    name: Annotated[str, ExposeAs('group_name')]
+    items: list[Item] = []
+
+    names: list[str] = []
+    def post_names(self, collector=Collector('item_names')):
+        return collector.values()
+
+    total: int = 0
+    def post_total(self):
+        return sum(i.value for i in self.items)
+
+    summary: str = ''
+    def post_default_handler(self):
+        self.summary = f'{self.name}={self.total}'
+
+
+class AsyncGroup(BaseModel):
+    name: str
+
+    upper: str = ''
+    async def post_upper(self):
+        return self.name.upper()
+
+
+class BrokenGroup(BaseModel):
+    name: str
+
+    upper: str = ''
+    def post_upper(self):
+        return self._upper()
+
+    async def _upper(self):
+        return self.name.upper()
+
+
+def logged(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+class WrappedItem(BaseModel):
+    __pydantic_resolve_collect__ = {'doubled': 'doubled_values'}
+    value: int
+
+    doubled: int = 0
+    @logged
+    async def post_doubled(self):
+        return self.value * 2
+
+    tripled: int = 0
+    def post_tripled(self):
+        return self.value * 3
+
+
+class WrappedGroup(BaseModel):
+    items: list[WrappedItem] = []
+
+    collected: list[int] = []
+    def post_collected(self, collector=Collector('doubled_values')):
+        return collector.values()
+
+    total: int = 0
+    @logged
+    async def post_default_handler(self):
+        self.total = sum(i.doubled + i.tripled for i in self.items)
+
+
+def build_groups():
+    return [
+        Group(name=f'g{g}', items=[Item(name=f'i{i}', value=i) for i in range(3)])
+        for g in range(2)
+    ]
+
+
+def test_resolve_sync():
+    groups = Resolver().resolve_sync(build_groups())
+
+    assert groups[0].names == ['i0', 'i1', 'i2']
+    assert groups[1].total == 3
+    assert groups[1].summary == 'g1=3'
+    assert groups[1].items[2].label == 'g1:g1:i2'
+
+
+@pytest.mark.asyncio
+async def test_sync_subtree_result_is_identical():
+    expected = [g.model_dump() for g in Resolver().resolve_sync(build_groups())]
+
+    for engine in ('recursive', 'level'):
+        groups = await Resolver(engine=engine).resolve(build_groups())
+        assert [g.model_dump() for g in groups] == expected
+
+
+def test_resolve_sync_rejects_async_work():
+    exported = []
+    resolver = Resolver(tracer=Tracer(exporter=exported.append))
+    with pytest.raises(TypeError):
+        resolver.resolve_sync([AsyncGroup(name='a')])
+
+    # the resolve is still finished
+    assert resolver._trace is None
+    assert len(exported) == 1
+
+
+def test_resolve_sync_rejects_awaitable_returned_by_plain_function():
+    with pytest.raises(TypeError):
+        Resolver().resolve_sync(BrokenGroup(name='a'))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_awaitable_returned_by_plain_function_is_awaited(engine):
+    groups = await Resolver(engine=engine).resolve(
+        [WrappedGroup(items=[WrappedItem(value=1), WrappedItem(value=2)])])
+
+    assert [i.doubled for i in groups[0].items] == [2, 4]
+    assert groups[0].collected == [2, 4]
+    assert groups[0].total == 15
+
+    with pytest.raises(TypeError):
+        Resolver().resolve_sync(WrappedGroup(items=[WrappedItem(value=1)]))
+
+
+def test_resolve_sync_empty_list():
+    assert Resolver().resolve_sync([]) == []
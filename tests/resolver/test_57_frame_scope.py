@@ -0,0 +1,67 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from collections.abc import Mapping
+from pydantic import BaseModel
+from pydantic_resolve import Resolver, Collector
+
+
+class Leaf(BaseModel):
+    id: int
+
+    info: str = ''
+    async def resolve_info(self, ancestor_context, parent):
+        await asyncio.sleep(0)
+        assert isinstance(ancestor_context, Mapping)
+        return f"{ancestor_context['root_name']}/{ancestor_context['name']}/{parent.name}/{self.id}"
+
+
+class Middle(BaseModel):
+    __pydantic_resolve_expose__ = {'name': 'name'}
+    __pydantic_resolve_collect__ = {'name': 'names'}
+    name: str
+
+    leaves: list[Leaf] = []
+    def resolve_leaves(self):
+        return [dict(id=i) for i in range(2)]
+
+
+class Root(BaseModel):
+    __pydantic_resolve_expose__ = {'name': 'root_name'}
+    name: str
+
+    middles: list[Middle] = []
+    async def resolve_middles(self):
+        return [dict(name=f'm{i}') for i in range(3)]
+
+    # shadowed by Middle for its descendants
+    nested: Middle | None = None
+    def resolve_nested(self):
+        return dict(name='nested')
+
+    names: list[str] = []
+    def post_names(self, collector=Collector('names')):
+        return collector.values()
+
+
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+@pytest.mark.asyncio
+async def test_frame_scope(engine):
+    roots = [Root(name='r0'), Root(name='r1')]
+    roots = await Resolver(engine=engine).resolve(roots)
+
+    assert roots[0].middles[2].leaves[1].info == 'r0/m2/m2/1'
+    assert roots[1].middles[0].leaves[0].info == 'r1/m0/m0/0'
+    assert roots[1].nested.leaves[0].info == 'r1/nested/nested/0'
+    assert sorted(roots[0].names) == ['m0', 'm1', 'm2', 'nested']
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolve_with_one_resolver():
+    resolver = Resolver()
+    a, b = await asyncio.gather(
+        resolver.resolve(Root(name='a')),
+        resolver.resolve(Root(name='b')))
+
+    assert a.middles[0].leaves[0].info == 'a/m0/m0/0'
+    assert b.middles[0].leaves[0].info == 'b/m0/m0/0'
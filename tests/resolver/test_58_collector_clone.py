@@ -0,0 +1,71 @@
+from __future__ import annotations
+import pytest
+from pydantic import BaseModel
+from pydantic_resolve import Resolver, Collector, ICollector
+from pydantic_resolve.utils.collector import CollectorSlot
+
+
+class CountCollector(ICollector):
+    clones = 0
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.counter = 0
+
+    def clone(self):
+        CountCollector.clones += 1
+        return CountCollector(self.alias)
+
+    def add(self, val):
+        self.counter += 1
+
+    def values(self):
+        return self.counter
+
+
+class Item(BaseModel):
+    __pydantic_resolve_collect__ = {'id': 'item_id'}
+    id: int
+
+
+class Group(BaseModel):
+    id: int
+
+    items: list[Item] = []
+    def resolve_items(self):
+        return [dict(id=self.id * 10 + i) for i in range(self.id)]
+
+    count: int = 0
+    def post_count(self, collector=CountCollector('item_id')):
+        return collector.values()
+
+    ids: list[int] = []
+    def post_ids(self, collector=Collector('item_id')):
+        return collector.values()
+
+
+def test_collector_clone():
+    proto = Collector('a', flat=True)
+    proto.add([1])
+    c = proto.clone()
+    assert c is not proto
+    assert (c.alias, c.flat, c.values()) == ('a', True, [])
+
+
+def test_collector_slot_is_lazy():
+    slot = CollectorSlot(Collector('a'))
+    assert slot.instance is None
+    slot.add(1)
+    slot.add(2)
+    assert slot.get().values() == [1, 2]
+
+
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+@pytest.mark.asyncio
+async def test_collector_cloned_once_per_node(engine):
+    CountCollector.clones = 0
+    groups = await Resolver(engine=engine).resolve([Group(id=i) for i in range(3)])
+
+    assert [g.count for g in groups] == [0, 1, 2]
+    assert [g.ids for g in groups] == [[], [10], [20, 21]]
+    assert CountCollector.clones == 3
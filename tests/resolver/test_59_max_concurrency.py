@@ -0,0 +1,64 @@
+from __future__ import annotations
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader
+
+
+class DetailLoader(DataLoader):
+    batches: list
+
+    async def batch_load_fn(self, keys):
+        self.batches.append(len(keys))
+        return [f'detail-{k}' for k in keys]
+
+
+class Item(BaseModel):
+    id: int
+
+    detail: str = ''
+    def resolve_detail(self, loader=Loader(DetailLoader)):
+        return loader.load(self.id)
+
+
+def build_items(n):
+    return [Item(id=i) for i in range(n)]
+
+
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+@pytest.mark.asyncio
+async def test_max_concurrency_admits_windows(engine):
+    batches = []
+    resolver = Resolver(engine=engine, max_concurrency=4, loader_params={DetailLoader: {'batches': batches}})
+    items = await resolver.resolve(build_items(10))
+
+    assert [i.detail for i in items] == [f'detail-{i}' for i in range(10)]
+    assert batches == [4, 4, 2]
+    assert resolver.peak_in_flight == 4
+
+
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+@pytest.mark.asyncio
+async def test_peak_in_flight_without_limit(engine):
+    batches = []
+    resolver = Resolver(engine=engine, loader_params={DetailLoader: {'batches': batches}})
+    await resolver.resolve(build_items(10))
+
+    assert batches == [10]
+    assert resolver.peak_in_flight == 10
+
+
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+@pytest.mark.asyncio
+async def test_peak_in_flight_is_per_resolve(engine):
+    resolver = Resolver(engine=engine, loader_params={DetailLoader: {'batches': []}})
+    await resolver.resolve(build_items(10))
+    await resolver.resolve(build_items(3))
+
+    assert resolver.peak_in_flight == 3
+    assert resolver._in_flight == 0
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        Resolver(max_concurrency=0)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+import asyncio
+from contextlib import aclosing
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, Collector
+from pydantic_resolve.utils.tracing import Tracer
+import pydantic_resolve.utils.stats as stats_util
+
+
+class NameLoader(DataLoader):
+    batches: list
+
+    async def batch_load_fn(self, keys):
+        self.batches.append(sorted(keys))
+        return [f'name-{k}' for k in keys]
+
+
+class Child(BaseModel):
+    __pydantic_resolve_collect__ = {'name': 'names'}
+    id: int
+
+    name: str = ''
+    def resolve_name(self, loader=Loader(NameLoader)):
+        return loader.load(self.id)
+
+
+class Root(BaseModel):
+    id: int
+
+    children: list[Child] = []
+    async def resolve_children(self):
+        await asyncio.sleep(0.01 * (3 - self.id))  # the last root finishes first
+        return [dict(id=self.id * 10 + i) for i in range(2)]
+
+    names: list[str] = []
+    def post_names(self, collector=Collector('names')):
+        return collector.values()
+
+
+def build_roots():
+    return [Root(id=i) for i in range(3)]
+
+
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+@pytest.mark.asyncio
+async def test_resolve_iter_yields_in_completion_order(engine):
+    batches = []
+    resolver = Resolver(engine=engine, loader_params={NameLoader: {'batches': batches}})
+    roots = [r async for r in resolver.resolve_iter(build_roots())]
+
+    assert [r.id for r in roots] == [2, 1, 0]
+    assert roots[0].names == ['name-20', 'name-21']
+
+    # one loader instance is shared by the stream
+    assert len(resolver.loader_instance_cache) == 1
+    assert sorted(k for b in batches for k in b) == [0, 1, 10, 11, 20, 21]
+
+
+@pytest.mark.asyncio
+async def test_resolve_iter_ordered():
+    resolver = Resolver(loader_params={NameLoader: {'batches': []}})
+    roots = [r async for r in resolver.resolve_iter(build_roots(), ordered=True)]
+    assert [r.id for r in roots] == [0, 1, 2]
+    assert roots[2].names == ['name-20', 'name-21']
+
+
+@pytest.mark.asyncio
+async def test_resolve_iter_stop_early():
+    resolver = Resolver(loader_params={NameLoader: {'batches': []}})
+    async with aclosing(resolver.resolve_iter(build_roots())) as stream:
+        async for root in stream:
+            assert root.id == 2
+            break
+
+
+@pytest.mark.asyncio
+async def test_resolve_iter_finishes_when_stopped_early():
+    exported = []
+    resolver = Resolver(loader_params={NameLoader: {'batches': []}}, tracer=Tracer(exporter=exported.append))
+    async with aclosing(resolver.resolve_iter(build_roots())) as stream:
+        async for _ in stream:
+            break
+
+    assert len(exported) == 1 and resolver._trace is None
+    loader = resolver.loader_instance_cache[f'{__name__}.NameLoader']
+    assert getattr(loader, stats_util.LOADER_STATS_ATTR) == {}
+
+
+@pytest.mark.asyncio
+async def test_resolve_iter_empty():
+    assert [r async for r in Resolver().resolve_iter([])] == []
@@ -0,0 +1,80 @@
+from __future__ import annotations
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader
+from pydantic_resolve.utils.tracing import Tracer
+
+
+class NameLoader(DataLoader):
+    batches: list
+
+    async def batch_load_fn(self, keys):
+        self.batches.append(list(keys))
+        return [f'name-{k}' for k in keys]
+
+
+class Item(BaseModel):
+    id: int
+    owner_id: int
+
+    owner: str = ''
+    def resolve_owner(self, loader=Loader(NameLoader)):
+        return loader.load(self.owner_id)
+
+
+def gen_items(n):
+    for i in range(n):
+        yield Item(id=i, owner_id=i % 2)
+
+
+async def agen_items(n):
+    for item in gen_items(n):
+        yield item
+
+
+@pytest.mark.parametrize('source', [gen_items, agen_items])
+@pytest.mark.asyncio
+async def test_resolve_chunks(source):
+    batches = []
+    resolver = Resolver(loader_params={NameLoader: {'batches': batches}})
+    chunks = [chunk async for chunk in resolver.resolve_chunks(source(5), chunk_size=2)]
+
+    assert [[i.id for i in c] for c in chunks] == [[0, 1], [2, 3], [4]]
+    assert [i.owner for c in chunks for i in c] == ['name-0', 'name-1', 'name-0', 'name-1', 'name-0']
+
+    # loader instance and its cache are reused between chunks
+    assert batches == [[0, 1]]
+
+
+@pytest.mark.asyncio
+async def test_resolve_chunks_clear_cache():
+    batches = []
+    resolver = Resolver(loader_params={NameLoader: {'batches': batches}})
+    chunks = [chunk async for chunk in resolver.resolve_chunks(gen_items(5), chunk_size=2, clear_cache=True)]
+
+    assert len(chunks) == 3
+    assert batches == [[0, 1], [0, 1], [0]]
+
+
+@pytest.mark.asyncio
+async def test_resolve_chunks_invalid_size():
+    with pytest.raises(ValueError):
+        async for _ in Resolver().resolve_chunks([], chunk_size=0):
+            pass
+
+
+def broken_items(n):
+    yield from gen_items(n)
+    raise RuntimeError('source failed')
+
+
+@pytest.mark.asyncio
+async def test_resolve_chunks_finishes_on_error():
+    exported = []
+    resolver = Resolver(loader_params={NameLoader: {'batches': []}}, tracer=Tracer(exporter=exported.append))
+    with pytest.raises(RuntimeError):
+        async for _ in resolver.resolve_chunks(broken_items(3), chunk_size=2):
+            pass
+
+    assert len(exported) == 1 and resolver._trace is None
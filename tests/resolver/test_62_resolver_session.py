@@ -0,0 +1,109 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import ResolverSession, Loader
+
+
+class UserLoader(DataLoader):
+    batches: list
+
+    async def batch_load_fn(self, keys):
+        self.batches.append(sorted(keys))
+        return [dict(id=k, name=f'user-{k}') for k in keys]
+
+
+class UserName(BaseModel):
+    name: str
+
+
+class UserFull(BaseModel):
+    id: int
+    name: str
+
+
+class Task(BaseModel):
+    owner_id: int
+
+    owner: UserName | None = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.owner_id)
+
+
+class Sidebar(BaseModel):
+    owner_id: int
+
+    owner: UserFull | None = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.owner_id)
+
+
+@pytest.mark.asyncio
+async def test_session_shares_loader_cache():
+    batches = []
+    async with ResolverSession(loader_params={UserLoader: {'batches': batches}}) as session:
+        tasks = await session.resolve([Task(owner_id=1), Task(owner_id=2)])
+        sidebar = await session.resolve(Sidebar(owner_id=1))
+
+        assert tasks[1].owner.name == 'user-2'
+        assert sidebar.owner.id == 1
+        assert batches == [[1, 2], [1]]  # fields widened, user 1 is loaded again
+
+        await session.resolve([Task(owner_id=1)])
+        assert batches == [[1, 2], [1]]  # served from cache
+
+        # _query_meta covers the request types of both calls
+        loader = session.loader_instance_cache[f'{__name__}.UserLoader']
+        assert sorted(loader._query_meta['fields']) == ['id', 'name']
+
+
+class ProjectingUserLoader(DataLoader):
+    """only selects fields of _query_meta, like the ORM loaders"""
+    batches: list
+
+    async def batch_load_fn(self, keys):
+        fields = self._query_meta['fields']
+        self.batches.append(sorted(fields))
+        return [{f: (k if f == 'id' else f'user-{k}') for f in fields} for k in keys]
+
+
+class ProjectedTask(BaseModel):
+    owner_id: int
+
+    owner: UserName | None = None
+    def resolve_owner(self, loader=Loader(ProjectingUserLoader)):
+        return loader.load(self.owner_id)
+
+
+class ProjectedSidebar(BaseModel):
+    owner_id: int
+
+    owner: UserFull | None = None
+    def resolve_owner(self, loader=Loader(ProjectingUserLoader)):
+        return loader.load(self.owner_id)
+
+
+@pytest.mark.asyncio
+async def test_session_refetches_when_fields_widen():
+    batches = []
+    async with ResolverSession(loader_params={ProjectingUserLoader: {'batches': batches}}) as session:
+        await session.resolve(ProjectedTask(owner_id=1))
+        sidebar = await session.resolve(ProjectedSidebar(owner_id=1))
+        task = await session.resolve(ProjectedTask(owner_id=1))
+
+        assert sidebar.owner == UserFull(id=1, name='user-1')
+        assert task.owner.name == 'user-1'
+        assert batches == [['name'], ['id', 'name']]  # narrower request reuses the wider rows
+
+
+@pytest.mark.asyncio
+async def test_session_batches_concurrent_calls():
+    batches = []
+    with ResolverSession(loader_params={UserLoader: {'batches': batches}}) as session:
+        await asyncio.gather(
+            session.resolve([Task(owner_id=1)]),
+            session.resolve(Sidebar(owner_id=2)))
+        assert batches == [[1, 2]]
+
+    assert session.loader_instance_cache == {}
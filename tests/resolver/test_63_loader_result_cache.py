@@ -0,0 +1,82 @@
+from __future__ import annotations
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader
+from pydantic_resolve.utils.loader_cache import MemoryLoaderCache, MISSING
+
+
+CALLS = []
+
+
+class CurrencyLoader(DataLoader):
+    result_cache = MemoryLoaderCache(maxsize=2)
+
+    async def batch_load_fn(self, keys):
+        CALLS.append(list(keys))
+        return [dict(code=k, name=f'currency-{k}') for k in keys]
+
+
+class UserLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        CALLS.append(list(keys))
+        return [dict(id=k) for k in keys]
+
+
+class Currency(BaseModel):
+    code: str
+    name: str
+
+
+class User(BaseModel):
+    id: int
+
+
+class Price(BaseModel):
+    code: str
+    user_id: int = 0
+
+    currency: Currency | None = None
+    def resolve_currency(self, loader=Loader(CurrencyLoader)):
+        return loader.load(self.code)
+
+    user: User | None = None
+    def resolve_user(self, loader=Loader(UserLoader)):
+        return loader.load(self.user_id)
+
+
+@pytest.mark.asyncio
+async def test_result_cache_from_class_attribute():
+    cache = CurrencyLoader.result_cache
+    cache.clear()
+    CALLS.clear()
+
+    await Resolver().resolve([Price(code='usd'), Price(code='eur')])
+    prices = await Resolver().resolve([Price(code='usd'), Price(code='cny')])
+
+    assert prices[1].currency.name == 'currency-cny'
+    assert ['usd', 'eur'] in CALLS
+    assert ['cny'] in CALLS  # usd is served from result cache
+    assert [0] in CALLS and CALLS.count([0]) == 2  # UserLoader has no result cache
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 3, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_result_cache_from_loader_params():
+    cache = MemoryLoaderCache()
+    CALLS.clear()
+
+    for _ in range(2):
+        await Resolver(loader_params={UserLoader: {'result_cache': cache}}).resolve([Price(code='usd', user_id=1)])
+
+    assert CALLS.count([1]) == 1
+    assert cache.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_loader_cache_ttl():
+    cache = MemoryLoaderCache(ttl=0)
+    await cache.set_many({('a',): 1})
+    assert await cache.get_many([('a',)]) == [MISSING]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, ResolverSession
+from pydantic_resolve.utils.tracing import Tracer
+
+
+class ItemLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        return [dict(id=k, name=f'item-{k}') for k in keys]
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class Order(BaseModel):
+    id: int
+
+    item: Item | None = None
+    def resolve_item(self, loader=Loader(ItemLoader)):
+        return loader.load(self.id)
+
+    item_name: str = ''
+    def post_item_name(self):
+        return self.item.name if self.item else ''
+
+
+def _orders():
+    return [Order(id=1), Order(id=2), Order(id=3)]
+
+
+@pytest.mark.asyncio
+async def test_spans_of_methods_and_batches():
+    exported = []
+    resolver = Resolver(tracer=Tracer(exporter=exported.append))
+    orders = await resolver.resolve(_orders())
+
+    assert orders[2].item_name == 'item-3'
+    assert len(exported) == 1 and exported[0] is resolver.spans
+
+    root, *spans = resolver.spans
+    assert root['name'] == 'resolve' and root['parent_id'] is None
+    assert all(s['parent_id'] == root['context']['span_id'] for s in spans)
+    assert all(s['context']['trace_id'] == root['context']['trace_id'] for s in spans)
+
+    names = [s['name'] for s in spans]
+    assert names.count('Order.resolve_item') == 3
+    assert names.count('Order.post_item_name') == 3
+
+    batches = [s for s in spans if s['attributes']['pydantic_resolve.kind'] == 'loader']
+    assert len(batches) == 1
+    assert batches[0]['attributes']['pydantic_resolve.batch_size'] == 3
+    assert batches[0]['attributes']['pydantic_resolve.queue_ns'] >= 0
+    assert all(root['start_time'] <= s['start_time'] <= s['end_time'] <= root['end_time'] for s in spans)
+
+
+@pytest.mark.asyncio
+async def test_unsampled_resolve_has_no_spans():
+    exported = []
+    resolver = Resolver(tracer=Tracer(sample_rate=0, exporter=exported.append))
+    orders = await resolver.resolve(_orders())
+
+    assert orders[0].item_name == 'item-1'
+    assert resolver.spans == [] and exported == []
+
+
+@pytest.mark.asyncio
+async def test_capacity_drops_extra_spans():
+    resolver = Resolver(tracer=Tracer(capacity=2))
+    await resolver.resolve(_orders())
+
+    root, *spans = resolver.spans
+    assert len(spans) == 2
+    assert root['attributes']['pydantic_resolve.dropped_spans'] == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolvers_of_session_keep_own_traces():
+    async with ResolverSession(tracer=Tracer()) as session:
+        first, second = session.resolver(), session.resolver()
+        await asyncio.gather(first.resolve(_orders()), second.resolve([Order(id=4)]))
+
+    for resolver, methods in ((first, 3), (second, 1)):
+        _, *spans = resolver.spans
+        names = [s['name'] for s in spans]
+        assert names.count('Order.resolve_item') == methods
+        batches = [s for s in spans if s['attributes']['pydantic_resolve.kind'] == 'loader']
+        assert len(batches) == 1
+        assert batches[0]['attributes']['pydantic_resolve.batch_size'] == 4
+
+
+def test_resolve_sync_is_traced():
+    class Node(BaseModel):
+        name: str
+        upper: str = ''
+        def post_upper(self):
+            return self.name.upper()
+
+    resolver = Resolver(tracer=Tracer())
+    resolver.resolve_sync(Node(name='a'))
+    assert [s['name'] for s in resolver.spans] == ['resolve', 'Node.post_upper']
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(ValueError):
+        Tracer(sample_rate=2)
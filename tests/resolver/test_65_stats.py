@@ -0,0 +1,97 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, ResolverSession
+
+
+class UserLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        return [dict(id=k, name=f'user-{k}') for k in keys]
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+class Task(BaseModel):
+    id: int
+    owner_id: int
+
+    owner: User | None = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.owner_id)
+
+
+class Story(BaseModel):
+    id: int
+    tasks: list[Task]
+
+    owner: User | None = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.id)
+
+
+def _stories():
+    return [
+        Story(id=1, tasks=[Task(id=1, owner_id=1), Task(id=2, owner_id=2)]),
+        Story(id=2, tasks=[Task(id=3, owner_id=2)]),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_loader_and_node_stats(engine):
+    resolver = Resolver(engine=engine)
+    await resolver.resolve(_stories())
+
+    stats = resolver.stats
+    path = f'{UserLoader.__module__}.{UserLoader.__qualname__}'
+    loader_stats = stats.loaders[path]
+
+    assert loader_stats.loads == 5
+    assert loader_stats.keys == 2  # keys 1, 2
+    assert loader_stats.cache_hits == 3
+    assert loader_stats.min_keys <= loader_stats.avg_keys <= loader_stats.max_keys == 2
+    assert loader_stats.total_ns >= loader_stats.max_ns > 0
+
+    assert stats.nodes == {
+        f'{Story.__module__}.{Story.__qualname__}': 2,
+        f'{Task.__module__}.{Task.__qualname__}': 3,
+    }  # User has nothing to resolve, it is not traversed
+
+    report = stats.as_dict()
+    assert report['loaders'][path]['cache_hits'] == 3
+
+
+@pytest.mark.asyncio
+async def test_stats_are_per_resolve():
+    async with ResolverSession() as session:
+        first = session.resolver()
+        await first.resolve(_stories())
+        second = session.resolver()
+        await second.resolve(_stories())
+
+    path = f'{UserLoader.__module__}.{UserLoader.__qualname__}'
+    assert first.stats.loaders[path].batches >= 1
+    # all keys are cached by the session's loader instance
+    assert second.stats.loaders[path].batches == 0
+    assert second.stats.loaders[path].cache_hits == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolvers_of_session_keep_own_stats():
+    async with ResolverSession() as session:
+        first, second = session.resolver(), session.resolver()
+        await asyncio.gather(
+            first.resolve(_stories()),
+            second.resolve([Story(id=3, tasks=[Task(id=4, owner_id=4)])]))
+
+    path = f'{UserLoader.__module__}.{UserLoader.__qualname__}'
+    assert first.stats.loaders[path].loads == 5
+    assert second.stats.loaders[path].loads == 2
+    # the batches were shared, each resolver took part in them
+    assert first.stats.loaders[path].batches >= 1
+    assert second.stats.loaders[path].batches >= 1
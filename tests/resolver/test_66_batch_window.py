@@ -0,0 +1,86 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader
+from pydantic_resolve.utils.batching import BatchWindow
+
+
+BATCHES = []
+
+
+class TagLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        BATCHES.append(list(keys))
+        return [f'tag-{k}' for k in keys]
+
+
+class WindowedTagLoader(TagLoader):
+    batch_window = BatchWindow(delay_us=20_000)
+
+
+class Post(BaseModel):
+    id: int
+
+    tag: str = ''
+    async def resolve_tag(self, loader=Loader(TagLoader)):
+        await asyncio.sleep(0.001 * (self.id % 3))  # branches reach the loader at different times
+        return await loader.load(self.id)
+
+
+class WindowedPost(BaseModel):
+    id: int
+
+    tag: str = ''
+    async def resolve_tag(self, loader=Loader(WindowedTagLoader)):
+        await asyncio.sleep(0.001 * (self.id % 3))
+        return await loader.load(self.id)
+
+
+@pytest.mark.asyncio
+async def test_tick_dispatches_per_arrival():
+    BATCHES.clear()
+    posts = await Resolver().resolve([Post(id=i) for i in range(6)])
+    assert [p.tag for p in posts] == [f'tag-{i}' for i in range(6)]
+    assert len(BATCHES) > 1
+
+
+@pytest.mark.asyncio
+async def test_delay_from_loader_params():
+    BATCHES.clear()
+    resolver = Resolver(loader_params={TagLoader: {'batch_window': BatchWindow(delay_us=20_000)}})
+    posts = await resolver.resolve([Post(id=i) for i in range(6)])
+    assert [p.tag for p in posts] == [f'tag-{i}' for i in range(6)]
+    assert len(BATCHES) == 1 and sorted(BATCHES[0]) == list(range(6))
+
+
+@pytest.mark.asyncio
+async def test_delay_from_class_attribute():
+    BATCHES.clear()
+    await Resolver().resolve([WindowedPost(id=i) for i in range(6)])
+    assert len(BATCHES) == 1
+
+
+@pytest.mark.asyncio
+async def test_max_keys_dispatches_early():
+    BATCHES.clear()
+    resolver = Resolver(loader_params={TagLoader: {'batch_window': BatchWindow(delay_us=1_000_000, max_keys=2)}})
+    posts = await asyncio.wait_for(resolver.resolve([Post(id=i) for i in range(6)]), timeout=0.5)
+    assert [p.tag for p in posts] == [f'tag-{i}' for i in range(6)]
+    assert BATCHES == [[0, 3], [1, 4], [2, 5]]
+
+
+@pytest.mark.asyncio
+async def test_max_keys_with_tick():
+    BATCHES.clear()
+    resolver = Resolver(loader_params={TagLoader: {'batch_window': BatchWindow(max_keys=4)}})
+    await resolver.resolve([Post(id=i * 3) for i in range(6)])  # all arrive in the same tick
+    assert BATCHES == [[0, 3, 6, 9], [12, 15]]
+
+
+def test_invalid_batch_window():
+    with pytest.raises(ValueError):
+        BatchWindow(delay_us=-1)
+    with pytest.raises(ValueError):
+        BatchWindow(max_keys=0)
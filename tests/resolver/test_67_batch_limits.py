@@ -0,0 +1,91 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader
+
+
+BATCHES = []
+RUNNING = [0, 0]  # current, peak
+
+
+class ScoreLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        BATCHES.append(list(keys))
+        RUNNING[0] += 1
+        RUNNING[1] = max(RUNNING)
+        await asyncio.sleep(0.005)
+        RUNNING[0] -= 1
+        return [k * 10 for k in keys]
+
+
+class LimitedScoreLoader(ScoreLoader):
+    max_batch_size = 3
+    max_concurrent_batches = 1
+
+
+class Student(BaseModel):
+    id: int
+
+    score: int = 0
+    def resolve_score(self, loader=Loader(ScoreLoader)):
+        return loader.load(self.id)
+
+
+class LimitedStudent(BaseModel):
+    id: int
+
+    score: int = 0
+    def resolve_score(self, loader=Loader(LimitedScoreLoader)):
+        return loader.load(self.id)
+
+
+def _reset():
+    BATCHES.clear()
+    RUNNING[:] = [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_runs_chunks_in_parallel():
+    _reset()
+    resolver = Resolver(loader_params={ScoreLoader: {'max_batch_size': 3}})
+    students = await resolver.resolve([Student(id=i) for i in range(8)])
+
+    assert [s.score for s in students] == [i * 10 for i in range(8)]
+    assert BATCHES == [[0, 1, 2], [3, 4, 5], [6, 7]]
+    assert RUNNING[1] == 3
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_batches():
+    _reset()
+    resolver = Resolver(loader_params={ScoreLoader: {'max_batch_size': 3, 'max_concurrent_batches': 2}})
+    students = await resolver.resolve([Student(id=i) for i in range(8)])
+
+    assert [s.score for s in students] == [i * 10 for i in range(8)]
+    assert len(BATCHES) == 3
+    assert RUNNING[1] == 2
+
+
+@pytest.mark.asyncio
+async def test_limits_from_class_attributes():
+    _reset()
+    students = await Resolver().resolve([LimitedStudent(id=i) for i in range(8)])
+
+    assert [s.score for s in students] == [i * 10 for i in range(8)]
+    assert len(BATCHES) == 3
+    assert RUNNING[1] == 1
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_from_global_loader_param():
+    _reset()
+    await Resolver(global_loader_param={'max_batch_size': 4}).resolve([Student(id=i) for i in range(8)])
+    assert BATCHES == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+
+@pytest.mark.asyncio
+async def test_invalid_limit():
+    with pytest.raises(ValueError):
+        await Resolver(loader_params={ScoreLoader: {'max_concurrent_batches': 0}}).resolve([Student(id=1)])
@@ -0,0 +1,145 @@
+from __future__ import annotations
+import asyncio
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, ResolverSession, recursive
+
+
+# parent id -> child ids, an irregular tree of 4 levels below roots 1, 2
+TREE = {
+    1: [10, 11],
+    2: [20],
+    10: [100, 101, 102],
+    11: [],
+    20: [200],
+    100: [1000],
+    101: [],
+    102: [],
+    200: [2000, 2001],
+    1000: [10000],
+    2000: [],
+    2001: [],
+    10000: [],
+}
+
+BATCHES = []
+SUBTREE_CALLS = []
+
+
+class ChildrenLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        BATCHES.append(sorted(keys))
+        await asyncio.sleep(0.001 * (keys[0] % 3))
+        return [[dict(id=c) for c in TREE.get(k, [])] for k in keys]
+
+
+class SubtreeChildrenLoader(ChildrenLoader):
+    async def batch_load_subtree(self, keys, max_depth):
+        SUBTREE_CALLS.append((sorted(keys), max_depth))
+        result = {}
+        level = list(keys)
+        for _ in range(max_depth):
+            for k in level:
+                result[k] = [dict(id=c) for c in TREE.get(k, [])]
+            level = [c for k in level for c in TREE.get(k, [])]
+        return result
+
+
+class Category(BaseModel):
+    id: int
+
+    children: list[Category] = []
+    @recursive(max_depth=3)
+    async def resolve_children(self, loader=Loader(ChildrenLoader)):
+        await asyncio.sleep(0.001 * (self.id % 4))  # branches reach the loader at different times
+        return await loader.load(self.id)
+
+    size: int = 0
+    def post_size(self):
+        return 1 + sum(c.size for c in self.children)
+
+
+class SubtreeCategory(BaseModel):
+    id: int
+
+    children: list[SubtreeCategory] = []
+    @recursive(max_depth=3)
+    def resolve_children(self, loader=Loader(SubtreeChildrenLoader)):
+        return loader.load(self.id)
+
+
+class FragileCategory(BaseModel):
+    id: int
+
+    children: list[FragileCategory] = []
+    @recursive(max_depth=2)
+    def resolve_children(self, loader=Loader(ChildrenLoader)):
+        if self.id == 2:
+            raise ValueError('broken category')
+        return self._load_children(loader)
+
+    async def _load_children(self, loader):
+        return await loader.load(self.id)
+
+
+class Shop(BaseModel):
+    id: int
+    categories: list[Category] = []
+
+
+def _depth(category) -> int:
+    return 1 + max((_depth(c) for c in category.children), default=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_one_batch_per_depth(engine):
+    BATCHES.clear()
+    roots = await Resolver(engine=engine).resolve([Category(id=1), Category(id=2)])
+
+    assert BATCHES == [[1, 2], [10, 11, 20], [100, 101, 102, 200]]
+    assert [_depth(r) for r in roots] == [4, 4]  # roots + 3 levels of children
+    assert roots[0].size == 7 and roots[1].size == 5
+
+
+@pytest.mark.asyncio
+async def test_recursive_below_other_classes():
+    BATCHES.clear()
+    shop = await Resolver().resolve(Shop(id=1, categories=[Category(id=1), Category(id=2)]))
+
+    assert len(BATCHES) == 3
+    assert shop.categories[0].children[0].children[0].children == [Category(id=1000, size=1)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_subtree_hook_primes_all_levels(engine):
+    BATCHES.clear()
+    SUBTREE_CALLS.clear()
+    resolver = Resolver(engine=engine)
+    roots = await resolver.resolve([SubtreeCategory(id=1), SubtreeCategory(id=2)])
+
+    assert SUBTREE_CALLS == [([1, 2], 3)]
+    assert BATCHES == []
+    assert [_depth(r) for r in roots] == [4, 4]
+    path = f'{SubtreeChildrenLoader.__module__}.{SubtreeChildrenLoader.__qualname__}'
+    assert resolver.stats.loaders[path].batches == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_failed_level_releases_loader(engine):
+    async with ResolverSession(engine=engine) as session:
+        with pytest.raises(ValueError):
+            # 1 is waiting on the gate, 20 never runs after 2 raises
+            await session.resolve([FragileCategory(id=1), FragileCategory(id=2), FragileCategory(id=20)])
+
+        roots = await asyncio.wait_for(session.resolve([FragileCategory(id=1)]), timeout=1)
+
+    assert [c.id for c in roots[0].children] == [10, 11]
+
+
+def test_invalid_max_depth():
+    with pytest.raises(ValueError):
+        recursive(max_depth=-1)
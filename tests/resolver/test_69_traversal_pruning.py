@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import Any
+import pytest
+from pydantic import BaseModel
+from pydantic_resolve import Resolver
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+class Label(BaseModel):
+    text: str
+
+    upper: str = ''
+    def post_upper(self):
+        return self.text.upper()
+
+
+class Chart(BaseModel):
+    name: str
+
+    points: list[Point] = []
+    def resolve_points(self):
+        return [Point(x=i, y=i) for i in range(1000)]
+
+    items: list[Point | Label] = []
+    def resolve_items(self):
+        return [Point(x=0, y=0), Label(text='a'), Point(x=1, y=1), Label(text='b')]
+
+    anything: Any = None
+    def resolve_anything(self):
+        return Label(text='c')
+
+
+def test_plan_skips_fields_of_plain_classes():
+    _, plans = Resolver._load_metadata(Chart)
+    steps = {step.field: step.traverse for step in plans[Chart].resolve_steps}
+    assert steps == {'points': False, 'items': True, 'anything': True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_union_list_and_opaque_field(engine):
+    chart = await Resolver(engine=engine).resolve(Chart(name='c'))
+
+    assert len(chart.points) == 1000
+    assert [i.upper for i in chart.items if isinstance(i, Label)] == ['A', 'B']
+    assert chart.anything.upper == 'C'  # Any is traversed at runtime
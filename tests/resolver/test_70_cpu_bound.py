@@ -0,0 +1,112 @@
+from __future__ import annotations
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from pydantic import BaseModel
+from pydantic_resolve import Resolver, cpu_bound
+from pydantic_resolve.utils.tracing import Tracer
+
+
+THREADS = set()
+
+
+class Article(BaseModel):
+    id: int
+    body: str
+
+    html: str = ''
+    @cpu_bound(batch_size=4)
+    def post_html(self):
+        THREADS.add(threading.get_ident())
+        return f'<p>{self.body.upper()}</p>'
+
+    length: int = 0
+    def post_length(self):
+        return len(self.body)
+
+
+class Section(BaseModel):
+    title: str
+    articles: list[Article] = []
+
+    summary: str = ''
+    @cpu_bound()
+    def post_summary(self, context):
+        return f"{context['prefix']}{self.title}: {len(self.articles)}"
+
+
+class Page(BaseModel):
+    id: int
+
+    score: int = 0
+    @cpu_bound(batch_size=2)
+    def post_score(self):
+        if self.id < 0:
+            raise ValueError('negative id')
+        return sum(i * i for i in range(self.id))
+
+
+def _articles(n):
+    return [Article(id=i, body=f'body {i}') for i in range(n)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_runs_in_executor_by_batches(engine):
+    THREADS.clear()
+    resolver = Resolver(engine=engine, executor=ThreadPoolExecutor(2))
+    articles = await resolver.resolve(_articles(10))
+
+    assert [a.html for a in articles] == [f'<p>BODY {i}</p>' for i in range(10)]
+    assert [a.length for a in articles] == [6] * 10
+    assert threading.get_ident() not in THREADS
+
+    stats = resolver.stats.executor[f'{Article.__module__}.{Article.__qualname__}.post_html']
+    assert stats.calls == 10
+    assert stats.batches == 3
+    assert stats.queue_ns >= stats.max_queue_ns >= 0
+
+
+@pytest.mark.asyncio
+async def test_context_and_default_executor():
+    sections = [Section(title='a', articles=_articles(2)), Section(title='b')]
+    sections = await Resolver(context={'prefix': '#'}).resolve(sections)
+    assert [s.summary for s in sections] == ['#a: 2', '#b: 0']
+
+
+@pytest.mark.asyncio
+async def test_process_pool():
+    with ProcessPoolExecutor(2) as pool:
+        pages = await Resolver(executor=pool).resolve([Page(id=i) for i in range(5)])
+    assert [p.score for p in pages] == [0, 0, 1, 5, 14]
+
+
+@pytest.mark.asyncio
+async def test_error_is_raised():
+    with pytest.raises(ValueError, match='negative id'):
+        await Resolver().resolve([Page(id=1), Page(id=-1)])
+
+
+@pytest.mark.asyncio
+async def test_executor_spans():
+    resolver = Resolver(tracer=Tracer(sample_rate=1.0))
+    await resolver.resolve([Page(id=i) for i in range(3)])
+
+    spans = [s for s in resolver.spans if s['attributes'].get('pydantic_resolve.kind') == 'executor']
+    assert len(spans) == 2
+    assert sorted(s['attributes']['pydantic_resolve.batch_size'] for s in spans) == [1, 2]
+    assert all(s['attributes']['pydantic_resolve.queue_ns'] >= 0 for s in spans)
+
+
+def test_invalid_usage():
+    with pytest.raises(ValueError):
+        cpu_bound(batch_size=0)
+    with pytest.raises(TypeError):
+        cpu_bound()(lambda self: None)
+
+    with pytest.raises(TypeError):
+        class Bad(BaseModel):
+            x: int = 0
+            @cpu_bound()
+            async def post_x(self):
+                return 1
@@ -0,0 +1,140 @@
+from __future__ import annotations
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, blocking
+
+
+REQUEST_ID = contextvars.ContextVar('request_id', default=None)
+LOOP_THREAD = []
+
+
+def _query(n):
+    """a legacy sync query"""
+    time.sleep(0.05)
+    return [dict(id=i) for i in range(n)]
+
+
+class Row(BaseModel):
+    id: int
+
+    thread_free: bool = False
+    def resolve_thread_free(self):
+        return threading.get_ident() != LOOP_THREAD[0]
+
+
+class Report(BaseModel):
+    id: int
+
+    rows: list[Row] = []
+    @blocking
+    def resolve_rows(self):
+        return _query(self.id)
+
+    request_id: str | None = None
+    @blocking
+    def resolve_request_id(self):
+        return REQUEST_ID.get()
+
+
+@blocking
+class BlockingReport(BaseModel):
+    id: int
+
+    rows: list[Row] = []
+    def resolve_rows(self):
+        return _query(self.id)
+
+    name: str = ''
+    async def resolve_name(self):
+        return f'report-{self.id}'
+
+
+class NameLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        return [f'name-{k}' for k in keys]
+
+
+class PlainReport(BaseModel):
+    id: int
+
+    rows: list[Row] = []
+    def resolve_rows(self):
+        return _query(self.id)
+
+    name: str = ''
+    def resolve_name(self, loader=Loader(NameLoader)):
+        return loader.load(self.id)
+
+
+@pytest.fixture(autouse=True)
+def _loop_thread():
+    LOOP_THREAD[:] = [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_method_level(engine):
+    REQUEST_ID.set('req-1')
+    start = time.perf_counter()
+    reports = await Resolver(engine=engine, blocking_executor=ThreadPoolExecutor(4)).resolve(
+        [Report(id=i) for i in range(1, 5)])
+
+    assert time.perf_counter() - start < 0.15  # 4 x 50ms in parallel
+    assert [len(r.rows) for r in reports] == [1, 2, 3, 4]
+    assert all(isinstance(row, Row) for r in reports for row in r.rows)  # converted and traversed
+    assert [row.thread_free for row in reports[1].rows] == [False, False]  # not marked, on loop
+    assert [r.request_id for r in reports] == ['req-1'] * 4
+
+
+@pytest.mark.asyncio
+async def test_class_level():
+    start = time.perf_counter()
+    reports = await Resolver().resolve([BlockingReport(id=i) for i in range(1, 5)])
+
+    assert time.perf_counter() - start < 0.15
+    assert [r.rows[0].thread_free for r in reports] == [False] * 4
+    assert [r.name for r in reports] == [f'report-{i}' for i in range(1, 5)]
+
+
+@pytest.mark.asyncio
+async def test_resolver_level():
+    start = time.perf_counter()
+    reports = await Resolver(blocking=True).resolve([PlainReport(id=i) for i in range(1, 5)])
+
+    assert time.perf_counter() - start < 0.15
+    assert [r.rows[0].thread_free for r in reports] == [True] * 4
+    assert [r.name for r in reports] == [f'name-{i}' for i in range(1, 5)]  # dataloader stays on loop
+
+
+@pytest.mark.asyncio
+async def test_hooks_see_results():
+    seen = []
+    await Resolver(resolved_hooks=[lambda node, field, val: seen.append(field)]).resolve(Report(id=1))
+    assert sorted(seen) == ['request_id', 'rows', 'thread_free']
+
+
+def test_invalid_usage():
+    with pytest.raises(TypeError):
+        blocking(lambda self: None)
+
+    with pytest.raises(TypeError):
+        class AsyncBlocking(BaseModel):
+            x: int = 0
+            @blocking
+            async def resolve_x(self):
+                return 1
+
+    class LoaderBlocking(BaseModel):
+        name: str = ''
+        @blocking
+        def resolve_name(self, loader=Loader(NameLoader)):
+            return loader.load(1)
+
+    with pytest.raises(TypeError, match='can not be blocking'):
+        asyncio.run(Resolver().resolve(LoaderBlocking()))
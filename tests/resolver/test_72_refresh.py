@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import Annotated
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, Collector, SendTo, ResolverTargetAttrNotFound
+
+
+STATUS = {}
+COLUMNS = {1: [1, 2, 3], 2: [4, 5]}
+CALLS = []
+
+
+class StatusLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        CALLS.append(('status', sorted(keys)))
+        return [STATUS[k] for k in keys]
+
+
+class TasksLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        CALLS.append(('tasks', sorted(keys)))
+        return [[dict(id=t) for t in COLUMNS[k]] for k in keys]
+
+
+class Task(BaseModel):
+    id: int
+
+    status: Annotated[str, SendTo('statuses')] = ''
+    def resolve_status(self, loader=Loader(StatusLoader)):
+        return loader.load(self.id)
+
+
+class Column(BaseModel):
+    id: int
+
+    tasks: list[Task] = []
+    def resolve_tasks(self, loader=Loader(TasksLoader)):
+        return loader.load(self.id)
+
+    done: int = 0
+    def post_done(self):
+        return sum(t.status == 'done' for t in self.tasks)
+
+
+class Board(BaseModel):
+    columns: list[Column] = []
+
+    statuses: list[str] = []
+    def post_statuses(self, collector=Collector('statuses')):
+        return sorted(collector.values())
+
+    done: int = 0
+    def post_done(self):
+        return sum(c.done for c in self.columns)
+
+
+async def _board() -> Board:
+    STATUS.update({1: 'todo', 2: 'done', 3: 'todo', 4: 'todo', 5: 'done'})
+    COLUMNS[1] = [1, 2, 3]
+    board = await Resolver().resolve(Board(columns=[Column(id=1), Column(id=2)]))
+    CALLS.clear()
+    return board
+
+
+@pytest.mark.asyncio
+async def test_refresh_field_and_path():
+    board = await _board()
+    assert board.done == 2
+
+    STATUS[3] = 'done'
+    task = board.columns[0].tasks[2]
+    await Resolver().refresh(board, [(task, 'status')])
+
+    assert CALLS == [('status', [3])]  # nothing else is loaded again
+    assert task.status == 'done'
+    assert [c.done for c in board.columns] == [2, 1]
+    assert board.done == 3
+    assert board.statuses == ['done', 'done', 'done', 'todo', 'todo']  # untouched tasks collected again
+
+
+@pytest.mark.asyncio
+async def test_refresh_node_resolves_new_subtree():
+    board = await _board()
+
+    COLUMNS[1] = [1, 6]
+    STATUS[6] = 'done'
+    column = board.columns[0]
+    await Resolver().refresh(board, [column])
+
+    assert CALLS == [('tasks', [1]), ('status', [1, 6])]
+    assert [t.id for t in column.tasks] == [1, 6]
+    assert column.done == 1
+    assert board.done == 2
+    assert board.statuses == ['done', 'done', 'todo', 'todo']
+
+
+@pytest.mark.asyncio
+async def test_invalid_dirty_items():
+    board = await _board()
+
+    with pytest.raises(ResolverTargetAttrNotFound):
+        await Resolver().refresh(board, [(board.columns[0], 'done')])
+
+    with pytest.raises(ValueError):
+        await Resolver().refresh(board, [Task(id=1)])
@@ -0,0 +1,106 @@
+from __future__ import annotations
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, ResolverTargetAttrNotFound
+
+
+CALLS = []
+
+
+class UserLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        CALLS.append('user')
+        return [dict(id=k, name=f'u{k}') for k in keys]
+
+
+class TaskLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        CALLS.append('task')
+        return [[dict(id=k * 10, owner_id=k), dict(id=k * 10 + 1, owner_id=k)] for k in keys]
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+class Task(BaseModel):
+    id: int
+    owner_id: int
+    title: str = ''
+    note: str = ''
+
+    owner: User | None = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.owner_id)
+
+    label: str = ''
+    def post_label(self):
+        CALLS.append('label')
+        return f'task-{self.id}'
+
+
+class Story(BaseModel):
+    id: int
+
+    tasks: list[Task] = []
+    def resolve_tasks(self, loader=Loader(TaskLoader)):
+        return loader.load(self.id)
+
+    task_count: int = 0
+    def post_task_count(self):
+        return len(self.tasks)
+
+
+def _stories():
+    return [Story(id=1), Story(id=2)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_include(engine):
+    CALLS.clear()
+    resolver = Resolver(engine=engine, include={'id': True, 'tasks': {'id', 'label'}, 'task_count': True})
+    stories = await resolver.resolve(_stories())
+
+    assert CALLS.count('task') == 1 and CALLS.count('label') == 4
+    assert 'user' not in CALLS
+    assert [s.task_count for s in stories] == [2, 2]
+    assert stories[0].tasks[0].owner is None
+    assert stories[0].tasks[0].label == 'task-10'
+
+    # loader is not created, _query_meta of TaskLoader only has selected and required fields
+    assert set(resolver.loader_instance_cache) == {f'{TaskLoader.__module__}.{TaskLoader.__qualname__}'}
+    task_loader = next(iter(resolver.loader_instance_cache.values()))
+    assert sorted(task_loader._query_meta['fields']) == ['id', 'label', 'owner_id']
+
+
+@pytest.mark.asyncio
+async def test_exclude():
+    CALLS.clear()
+    stories = await Resolver(exclude={'tasks': {'owner', 'label'}}).resolve(_stories())
+    assert CALLS == ['task']
+    assert len(stories[0].tasks) == 2 and stories[0].tasks[0].owner is None
+
+    CALLS.clear()
+    stories = await Resolver(exclude={'tasks'}).resolve(_stories())
+    assert CALLS == []
+    assert stories[0].tasks == [] and stories[0].task_count == 0
+
+
+@pytest.mark.asyncio
+async def test_full_selection_resolves_everything():
+    CALLS.clear()
+    stories = await Resolver(include={'tasks': True}).resolve(_stories())
+    assert stories[0].tasks[0].owner == User(id=1, name='u1')
+
+
+@pytest.mark.asyncio
+async def test_invalid_spec():
+    with pytest.raises(ResolverTargetAttrNotFound):
+        await Resolver(include={'taskz'}).resolve(_stories())
+    with pytest.raises(ResolverTargetAttrNotFound):
+        await Resolver(exclude={'tasks': {'owner': {'nickname'}}}).resolve(_stories())
+    with pytest.raises(ResolverTargetAttrNotFound):
+        await Resolver(include={'task_count': {'x'}}).resolve(_stories())
@@ -0,0 +1,142 @@
+from __future__ import annotations
+import asyncio
+import gc
+import weakref
+from typing import Annotated
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, Collector, ExposeAs, lazy, ResolverTargetAttrNotFound
+
+
+BATCHES = []
+
+
+class CommentLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        BATCHES.append(sorted(keys))
+        return [[dict(id=k * 10 + i, text=f'c{i}') for i in range(k)] for k in keys]
+
+
+class Comment(BaseModel):
+    id: int
+    text: str
+
+    label: str = ''
+    def post_label(self, ancestor_context):
+        return f"{ancestor_context.get('blog_name', '')}/{self.text}"
+
+
+class Post(BaseModel):
+    id: int
+    featured: bool = False
+
+    comments: list[Comment] = []
+    @lazy
+    def resolve_comments(self, loader=Loader(CommentLoader)):
+        return loader.load(self.id)
+
+    comment_count: int = 0
+    async def post_comment_count(self, load_field):
+        if not self.featured:
+            return 0
+        return len(await load_field('comments'))
+
+
+class Blog(BaseModel):
+    name: Annotated[str, ExposeAs('blog_name')]
+    posts: list[Post] = []
+
+
+class Tag(BaseModel):
+    __pydantic_resolve_collect__ = {'tags': 'all_tags'}
+    id: int
+
+    tags: list[Comment] = []
+    @lazy
+    def resolve_tags(self, loader=Loader(CommentLoader)):
+        return loader.load(self.id)
+
+
+class TagCloud(BaseModel):
+    items: list[Tag] = []
+
+    tag_count: int = 0
+    def post_tag_count(self, collector=Collector('all_tags', flat=True)):
+        return len(collector.values())
+
+
+def _blog():
+    return Blog(name='b', posts=[Post(id=1), Post(id=2, featured=True), Post(id=3, featured=True)])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_lazy_asked_by_post(engine):
+    BATCHES.clear()
+    blog = await Resolver(engine=engine).resolve(_blog())
+
+    assert BATCHES == [[2, 3]]  # only featured posts, in one batch
+    assert [p.comment_count for p in blog.posts] == [0, 2, 3]
+    assert blog.posts[0].comments == []
+    assert blog.posts[1].comments[0].label == 'b/c0'  # lazy value is traversed
+
+
+@pytest.mark.asyncio
+async def test_load_field_after_resolve():
+    BATCHES.clear()
+    resolver = Resolver()
+    blog = await resolver.resolve(_blog())
+    BATCHES.clear()
+
+    first = blog.posts[0]
+    comments, again = await asyncio.gather(
+        resolver.load_field(first, 'comments'),
+        resolver.load_field(first, 'comments'))
+
+    assert BATCHES == [[1]]  # concurrent requests of one node share one task
+    assert comments == again == first.comments
+    assert first.comments[0].label == 'b/c0'  # scope of the last resolve is kept
+
+    BATCHES.clear()
+    await resolver.load_field(first, 'comments')
+    assert BATCHES == []
+
+
+@pytest.mark.asyncio
+async def test_load_field_batches_requests():
+    BATCHES.clear()
+    posts = [Post(id=4), Post(id=5)]
+    resolver = Resolver()
+    await resolver.resolve(posts)
+    assert BATCHES == []
+
+    await asyncio.gather(*[resolver.load_field(p, 'comments') for p in posts])
+    assert BATCHES == [[4, 5]]
+    assert [len(p.comments) for p in posts] == [4, 5]
+
+    with pytest.raises(ResolverTargetAttrNotFound):
+        await resolver.load_field(posts[0], 'comment_count')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_lazy_asked_by_collector(engine):
+    BATCHES.clear()
+    cloud = await Resolver(engine=engine).resolve(TagCloud(items=[Tag(id=1), Tag(id=2)]))
+    assert BATCHES == [[1, 2]]
+    assert cloud.tag_count == 3
+
+
+@pytest.mark.asyncio
+async def test_resolve_chunks_releases_lazy_scope():
+    BATCHES.clear()
+    resolver = Resolver()
+    refs = []
+    async for chunk in resolver.resolve_chunks((Post(id=i) for i in range(6)), chunk_size=2, clear_cache=True):
+        gc.collect()
+        assert all(r() is None for r in refs)  # frames of consumed chunks are not kept
+        refs = [weakref.ref(p) for p in chunk]
+        del chunk
+
+    assert BATCHES == []
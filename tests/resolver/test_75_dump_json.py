@@ -0,0 +1,59 @@
+from __future__ import annotations
+import json
+import pytest
+from pydantic import BaseModel, Field
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, dump_json
+
+
+class UserLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        return [dict(id=k, name=f'u{k}', password='secret') for k in keys]
+
+
+class User(BaseModel):
+    id: int
+    name: str
+    password: str = Field(default='', exclude=True)
+
+
+class Task(BaseModel):
+    id: int
+    owner_id: int = Field(exclude=True)
+
+    owner: User | None = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.owner_id)
+
+
+class Bug(Task):
+    severity: int = 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_resolve_to_json(engine):
+    tasks = [Task(id=1, owner_id=7), Task(id=2, owner_id=8)]
+    encoded = await Resolver(engine=engine).resolve_to_json(tasks)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == [t.model_dump(mode='json') for t in tasks]  # same as model_dump
+    assert b'secret' not in encoded and b'owner_id' not in encoded
+
+    single = await Resolver().resolve_to_json(Task(id=3, owner_id=9), exclude_none=True, indent=None)
+    assert json.loads(single) == {'id': 3, 'owner': {'id': 9, 'name': 'u9'}}
+
+
+@pytest.mark.asyncio
+async def test_annotation_and_empty_list():
+    items = [Task(id=1, owner_id=1), Bug(id=2, owner_id=2, severity=3)]
+    encoded = await Resolver(annotation=Task | Bug).resolve_to_json(items)
+    assert [d.get('severity') for d in json.loads(encoded)] == [None, 3]
+
+    assert await Resolver().resolve_to_json([]) == b'[]'
+    assert dump_json(None) == b'null'
+
+
+def test_mixed_list_without_annotation():
+    items = [Task(id=1, owner_id=1), Bug(id=2, owner_id=2, severity=3)]
+    assert json.loads(dump_json(items)) == [i.model_dump(mode='json') for i in items]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+import gc
+import json
+import weakref
+from dataclasses import dataclass, field
+from typing import Annotated
+import pytest
+from pydantic import BaseModel
+from aiodataloader import DataLoader
+from pydantic_resolve import Resolver, Loader, Collector, ExposeAs, SendTo
+from pydantic_resolve.utils.types import get_model_fields
+
+
+class UserLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        return [dict(id=k, name=f'u{k}') for k in keys]
+
+
+class TaskLoader(DataLoader):
+    async def batch_load_fn(self, keys):
+        return [[dict(id=k * 10 + i, owner_id=i) for i in range(1, 3)] for k in keys]
+
+
+@dataclass(slots=True)
+class User:
+    id: int
+    name: str
+
+
+@dataclass(slots=True)
+class Task:
+    id: int
+    owner_id: int
+
+    owner: Annotated[User | None, SendTo('owners')] = None
+    def resolve_owner(self, loader=Loader(UserLoader)):
+        return loader.load(self.owner_id)
+
+    path: str = ''
+    def post_path(self, ancestor_context):
+        return f"{ancestor_context['story_name']}/{self.id}"
+
+
+@dataclass(slots=True)
+class Story:
+    id: int
+    name: Annotated[str, ExposeAs('story_name')]
+
+    tasks: list[Task] = field(default_factory=list)
+    def resolve_tasks(self, loader=Loader(TaskLoader)):
+        return loader.load(self.id)
+
+    owners: list[str] = field(default_factory=list)
+    def post_owners(self, collector=Collector('owners')):
+        return sorted({u.name for u in collector.values()})
+
+
+class Board(BaseModel):
+    stories: list[Story] = []
+
+    task_count: int = 0
+    def post_task_count(self):
+        return sum(len(s.tasks) for s in self.stories)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('engine', ['recursive', 'level'])
+async def test_slots_dataclass_nodes(engine):
+    board = Board(stories=[Story(id=1, name='a'), Story(id=2, name='b')])
+    board = await Resolver(engine=engine).resolve(board)
+
+    task = board.stories[0].tasks[0]
+    assert isinstance(task, Task) and not hasattr(task, '__dict__')  # converted by TypeAdapter
+    assert task.owner == User(id=1, name='u1')
+    assert [t.path for t in board.stories[1].tasks] == ['b/21', 'b/22']
+    assert board.stories[0].owners == ['u1', 'u2']
+    assert board.task_count == 4
+
+
+@pytest.mark.asyncio
+async def test_slots_dataclass_root_to_json():
+    encoded = await Resolver().resolve_to_json(Board(stories=[Story(id=1, name='a')]))
+    assert json.loads(encoded)['stories'][0]['tasks'][1] == {
+        'id': 12, 'owner_id': 2, 'owner': {'id': 2, 'name': 'u2'}, 'path': 'a/12'}
+
+
+def test_dataclass_fields_cache_does_not_keep_class_alive():
+    @dataclass(slots=True)
+    class Temp:
+        id: int
+        users: list[User] = field(default_factory=list)
+
+    @dataclass(slots=True)
+    class TempChild(Temp):
+        name: str = ''
+
+    assert list(get_model_fields(Temp)) == ['id', 'users']
+    assert list(get_model_fields(TempChild)) == ['id', 'users', 'name']
+
+    ref = weakref.ref(Temp)
+    del Temp, TempChild
+    gc.collect()
+    assert ref() is None
@@ -40,3 +40,54 @@ def test_orm():
 
     with pytest.raises(ValidationError):
         conversion.try_parse_data_to_target_field_type(a, 'b', [1,2,3])
+
+
+class Item(BaseModel):
+    id: int
+
+
+class AlwaysItem(BaseModel):
+    model_config = ConfigDict(revalidate_instances='always')
+    id: int
+
+
+class Holder(BaseModel):
+    item: Optional[Item] = None
+    items: list[Item] = []
+    always: Optional[AlwaysItem] = None
+    num: float = 0
+
+
+def test_field_converter_skips_typed_value():
+    item = Item(id=1)
+    converter = conversion.FieldConverter(Holder, 'item')
+    assert converter.convert(item) is item
+    assert converter.convert(None) is None
+    assert converter.convert({'id': 2}) == Item(id=2)
+
+    items = [item]
+    converter = conversion.FieldConverter(Holder, 'items')
+    value = converter.convert(items)
+    assert value == items and value is not items and value[0] is item
+
+
+def test_field_converter_validates_when_needed():
+    always = AlwaysItem(id=1)
+    assert conversion.FieldConverter(Holder, 'always').convert(always) is not always
+
+    value = conversion.FieldConverter(Holder, 'num').convert(1)
+    assert value == 1.0 and type(value) is float
+
+    with pytest.raises(ValidationError):
+        conversion.FieldConverter(Holder, 'items').convert([{'id': 'x'}])
+
+
+def test_field_converter_convert_many():
+    item = Item(id=1)
+    converter = conversion.FieldConverter(Holder, 'items')
+    values = converter.convert_many([[item], [{'id': 2}], [], [{'id': 3}, item]])
+    assert values == [[item], [Item(id=2)], [], [Item(id=3), item]]
+    assert values[0][0] is item
+
+    with pytest.raises(ValidationError):
+        converter.convert_many([[{'id': 2}], [{'id': 'x'}]])